@@ -18,6 +18,7 @@ import numpy as np
 import pandas as pd
 from scipy import stats as scipy_stats
 
+from .chart_renderer import ChartJob, render_charts
 from .supabase_loader import SupabaseLoader
 
 logger = logging.getLogger(__name__)
@@ -53,15 +54,10 @@ class ABTestAnalyzer:
 
     def run(self) -> str:
         """전체 A/B 테스트 분석 파이프라인"""
-        raw_data = self.loader.fetch_ab_test()
-        if not raw_data:
+        df = self.loader.load_frame("ab_test_results")
+        if df.empty:
             return "[A/B 테스트] 데이터가 없습니다. Supabase 연결을 확인해주세요."
 
-        df = pd.DataFrame(raw_data)
-        df["test_date"] = pd.to_datetime(df["test_date"])
-        for col in ["visitors", "conversions", "revenue", "avg_order_value", "bounce_rate"]:
-            df[col] = pd.to_numeric(df[col], errors="coerce").fillna(0)
-
         lines = [
             "🧪 A/B 테스트 분석: 미닉스 자사몰 결제 페이지 개선",
             "※ 시뮬레이션 데이터 기반 | 실무 동일 파이프라인 적용",
@@ -90,8 +86,14 @@ class ABTestAnalyzer:
         lines.extend(interpret_lines)
 
         # 4. 시각화
-        self._plot_conversion_comparison(df)
-        self._plot_daily_trend(df)
+        render_charts(
+            [
+                ChartJob("ab_test_conversion.png", self._plot_conversion_comparison, {"df": df}, "전환율 비교 차트"),
+                ChartJob("ab_test_daily.png", self._plot_daily_trend, {"df": df}, "일별 추이 차트"),
+            ],
+            label="A/B 테스트",
+            output_dir=OUTPUT_DIR,
+        )
         lines.append("[차트] output/ab_test_conversion.png - A/B 전환율 비교 + 신뢰구간")
         lines.append("[차트] output/ab_test_daily.png - 일별 전환율 추이")
 
@@ -294,10 +296,9 @@ class ABTestAnalyzer:
 
         return lines
 
-    def _plot_conversion_comparison(self, df: pd.DataFrame) -> None:
+    @staticmethod
+    def _plot_conversion_comparison(df: pd.DataFrame) -> plt.Figure | None:
         """A/B 전환율 비교 + 신뢰구간 bar chart"""
-        OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-
         control = df[df["variant"] == "control"]
         treatment = df[df["variant"] == "treatment"]
 
@@ -348,15 +349,11 @@ class ABTestAnalyzer:
         ax.set_ylim(0, max(cr_a, cr_b) * 100 * 1.5)
 
         plt.tight_layout()
-        path = OUTPUT_DIR / "ab_test_conversion.png"
-        fig.savefig(path, dpi=150, bbox_inches="tight")
-        plt.close(fig)
-        logger.info(f"[A/B 테스트] 전환율 비교 차트 저장: {path}")
+        return fig
 
-    def _plot_daily_trend(self, df: pd.DataFrame) -> None:
+    @staticmethod
+    def _plot_daily_trend(df: pd.DataFrame) -> plt.Figure | None:
         """일별 전환율 추이 (A vs B)"""
-        OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-
         control = df[df["variant"] == "control"].sort_values("test_date")
         treatment = df[df["variant"] == "treatment"].sort_values("test_date")
 
@@ -390,7 +387,4 @@ class ABTestAnalyzer:
         ax.tick_params(axis="x", rotation=45)
 
         plt.tight_layout()
-        path = OUTPUT_DIR / "ab_test_daily.png"
-        fig.savefig(path, dpi=150, bbox_inches="tight")
-        plt.close(fig)
-        logger.info(f"[A/B 테스트] 일별 추이 차트 저장: {path}")
+        return fig
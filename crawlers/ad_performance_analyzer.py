@@ -14,6 +14,7 @@ import matplotlib.font_manager as fm
 import numpy as np
 import pandas as pd
 
+from .chart_renderer import ChartJob, render_charts
 from .supabase_loader import SupabaseLoader
 
 logger = logging.getLogger(__name__)
@@ -73,16 +74,10 @@ class AdPerformanceAnalyzer:
 
     def run(self, days: int = 30) -> str:
         """전체 광고 퍼포먼스 분석 파이프라인"""
-        raw_data = self.loader.fetch_brand_sales(days=days)
-        if not raw_data:
+        df = self.loader.load_frame("brand_daily_sales", days=days)
+        if df.empty:
             return "[광고 분석] 매출 데이터가 없습니다. Supabase 연결을 확인해주세요."
 
-        df = pd.DataFrame(raw_data)
-        df["sale_date"] = pd.to_datetime(df["sale_date"])
-        for col in ["revenue", "orders", "ad_spend", "roas", "conversion_rate", "visitors"]:
-            if col in df.columns:
-                df[col] = pd.to_numeric(df[col], errors="coerce").fillna(0)
-
         lines = [
             "📈 광고 퍼포먼스 분석",
             "=" * 55,
@@ -102,9 +97,34 @@ class AdPerformanceAnalyzer:
         lines.extend(opportunities)
 
         # 차트 생성
-        self._plot_roas_comparison(efficiency["data"])
-        self._plot_budget_simulation(simulation["data"])
-        self._plot_opportunity_matrix(efficiency["data"])
+        white = {"facecolor": "white"}
+        render_charts(
+            [
+                ChartJob(
+                    "ad_roas_comparison.png",
+                    self._plot_roas_comparison,
+                    {"efficiency_data": efficiency["data"]},
+                    "ROAS 비교 차트",
+                    white,
+                ),
+                ChartJob(
+                    "ad_budget_simulation.png",
+                    self._plot_budget_simulation,
+                    {"sim_data": simulation["data"]},
+                    "예산 재배분 차트",
+                    white,
+                ),
+                ChartJob(
+                    "ad_opportunity_matrix.png",
+                    self._plot_opportunity_matrix,
+                    {"efficiency_data": efficiency["data"]},
+                    "기회 매트릭스 차트",
+                    white,
+                ),
+            ],
+            label="광고 분석",
+            output_dir=OUTPUT_DIR,
+        )
 
         lines.append("")
         lines.append("[차트] output/ad_roas_comparison.png - 브랜드x채널 ROAS 비교")
@@ -318,12 +338,11 @@ class AdPerformanceAnalyzer:
 
     # ========== 차트 1: ROAS 비교 (수평 바) ==========
 
-    def _plot_roas_comparison(self, efficiency_data: list[dict]) -> None:
+    @staticmethod
+    def _plot_roas_comparison(efficiency_data: list[dict]) -> plt.Figure | None:
         """브랜드x채널 ROAS 비교 수평 바 차트"""
-        OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-
         if not efficiency_data:
-            return
+            return None
 
         data = sorted(efficiency_data, key=lambda x: x["roas"])
 
@@ -357,20 +376,16 @@ class AdPerformanceAnalyzer:
         _apply_chart_style(ax)
         plt.tight_layout()
 
-        path = OUTPUT_DIR / "ad_roas_comparison.png"
-        fig.savefig(path, dpi=150, bbox_inches="tight", facecolor="white")
-        plt.close(fig)
-        logger.info(f"[광고 분석] ROAS 비교 차트 저장: {path}")
+        return fig
 
     # ========== 차트 2: 예산 재배분 시뮬레이션 ==========
 
-    def _plot_budget_simulation(self, sim_data: dict) -> None:
+    @staticmethod
+    def _plot_budget_simulation(sim_data: dict) -> plt.Figure | None:
         """현재 vs 최적 예산 배분 Grouped bar + 예상 매출 변화"""
-        OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-
         simulation = sim_data.get("simulation", [])
         if not simulation:
-            return
+            return None
 
         # 상위 8개만 표시 (공간 제약)
         simulation = sorted(simulation, key=lambda x: x["total_ad_spend"], reverse=True)[:8]
@@ -407,19 +422,15 @@ class AdPerformanceAnalyzer:
         _apply_chart_style(ax)
         plt.tight_layout()
 
-        path = OUTPUT_DIR / "ad_budget_simulation.png"
-        fig.savefig(path, dpi=150, bbox_inches="tight", facecolor="white")
-        plt.close(fig)
-        logger.info(f"[광고 분석] 예산 재배분 차트 저장: {path}")
+        return fig
 
     # ========== 차트 3: 기회 매트릭스 (산점도) ==========
 
-    def _plot_opportunity_matrix(self, efficiency_data: list[dict]) -> None:
+    @staticmethod
+    def _plot_opportunity_matrix(efficiency_data: list[dict]) -> plt.Figure | None:
         """ROAS vs 광고비 산점도 (사분면: 스케일업/유지/개선/축소)"""
-        OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-
         if not efficiency_data:
-            return
+            return None
 
         fig, ax = plt.subplots(figsize=(10, 8))
 
@@ -478,7 +489,4 @@ class AdPerformanceAnalyzer:
         _apply_chart_style(ax)
         plt.tight_layout()
 
-        path = OUTPUT_DIR / "ad_opportunity_matrix.png"
-        fig.savefig(path, dpi=150, bbox_inches="tight", facecolor="white")
-        plt.close(fig)
-        logger.info(f"[광고 분석] 기회 매트릭스 차트 저장: {path}")
+        return fig
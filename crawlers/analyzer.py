@@ -14,6 +14,8 @@ import matplotlib.font_manager as fm
 import pandas as pd
 import seaborn as sns
 
+from .chart_renderer import ChartJob, render_charts
+
 logger = logging.getLogger(__name__)
 
 OUTPUT_DIR = Path(__file__).parent.parent / "output"
@@ -38,6 +40,10 @@ COLOR_ATHOME = "#FF6B35"
 COLOR_COMPETITOR = "#4A90D9"
 
 
+def _brand_color(brand: str) -> str:
+    return COLOR_ATHOME if brand in ATHOME_BRANDS else COLOR_COMPETITOR
+
+
 class CompetitorAnalyzer:
     """경쟁사 데이터 분석 및 시각화"""
 
@@ -49,10 +55,39 @@ class CompetitorAnalyzer:
             self.df["ranking"] = pd.to_numeric(self.df["ranking"], errors="coerce")
             self.df["review_count"] = pd.to_numeric(self.df["review_count"], errors="coerce").fillna(0)
             self.df["avg_rating"] = pd.to_numeric(self.df["avg_rating"], errors="coerce")
+        self._delta = None
         OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
-    def _brand_color(self, brand: str) -> str:
-        return COLOR_ATHOME if brand in ATHOME_BRANDS else COLOR_COMPETITOR
+    def delta_frame(self) -> pd.DataFrame:
+        """최근 크롤링일 vs 직전 크롤링일 변동 프레임 (요약/차트 공용, 1회 계산 후 재사용)
+
+        (source, product_name) 키로 한 번 병합해 최근일 상품마다 아래 컬럼을 붙인다.
+        - has_prev: 직전일 데이터 존재 여부
+        - rank_change: 순위 상승폭 (직전 - 최근, 양수 = 상승, 순위 결측 시 0)
+        - price_change / review_growth: 가격 / 리뷰 수 증감
+        날짜가 1개뿐이면 has_prev=False, 변동 컬럼은 0으로 채워 반환한다.
+        """
+        if self._delta is not None:
+            return self._delta
+
+        dates = sorted(self.df["crawl_date"].unique())
+        latest = self.df[self.df["crawl_date"] == dates[-1]]
+        if len(dates) < 2:
+            self._delta = latest.assign(has_prev=False, rank_change=0, price_change=0.0, review_growth=0.0)
+            return self._delta
+
+        prev = self.df.loc[
+            self.df["crawl_date"] == dates[-2], ["source", "product_name", "ranking", "price", "review_count"]
+        ].drop_duplicates(["source", "product_name"])
+        delta = latest.merge(
+            prev, on=["source", "product_name"], how="left", suffixes=("", "_prev"), indicator=True
+        )
+        delta["has_prev"] = delta.pop("_merge") == "both"
+        delta["rank_change"] = (delta["ranking_prev"] - delta["ranking"]).fillna(0)
+        delta["price_change"] = delta["price"] - delta["price_prev"]
+        delta["review_growth"] = delta["review_count"] - delta["review_count_prev"]
+        self._delta = delta
+        return delta
 
     def summary_stats(self) -> str:
         """콘솔 출력용 요약 통계"""
@@ -61,61 +96,48 @@ class CompetitorAnalyzer:
 
         lines = ["=" * 60, "[경쟁사 분석 요약]", "=" * 60]
         dates = sorted(self.df["crawl_date"].unique())
+        delta = self.delta_frame()
 
         if len(dates) >= 2:
-            latest = self.df[self.df["crawl_date"] == dates[-1]]
-            prev = self.df[self.df["crawl_date"] == dates[-2]]
             lines.append(f"\n기간: {dates[-2].strftime('%Y-%m-%d')} → {dates[-1].strftime('%Y-%m-%d')}")
 
-            for source in sorted(latest["source"].unique()):
+            for source, group in delta.groupby("source", sort=True):
                 lines.append(f"\n--- {source.upper()} ---")
-                src_latest = latest[latest["source"] == source]
-                src_prev = prev[prev["source"] == source]
-
-                for _, row in src_latest.iterrows():
-                    name = row["product_name"]
-                    prev_row = src_prev[src_prev["product_name"] == name]
 
-                    rank_str = f"순위: {int(row['ranking'])}" if pd.notna(row["ranking"]) else "순위: -"
-                    price_str = f"가격: {int(row['price']):,}원"
+                for row in group.itertuples(index=False):
+                    rank_str = f"순위: {int(row.ranking)}" if pd.notna(row.ranking) else "순위: -"
+                    price_str = f"가격: {int(row.price):,}원"
+                    is_athome = " *" if row.brand in ATHOME_BRANDS else "  "
+                    lines.append(f"  {is_athome} {row.product_name}")
 
-                    if not prev_row.empty:
-                        prev_r = prev_row.iloc[0]
-                        rank_change = int(prev_r["ranking"] - row["ranking"]) if pd.notna(prev_r["ranking"]) and pd.notna(row["ranking"]) else 0
-                        price_change = int(row["price"] - prev_r["price"])
-                        review_growth = int(row["review_count"] - prev_r["review_count"])
+                    if row.has_prev:
+                        rank_change = int(row.rank_change)
+                        price_change = int(row.price_change)
+                        review_growth = int(row.review_growth)
 
                         rank_arrow = f"(▲{rank_change})" if rank_change > 0 else f"(▼{abs(rank_change)})" if rank_change < 0 else "(→)"
                         price_arrow = f"(+{price_change:,})" if price_change > 0 else f"({price_change:,})" if price_change < 0 else "(→)"
-
-                        is_athome = " *" if row["brand"] in ATHOME_BRANDS else "  "
-                        lines.append(f"  {is_athome} {name}")
                         lines.append(f"     {rank_str} {rank_arrow} | {price_str} {price_arrow} | 리뷰: +{review_growth}")
                     else:
-                        is_athome = " *" if row["brand"] in ATHOME_BRANDS else "  "
-                        lines.append(f"  {is_athome} {name}")
-                        lines.append(f"     {rank_str} | {price_str} | 리뷰: {int(row['review_count'])}")
+                        lines.append(f"     {rank_str} | {price_str} | 리뷰: {int(row.review_count)}")
         else:
-            latest = self.df[self.df["crawl_date"] == dates[-1]]
             lines.append(f"\n날짜: {dates[-1].strftime('%Y-%m-%d')} (비교 데이터 없음)")
-            for _, row in latest.iterrows():
-                lines.append(f"  {row['product_name']}: 순위 {row['ranking']}, {int(row['price']):,}원")
+            for row in delta.itertuples(index=False):
+                lines.append(f"  {row.product_name}: 순위 {row.ranking}, {int(row.price):,}원")
 
         lines.append("\n" + "=" * 60)
         return "\n".join(lines)
 
-    def plot_price_trend(self) -> str | None:
+    @staticmethod
+    def _draw_price_trend(df: pd.DataFrame) -> plt.Figure | None:
         """가격 추이 라인 차트"""
-        if self.df.empty:
-            return None
-
         fig, ax = plt.subplots(figsize=(12, 6))
-        coupang = self.df[self.df["source"] == "coupang"]
+        coupang = df[df["source"] == "coupang"]
 
         for product in coupang["product_name"].unique():
             prod_data = coupang[coupang["product_name"] == product].sort_values("crawl_date")
             brand = prod_data.iloc[0]["brand"]
-            color = self._brand_color(brand)
+            color = _brand_color(brand)
             linewidth = 2.5 if brand in ATHOME_BRANDS else 1.5
             ax.plot(
                 prod_data["crawl_date"],
@@ -135,23 +157,17 @@ class CompetitorAnalyzer:
         ax.grid(True, alpha=0.3)
         plt.tight_layout()
 
-        path = OUTPUT_DIR / "price_trend.png"
-        fig.savefig(path, dpi=150, bbox_inches="tight")
-        plt.close(fig)
-        logger.info(f"[분석] 가격 추이 차트 저장: {path}")
-        return str(path)
+        return fig
 
-    def plot_ranking_comparison(self) -> str | None:
+    @staticmethod
+    def _draw_ranking_comparison(df: pd.DataFrame) -> plt.Figure | None:
         """자사 vs 경쟁사 순위 비교 (수평 바 차트)"""
-        if self.df.empty:
-            return None
-
-        latest_date = self.df["crawl_date"].max()
-        latest = self.df[(self.df["crawl_date"] == latest_date) & (self.df["source"] == "coupang")]
+        latest_date = df["crawl_date"].max()
+        latest = df[(df["crawl_date"] == latest_date) & (df["source"] == "coupang")]
         latest = latest.sort_values("ranking")
 
         fig, ax = plt.subplots(figsize=(10, 6))
-        colors = [self._brand_color(b) for b in latest["brand"]]
+        colors = [_brand_color(b) for b in latest["brand"]]
         bars = ax.barh(
             latest["product_name"],
             latest["ranking"],
@@ -182,30 +198,16 @@ class CompetitorAnalyzer:
         ax.grid(True, axis="x", alpha=0.3)
         plt.tight_layout()
 
-        path = OUTPUT_DIR / "ranking_comparison.png"
-        fig.savefig(path, dpi=150, bbox_inches="tight")
-        plt.close(fig)
-        logger.info(f"[분석] 순위 비교 차트 저장: {path}")
-        return str(path)
+        return fig
 
-    def plot_review_growth(self) -> str | None:
+    @staticmethod
+    def _draw_review_growth(delta: pd.DataFrame) -> plt.Figure | None:
         """주간 리뷰 증가량 (그룹 바 차트)"""
-        if self.df.empty:
-            return None
-
-        dates = sorted(self.df["crawl_date"].unique())
-        if len(dates) < 2:
-            logger.warning("[분석] 리뷰 성장 차트에 최소 2개 날짜 필요")
-            return None
-
-        latest = self.df[(self.df["crawl_date"] == dates[-1]) & (self.df["source"] == "coupang")]
-        prev = self.df[(self.df["crawl_date"] == dates[-2]) & (self.df["source"] == "coupang")]
-        merged = latest.merge(prev[["product_name", "review_count"]], on="product_name", suffixes=("", "_prev"))
-        merged["review_growth"] = merged["review_count"] - merged["review_count_prev"]
+        merged = delta[(delta["source"] == "coupang") & delta["has_prev"]]
         merged = merged.sort_values("review_growth", ascending=False)
 
         fig, ax = plt.subplots(figsize=(10, 6))
-        colors = [self._brand_color(b) for b in merged["brand"]]
+        colors = [_brand_color(b) for b in merged["brand"]]
         bars = ax.bar(range(len(merged)), merged["review_growth"], color=colors)
         ax.set_xticks(range(len(merged)))
         ax.set_xticklabels(merged["product_name"], rotation=45, ha="right", fontsize=8)
@@ -232,20 +234,14 @@ class CompetitorAnalyzer:
         ax.grid(True, axis="y", alpha=0.3)
         plt.tight_layout()
 
-        path = OUTPUT_DIR / "review_growth.png"
-        fig.savefig(path, dpi=150, bbox_inches="tight")
-        plt.close(fig)
-        logger.info(f"[분석] 리뷰 성장 차트 저장: {path}")
-        return str(path)
+        return fig
 
-    def plot_dashboard(self) -> str | None:
+    @staticmethod
+    def _draw_dashboard(df: pd.DataFrame) -> plt.Figure | None:
         """종합 대시보드 (2x2 subplot)"""
-        if self.df.empty:
-            return None
-
-        dates = sorted(self.df["crawl_date"].unique())
+        dates = sorted(df["crawl_date"].unique())
         latest_date = dates[-1]
-        coupang = self.df[self.df["source"] == "coupang"]
+        coupang = df[df["source"] == "coupang"]
         latest_cp = coupang[coupang["crawl_date"] == latest_date].sort_values("ranking")
 
         fig, axes = plt.subplots(2, 2, figsize=(16, 12))
@@ -253,7 +249,7 @@ class CompetitorAnalyzer:
 
         # [0,0] 가격 비교 (바 차트)
         ax = axes[0, 0]
-        colors = [self._brand_color(b) for b in latest_cp["brand"]]
+        colors = [_brand_color(b) for b in latest_cp["brand"]]
         ax.barh(latest_cp["product_name"], latest_cp["price"], color=colors)
         ax.set_title("제품별 가격 비교 (쿠팡)")
         ax.set_xlabel("가격 (원)")
@@ -263,7 +259,7 @@ class CompetitorAnalyzer:
         # [0,1] 순위 분포 (점 그래프)
         ax = axes[0, 1]
         for _, row in latest_cp.iterrows():
-            color = self._brand_color(row["brand"])
+            color = _brand_color(row["brand"])
             size = 150 if row["brand"] in ATHOME_BRANDS else 80
             ax.scatter(row["ranking"], row["category"], s=size, c=color, zorder=5, edgecolors="white")
             ax.annotate(
@@ -279,7 +275,7 @@ class CompetitorAnalyzer:
 
         # [1,0] 리뷰 수 비교
         ax = axes[1, 0]
-        colors = [self._brand_color(b) for b in latest_cp["brand"]]
+        colors = [_brand_color(b) for b in latest_cp["brand"]]
         bars = ax.bar(range(len(latest_cp)), latest_cp["review_count"], color=colors)
         ax.set_xticks(range(len(latest_cp)))
         ax.set_xticklabels(latest_cp["product_name"], rotation=45, ha="right", fontsize=7)
@@ -290,7 +286,7 @@ class CompetitorAnalyzer:
         # [1,1] 평점 비교
         ax = axes[1, 1]
         rated = latest_cp[latest_cp["avg_rating"].notna()]
-        colors = [self._brand_color(b) for b in rated["brand"]]
+        colors = [_brand_color(b) for b in rated["brand"]]
         ax.barh(rated["product_name"], rated["avg_rating"], color=colors)
         ax.set_title("평점 비교")
         ax.set_xlabel("평점")
@@ -299,17 +295,49 @@ class CompetitorAnalyzer:
 
         plt.tight_layout(rect=[0, 0, 1, 0.96])
 
-        path = OUTPUT_DIR / "competitor_dashboard.png"
-        fig.savefig(path, dpi=150, bbox_inches="tight")
-        plt.close(fig)
-        logger.info(f"[분석] 종합 대시보드 저장: {path}")
-        return str(path)
+        return fig
+
+    def chart_jobs(self) -> list[ChartJob]:
+        """전체 차트 작업 목록 (리뷰 성장은 delta_frame을 부모 프로세스에서 계산해 전달)"""
+        if self.df.empty:
+            return []
+
+        jobs = [
+            ChartJob("price_trend.png", self._draw_price_trend, {"df": self.df}, "가격 추이 차트"),
+            ChartJob("ranking_comparison.png", self._draw_ranking_comparison, {"df": self.df}, "순위 비교 차트"),
+        ]
+        if self.df["crawl_date"].nunique() >= 2:
+            jobs.append(ChartJob("review_growth.png", self._draw_review_growth, {"delta": self.delta_frame()}, "리뷰 성장 차트"))
+        else:
+            logger.warning("[분석] 리뷰 성장 차트에 최소 2개 날짜 필요")
+        jobs.append(ChartJob("competitor_dashboard.png", self._draw_dashboard, {"df": self.df}, "종합 대시보드"))
+        return jobs
+
+    def _render(self, filenames: set[str] | None = None) -> list[str]:
+        jobs = [job for job in self.chart_jobs() if filenames is None or job.filename in filenames]
+        results = render_charts(jobs, label="분석", output_dir=OUTPUT_DIR)
+        return [result.path for result in results if result.path]
+
+    def _render_one(self, filename: str) -> str | None:
+        paths = self._render({filename})
+        return paths[0] if paths else None
+
+    def plot_price_trend(self) -> str | None:
+        """가격 추이 라인 차트"""
+        return self._render_one("price_trend.png")
+
+    def plot_ranking_comparison(self) -> str | None:
+        """자사 vs 경쟁사 순위 비교 (수평 바 차트)"""
+        return self._render_one("ranking_comparison.png")
+
+    def plot_review_growth(self) -> str | None:
+        """주간 리뷰 증가량 (그룹 바 차트)"""
+        return self._render_one("review_growth.png")
+
+    def plot_dashboard(self) -> str | None:
+        """종합 대시보드 (2x2 subplot)"""
+        return self._render_one("competitor_dashboard.png")
 
     def generate_all(self) -> list[str]:
-        """모든 차트 생성 후 파일 경로 목록 반환"""
-        paths = []
-        for method in [self.plot_price_trend, self.plot_ranking_comparison, self.plot_review_growth, self.plot_dashboard]:
-            result = method()
-            if result:
-                paths.append(result)
-        return paths
+        """모든 차트를 병렬 렌더링 후 파일 경로 목록 반환"""
+        return self._render()
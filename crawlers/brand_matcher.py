@@ -0,0 +1,111 @@
+"""
+상품명 → 브랜드 식별 - BRAND_MAPPING 별칭을 Aho-Corasick 오토마톤으로 컴파일해 상품명을 한 번만 훑는다
+- 별칭 수와 무관하게 상품명 길이에 비례 (별칭마다 부분 문자열 검사 X)
+- 최장 일치: 더 긴 별칭 안에 포함된 짧은 별칭 매칭은 버림 (예: "LG 프라엘" 안의 "프라엘")
+- 우선순위: 남은 매칭 중 BRAND_MAPPING 선언 순서가 앞선 별칭의 브랜드 (기존 선형 탐색과 같은 규칙)
+- 정규화한 상품명 단위로 결과를 캐시 (같은 상품이 키워드/페이지/소스마다 반복 등장)
+쿠팡 / 네이버 쇼핑 크롤러가 같은 인스턴스를 공유한다.
+"""
+
+import re
+import threading
+import unicodedata
+from collections import deque
+from functools import lru_cache
+
+from .config import BRAND_MAPPING, BRAND_MATCH_CACHE_SIZE
+
+UNKNOWN_BRAND = "기타"
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_title(text: str) -> str:
+    """NFKC(전각/호환 문자) + 대소문자 무시 + 공백 1칸으로 정리"""
+    return _WHITESPACE.sub(" ", unicodedata.normalize("NFKC", text)).strip().casefold()
+
+
+class BrandMatcher:
+    """별칭 → 브랜드 매처 (캐시 포함, 생성 후 읽기 전용이라 스레드 간 공유 가능)"""
+
+    def __init__(self, mapping: dict[str, str] = BRAND_MAPPING, cache_size: int = BRAND_MATCH_CACHE_SIZE):
+        # 별칭 번호 = 선언 순서 (정규화 후 같은 별칭은 먼저 선언된 것만 사용)
+        self.aliases: list[str] = []
+        self.brands: list[str] = []
+        seen = set()
+        for alias, brand in mapping.items():
+            key = normalize_title(alias)
+            if key and key not in seen:
+                seen.add(key)
+                self.aliases.append(key)
+                self.brands.append(brand)
+
+        self._build()
+        self._match = lru_cache(maxsize=cache_size)(self._match_normalized)
+
+    def _build(self) -> None:
+        """트라이(goto) + 실패 링크(fail) + 상태별 출력 별칭 번호(out, 실패 링크 출력 포함)"""
+        self.goto: list[dict[str, int]] = [{}]
+        self.out: list[list[int]] = [[]]
+        for number, alias in enumerate(self.aliases):
+            state = 0
+            for ch in alias:
+                if ch not in self.goto[state]:
+                    self.goto.append({})
+                    self.out.append([])
+                    self.goto[state][ch] = len(self.goto) - 1
+                state = self.goto[state][ch]
+            self.out[state].append(number)
+
+        self.fail = [0] * len(self.goto)
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, child in self.goto[state].items():
+                fallback = self.fail[state]
+                while fallback and ch not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[child] = self.goto[fallback].get(ch, 0)
+                self.out[child] = self.out[child] + self.out[self.fail[child]]
+                queue.append(child)
+
+    def _find(self, title: str) -> list[tuple[int, int, int]]:
+        """제목 안 모든 별칭 출현 (시작, 끝, 별칭 번호)"""
+        found = []
+        state = 0
+        for end, ch in enumerate(title, 1):
+            while state and ch not in self.goto[state]:
+                state = self.fail[state]
+            state = self.goto[state].get(ch, 0)
+            for number in self.out[state]:
+                found.append((end - len(self.aliases[number]), end, number))
+        return found
+
+    def _match_normalized(self, title: str) -> str:
+        found = self._find(title)
+        # 최장 일치: 다른 매칭 구간 안에 들어가는 더 짧은 매칭 제외
+        kept = [
+            number for start, end, number in found
+            if not any(s <= start and end <= e and e - s > end - start for s, e, _ in found)
+        ]
+        return self.brands[min(kept)] if kept else UNKNOWN_BRAND
+
+    def match(self, product_name: str) -> str:
+        """상품명의 브랜드. 어떤 별칭도 없으면 UNKNOWN_BRAND("기타")"""
+        return self._match(normalize_title(product_name))
+
+    def cache_info(self):
+        return self._match.cache_info()
+
+
+_matcher: BrandMatcher | None = None
+_matcher_lock = threading.Lock()
+
+
+def get_brand_matcher() -> BrandMatcher:
+    """config.BRAND_MAPPING 기반 공유 매처 (크롤러 간 캐시 공유)"""
+    global _matcher
+    with _matcher_lock:
+        if _matcher is None:
+            _matcher = BrandMatcher()
+        return _matcher
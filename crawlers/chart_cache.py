@@ -0,0 +1,54 @@
+"""
+차트 이미지 캐시 - 입력 데이터 + 그리기 함수 + 스타일 설정의 내용 해시를 키로 렌더링 결과를 재사용
+데이터가 바뀌지 않은 정기 실행에서는 matplotlib을 거치지 않고 저장된 이미지를 그대로 쓴다.
+용량 초과 시 오래 안 쓴 항목부터 삭제(LRU).
+"""
+
+import hashlib
+import logging
+from collections.abc import Callable
+from pathlib import Path
+
+import matplotlib
+
+from .config import CHART_CACHE_DIR, CHART_CACHE_MAX_BYTES
+from .hashing import module_digest, update_hash
+from .lru_store import LruDirectoryStore
+
+logger = logging.getLogger(__name__)
+
+
+def make_key(draw: Callable, data: dict, options: dict) -> str | None:
+    """차트 캐시 키. 입력을 해시할 수 없으면 None (캐시 사용 안 함)
+
+    키 구성: 그리기 함수(모듈 소스 + 이름) / 입력 데이터 / savefig 옵션 / matplotlib 버전 + rcParams(폰트 등)
+    """
+    h = hashlib.sha256()
+    h.update(f"{draw.__module__}.{draw.__qualname__}:{module_digest(draw.__module__)}".encode())
+    h.update(f"matplotlib {matplotlib.__version__}".encode())
+    h.update(repr(sorted(matplotlib.rcParams.items())).encode())
+    try:
+        update_hash(h, options)
+        update_hash(h, data)
+    except (TypeError, ValueError) as e:
+        logger.debug(f"[차트 캐시] 키 생성 불가 → 캐시 생략: {e}")
+        return None
+    return h.hexdigest()
+
+
+class ChartCache(LruDirectoryStore):
+    """내용 해시 키 → 이미지 bytes 디스크 캐시 (LRU 용량 제한)"""
+
+    def __init__(self, cache_dir: Path | str = CHART_CACHE_DIR, max_bytes: int = CHART_CACHE_MAX_BYTES):
+        super().__init__(cache_dir, max_bytes, suffixes=(".img",), label="차트 캐시")
+
+    def load(self, key: str) -> bytes | None:
+        try:
+            data = self.path(key, ".img").read_bytes()
+            self.mark_used(key)
+        except OSError:
+            return None
+        return data
+
+    def store(self, key: str, data: bytes) -> None:
+        self.write(key, {".img": data})
@@ -0,0 +1,197 @@
+"""
+차트 병렬 렌더링 - 선언형 차트 작업(그리기 함수 + 데이터)을 프로세스 풀에서 렌더링
+각 분석기는 Figure를 만드는 함수만 정의하고, 저장(PNG 파일 또는 bytes)과 시간 측정은 여기서 처리한다.
+입력이 지난 실행과 같은 차트는 내용 해시 캐시(chart_cache)에서 이미지를 꺼내 쓰고 렌더링을 생략한다.
+"""
+
+import io
+import logging
+import os
+import pickle
+import time
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from itertools import repeat
+from pathlib import Path
+
+import matplotlib
+
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+
+from .chart_cache import ChartCache, make_key
+
+logger = logging.getLogger(__name__)
+
+OUTPUT_DIR = Path(__file__).parent.parent / "output"
+
+CHART_DPI = 150
+CHART_WORKERS = os.cpu_count() or 1
+
+# 차트 1개 실패로 처리할 예외 (데이터 형태 문제 / savefig 파일·백엔드 오류) - 나머지 차트와 분석은 계속
+_DRAW_ERRORS = (ValueError, TypeError, KeyError, IndexError, OSError, RuntimeError)
+
+
+@dataclass
+class ChartJob:
+    """차트 1개 렌더링 작업
+
+    draw는 모듈 수준 함수 또는 정적 메서드여야 한다 (워커 프로세스로 pickle 전달).
+    draw(**data)가 None을 반환하면 그릴 데이터가 없는 것으로 보고 건너뛴다.
+    """
+
+    filename: str
+    draw: Callable[..., "plt.Figure | None"]
+    data: dict = field(default_factory=dict)
+    title: str = ""
+    savefig: dict = field(default_factory=dict)
+
+
+@dataclass
+class ChartResult:
+    filename: str
+    title: str = ""
+    path: str | None = None
+    image: bytes | None = None
+    seconds: float = 0.0
+    error: str | None = None
+    cached: bool = False
+
+
+def _savefig_options(job: ChartJob) -> dict:
+    return {"dpi": CHART_DPI, "bbox_inches": "tight", **job.savefig}
+
+
+def _render(job: ChartJob, output_dir: Path, as_bytes: bool) -> ChartResult:
+    """워커에서 실행: Figure 생성 → PNG 저장/직렬화 (예외는 결과로 반환)"""
+    result = ChartResult(job.filename, job.title)
+    started = time.perf_counter()
+    try:
+        fig = job.draw(**job.data)
+        if fig is not None:
+            options = _savefig_options(job)
+            try:
+                if as_bytes:
+                    buf = io.BytesIO()
+                    fig.savefig(buf, format="png", **options)
+                    result.image = buf.getvalue()
+                else:
+                    path = Path(output_dir) / job.filename
+                    fig.savefig(path, **options)
+                    result.path = str(path)
+            finally:
+                plt.close(fig)
+    except _DRAW_ERRORS as e:
+        result.error = f"{type(e).__name__}: {e}"
+    result.seconds = time.perf_counter() - started
+    return result
+
+
+def _from_cache(job: ChartJob, image: bytes, output_dir: Path, as_bytes: bool) -> ChartResult:
+    """캐시 적중: 저장된 이미지를 파일로 쓰거나 bytes로 반환 (matplotlib 미사용)"""
+    result = ChartResult(job.filename, job.title, cached=True)
+    if as_bytes:
+        result.image = image
+    else:
+        path = output_dir / job.filename
+        path.write_bytes(image)
+        result.path = str(path)
+    return result
+
+
+_pool: ProcessPoolExecutor | None = None
+_cache: ChartCache | None = None
+_cache_enabled = True
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    """프로세스 풀은 실행 중 한 번만 만들어 여러 분석기가 재사용"""
+    global _pool
+    if _pool is None:
+        _pool = ProcessPoolExecutor(max_workers=CHART_WORKERS)
+    return _pool
+
+
+def use_chart_cache(enabled: bool) -> None:
+    """차트 캐시 사용 여부 설정 (--no-cache)"""
+    global _cache_enabled
+    _cache_enabled = enabled
+
+
+def _get_cache() -> ChartCache | None:
+    global _cache
+    if not _cache_enabled:
+        return None
+    if _cache is None:
+        _cache = ChartCache()
+    return _cache
+
+
+def _render_all(jobs: list[ChartJob], output_dir: Path, as_bytes: bool, label: str) -> list[ChartResult]:
+    if len(jobs) == 1 or CHART_WORKERS <= 1:
+        return [_render(job, output_dir, as_bytes) for job in jobs]
+    try:
+        return list(_get_pool().map(_render, jobs, repeat(output_dir), repeat(as_bytes)))
+    except (BrokenProcessPool, pickle.PicklingError) as e:
+        logger.warning(f"[{label}] 차트 프로세스 풀 사용 불가 → 순차 렌더링: {e}")
+        return [_render(job, output_dir, as_bytes) for job in jobs]
+
+
+def render_charts(
+    jobs: list[ChartJob],
+    label: str = "차트",
+    output_dir: Path | str = OUTPUT_DIR,
+    as_bytes: bool = False,
+) -> list[ChartResult]:
+    """차트 작업 목록을 병렬 렌더링. 결과는 jobs 순서 유지
+
+    Args:
+        label: 로그 접두어 (예: "인사이트")
+        as_bytes: True면 파일 저장 없이 PNG bytes를 ChartResult.image로 반환
+
+    캐시 키는 부모 프로세스에서 계산하고, 적중하지 않은 작업만 워커로 보낸다.
+    """
+    if not jobs:
+        return []
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    started = time.perf_counter()
+    cache = _get_cache()
+    keys = [make_key(job.draw, job.data, _savefig_options(job)) if cache else None for job in jobs]
+
+    results: list[ChartResult | None] = [None] * len(jobs)
+    pending = []
+    for i, (job, key) in enumerate(zip(jobs, keys)):
+        image = cache.load(key) if key else None
+        if image is not None:
+            results[i] = _from_cache(job, image, output_dir, as_bytes)
+        else:
+            pending.append(i)
+
+    rendered = _render_all([jobs[i] for i in pending], output_dir, as_bytes, label) if pending else []
+    for i, result in zip(pending, rendered):
+        results[i] = result
+        if keys[i] and not result.error and (result.path or result.image is not None):
+            cache.store(keys[i], result.image if as_bytes else Path(result.path).read_bytes())
+
+    for result in results:
+        name = result.title or result.filename
+        if result.error:
+            logger.error(f"[{label}] {name} 렌더링 실패: {result.error}")
+        elif result.cached:
+            logger.info(f"[{label}] {name} 캐시 재사용: {result.path or 'bytes'}")
+        elif result.path:
+            logger.info(f"[{label}] {name} 저장: {result.path} ({result.seconds:.2f}초)")
+        elif result.image is not None:
+            logger.info(f"[{label}] {name} 렌더링 ({result.seconds:.2f}초)")
+
+    total = sum(r.seconds for r in results)
+    hits = len(jobs) - len(pending)
+    logger.info(
+        f"[{label}] 차트 {len(results)}개 렌더링 완료 (캐시 {hits}개) - "
+        f"차트 합계 {total:.1f}초, 경과 {time.perf_counter() - started:.1f}초"
+    )
+    return results
@@ -3,6 +3,8 @@
 카테고리: 음식물처리기, 식기세척기, 소형건조기, 뷰티디바이스
 """
 
+from pathlib import Path
+
 CRAWL_TARGETS = {
     "coupang": [
         {
@@ -65,14 +67,106 @@ BRAND_MAPPING = {
     "삼성": "삼성",
 }
 
+# 브랜드 식별 결과 캐시 크기 (정규화한 상품명 단위, brand_matcher)
+BRAND_MATCH_CACHE_SIZE = 65536
+
 # 검색 결과에서 추출할 최대 상품 수
 MAX_RESULTS_PER_KEYWORD = 10
 
-# 요청 간 딜레이 (초) - rate limiting 방지
-REQUEST_DELAY_MIN = 2.0
-REQUEST_DELAY_MAX = 4.0
+# 딥 랭킹 모드 (--depth N): 페이지당 상품 수 / 키워드당 페이지 동시 요청 수
+COUPANG_PAGE_SIZE = 72  # 쿠팡 listSize 파라미터 (36/48/60/72)
+NAVER_PAGE_SIZE = 100  # 네이버 쇼핑 API display 최대값
+NAVER_MAX_START = 1000  # 네이버 쇼핑 API start 최대값
+DEEP_RANK_PAGE_WORKERS = 4
+
+# 크롤러 HTTP 응답 캐시 (--no-cache로 비활성화) - 같은 크롤링 날짜 안에서만 재사용
+HTTP_CACHE_DIR = Path(__file__).parent.parent / "output" / "http_cache"
+HTTP_CACHE_TTL = 24 * 3600  # 초
+HTTP_CACHE_MAX_BYTES = 200 * 1024 * 1024
+
+# 분석용 로컬 스냅샷 저장소 (--snapshot) - 테이블별 월 파티션 Parquet
+SNAPSHOT_DIR = Path(__file__).parent.parent / "output" / "snapshots"
+SNAPSHOT_OVERLAP_DAYS = 7  # updated_at 없는 테이블: 마지막 날짜 기준 재조회 구간 (upsert 갱신분 반영)
+
+# 차트 이미지 캐시 (--no-cache로 비활성화) - 입력 데이터/그리기 코드/스타일이 같으면 렌더링 생략
+CHART_CACHE_DIR = Path(__file__).parent.parent / "output" / "chart_cache"
+CHART_CACHE_MAX_BYTES = 100 * 1024 * 1024
+
+# 매출 예측 모델 레지스트리 (--retrain으로 강제 전체 재학습)
+# 학습 데이터가 같으면 저장 모델 재사용, 새 날짜가 추가되면 warm start로 트리만 추가.
+# 전체 재학습 조건: 마지막 전체 학습 후 MODEL_RETRAIN_DAYS일 경과 / 트리 수 MODEL_MAX_TREES 초과 /
+# 새 날짜에서의 MAPE가 전체 학습 당시 테스트 MAPE의 MODEL_DRIFT_RATIO배 초과(드리프트)
+MODEL_REGISTRY_DIR = Path(__file__).parent.parent / "output" / "models"
+MODEL_WARM_START_TREES = 20
+MODEL_MAX_TREES = 300
+MODEL_RETRAIN_DAYS = 7
+MODEL_DRIFT_RATIO = 1.5
+
+# 매출 예측 feature - lag(일) / rolling mean·std·EWM 윈도우(일) / 증분 계산 캐시 (--no-cache로 비활성화)
+FEATURE_LAGS = (1, 7)
+FEATURE_WINDOWS = (7, 14, 28)
+FEATURE_CACHE_PATH = Path(__file__).parent.parent / "output" / "feature_cache" / "demand_features.pkl"
+
+# 매출 예측 시계열 백테스트 - 날짜 기준 fold 수 / fold당 검증 일수 / "expanding"(누적) | "rolling"(최근 N일 학습)
+# / rolling 학습 구간(일) / 병렬 워커 수(-1: 전체 코어)
+BACKTEST_SPLITS = 5
+BACKTEST_TEST_DAYS = 7
+BACKTEST_MODE = "expanding"
+BACKTEST_WINDOW_DAYS = 28
+BACKTEST_WORKERS = -1
+
+# 쿠팡 HTML 파서 백엔드: "auto" (lxml 우선, 없으면 bs4) | "lxml" | "bs4"
+HTML_PARSER_BACKEND = "auto"
+
+# 동시 크롤링 모드 (--concurrent) - 소스(호스트)별 동시 요청 수
+HOST_CONCURRENCY = {
+    "coupang": 4,
+    "naver": 8,
+}
+
+# 호스트별 적응형 속도 제어 (AIMD) - 초당 요청 수 시작값/하한/상한, 버스트, 목표 응답 지연(초)
+RATE_LIMITS = {
+    "coupang": {"initial": 0.33, "min_rate": 0.1, "max_rate": 2.0, "burst": 2, "latency_target": 3.0},
+    "naver": {"initial": 5.0, "min_rate": 1.0, "max_rate": 10.0, "burst": 5, "latency_target": 1.0},
+    "naver_datalab": {"initial": 2.0, "min_rate": 0.5, "max_rate": 5.0, "burst": 2, "latency_target": 2.0},
+    "google_trends": {"initial": 0.5, "min_rate": 0.05, "max_rate": 1.0, "burst": 1, "latency_target": 5.0},
+}
+
+# RATE_LIMITS에 없는 호스트 / 누락 항목 기본값
+RATE_LIMIT_DEFAULTS = {
+    "initial": 0.5,
+    "min_rate": 0.1,
+    "max_rate": 2.0,
+    "burst": 1,
+    "latency_target": 2.0,
+}
+
+# 트렌드-매출 선행 분석 lag 범위 (±일) - FFT 교차상관이라 넓혀도 비용이 거의 같음 (예: 60)
+LEAD_LAG_MAX_DAYS = 7
+
+# 성수기 탐지 - 기준 분위수 / 연속 기간으로 묶을 최대 갭(일) / 누적 이력 스트리밍 탐지 상태 파일
+PEAK_QUANTILE = 0.75
+PEAK_GAP_DAYS = 2
+PEAK_STATE_PATH = Path(__file__).parent.parent / "output" / "peak_state.json"
+
+# 검색 트렌드 증분 수집 - (소스, 키워드)별 워터마크 파일 / 첫 수집 기간(일) / 직전 구간과 겹쳐 받을 앵커 일수
+# (상대 지수 척도 보정용) / 재적재할 최소 값 변화 (--trend-full: 워터마크 무시하고 전체 재수집)
+TREND_WATERMARK_PATH = Path(__file__).parent.parent / "output" / "trend_watermarks.json"
+TREND_LOOKBACK_DAYS = 30
+TREND_ANCHOR_DAYS = 7
+TREND_CHANGE_TOLERANCE = 0.5
+
+# 검색 트렌드 요청 묶음 한도 - DataLab: 요청당 키워드 그룹 / 그룹당 검색어,
+# Google Trends: 요청당 검색어(앵커 포함) / 일별 값이 나오는 최대 기간(일, 넘으면 주별로 내려옴)
+DATALAB_GROUPS_PER_REQUEST = 5
+DATALAB_KEYWORDS_PER_GROUP = 20
+TRENDS_KEYWORDS_PER_REQUEST = 5
+TRENDS_MAX_DAYS = 269
+# Google Trends 배치 간 척도를 맞출 공통 앵커 검색어 (모든 배치에 포함, None이면 사용 안 함)
+TRENDS_ANCHOR_KEYWORD = "에어프라이어"
 
-# 검색 트렌드 키워드 (브랜드별 제품군 → 검색어)
+# 검색 트렌드 키워드 (브랜드별 제품군 → 검색어 또는 [대표 검색어, 동의어...])
+# 대표 검색어로 적재/Google Trends 요청, DataLab은 목록 전체를 한 키워드 그룹으로 요청
 TREND_KEYWORDS = {
     "minix": {
         "미니건조기": "미니건조기",
@@ -1,18 +1,27 @@
 """
-쿠팡 검색 결과 크롤러 - requests + BeautifulSoup4
+쿠팡 검색 결과 크롤러 - requests + lxml (BeautifulSoup4 fallback)
 검색 키워드별 상위 상품의 가격/순위/리뷰 수집
 """
 
 import logging
 import random
-import time
 from datetime import date
 from urllib.parse import quote
 
 import requests
-from bs4 import BeautifulSoup
-
-from .config import BRAND_MAPPING, MAX_RESULTS_PER_KEYWORD, REQUEST_DELAY_MAX, REQUEST_DELAY_MIN
+from requests.adapters import HTTPAdapter
+
+from .brand_matcher import get_brand_matcher
+from .config import (
+    COUPANG_PAGE_SIZE,
+    DEEP_RANK_PAGE_WORKERS,
+    HTML_PARSER_BACKEND,
+    MAX_RESULTS_PER_KEYWORD,
+)
+from .deep_rank import fetch_pages, page_offsets, stitch_ranked
+from .html_parser import extract_products
+from .http_cache import HttpCache, cached_get
+from .rate_limiter import get_rate_limiter
 
 logger = logging.getLogger(__name__)
 
@@ -30,9 +39,14 @@ MAX_RETRIES = 3
 class CoupangCrawler:
     """쿠팡 검색 결과 스크래핑 크롤러"""
 
-    def __init__(self):
+    def __init__(self, parser_backend: str = HTML_PARSER_BACKEND, use_cache: bool = True):
         self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(pool_maxsize=DEEP_RANK_PAGE_WORKERS))
+        self.parser_backend = parser_backend
         self.base_url = "https://www.coupang.com/np/search"
+        self.rate_limiter = get_rate_limiter("coupang")
+        self.brand_matcher = get_brand_matcher()
+        self.cache = HttpCache() if use_cache else None
 
     def _get_headers(self) -> dict:
         return {
@@ -46,9 +60,14 @@ class CoupangCrawler:
     def _request(self, url: str) -> requests.Response | None:
         for attempt in range(1, MAX_RETRIES + 1):
             try:
-                delay = random.uniform(REQUEST_DELAY_MIN, REQUEST_DELAY_MAX)
-                time.sleep(delay)
-                response = self.session.get(url, headers=self._get_headers(), timeout=15)
+                response = cached_get(
+                    self.session,
+                    url,
+                    headers=self._get_headers(),
+                    timeout=15,
+                    rate_limiter=self.rate_limiter,
+                    cache=self.cache,
+                )
                 response.raise_for_status()
                 return response
             except requests.RequestException as e:
@@ -59,34 +78,26 @@ class CoupangCrawler:
         return None
 
     def _identify_brand(self, product_name: str) -> str:
-        for keyword, brand in BRAND_MAPPING.items():
-            if keyword in product_name:
-                return brand
-        return "기타"
+        return self.brand_matcher.match(product_name)
 
-    def _parse_results(self, html: str, category: str) -> list[dict]:
-        soup = BeautifulSoup(html, "html.parser")
-        items = soup.select("li.search-product")
-        if not items:
-            items = soup.select("li[class*='search-product']")
+    def _parse_results(
+        self, html: str, category: str, limit: int = MAX_RESULTS_PER_KEYWORD, offset: int = 0
+    ) -> list[dict]:
+        items = extract_products(html, limit, backend=self.parser_backend)
 
         results = []
         today = date.today().isoformat()
 
-        for rank, item in enumerate(items[:MAX_RESULTS_PER_KEYWORD], start=1):
+        for rank, item in enumerate(items, start=offset + 1):
             try:
-                name_tag = item.select_one("div.name, a.search-product-link div.name")
-                name = name_tag.get_text(strip=True) if name_tag else None
+                name = item["name"]
 
-                price_tag = item.select_one("strong.price-value, em.sale strong")
-                price_text = price_tag.get_text(strip=True) if price_tag else "0"
+                price_text = item["price"] if item["price"] is not None else "0"
                 price = int(price_text.replace(",", "").replace("원", "") or "0")
 
-                rating_tag = item.select_one("em.rating")
-                rating = float(rating_tag.get_text(strip=True)) if rating_tag else None
+                rating = float(item["rating"]) if item["rating"] is not None else None
 
-                review_tag = item.select_one("span.rating-total-count, span.count")
-                review_text = review_tag.get_text(strip=True) if review_tag else "(0)"
+                review_text = item["review"] if item["review"] is not None else "(0)"
                 review_count = int(review_text.strip("()").replace(",", "") or "0")
 
                 if not name:
@@ -109,25 +120,40 @@ class CoupangCrawler:
 
         return results
 
-    def search(self, keyword: str, category: str) -> list[dict]:
-        """키워드로 쿠팡 검색 후 상위 상품 정보 반환"""
+    def search(self, keyword: str, category: str, depth: int | None = None) -> list[dict]:
+        """키워드로 쿠팡 검색 후 상위 상품 정보 반환
+
+        depth가 MAX_RESULTS_PER_KEYWORD보다 크면 page 파라미터로 여러 페이지를 병렬 조회해
+        depth위까지 순위를 이어붙인다 (딥 랭킹 모드).
+        """
         encoded = quote(keyword)
         url = f"{self.base_url}?q={encoded}&sorter=scoreDesc"
         logger.info(f"[쿠팡] 크롤링: '{keyword}' (카테고리: {category})")
 
-        response = self._request(url)
-        if not response:
-            return []
+        if depth is None or depth <= MAX_RESULTS_PER_KEYWORD:
+            response = self._request(url)
+            if not response:
+                return []
+            results = self._parse_results(response.text, category)
+        else:
+            def fetch_page(offset: int) -> list[dict]:
+                page = offset // COUPANG_PAGE_SIZE + 1
+                response = self._request(f"{url}&page={page}&listSize={COUPANG_PAGE_SIZE}")
+                if not response:
+                    return []
+                return self._parse_results(response.text, category, limit=COUPANG_PAGE_SIZE, offset=offset)
+
+            pages = fetch_pages(fetch_page, page_offsets(depth, COUPANG_PAGE_SIZE))
+            results = stitch_ranked(pages, depth)
 
-        results = self._parse_results(response.text, category)
         logger.info(f"[쿠팡] '{keyword}' → {len(results)}개 상품 수집")
         return results
 
-    def crawl_all(self, targets: list[dict]) -> list[dict]:
+    def crawl_all(self, targets: list[dict], depth: int | None = None) -> list[dict]:
         """설정된 모든 타겟에 대해 크롤링 실행"""
         all_results = []
         for target in targets:
-            results = self.search(target["keyword"], target["category"])
+            results = self.search(target["keyword"], target["category"], depth=depth)
             all_results.extend(results)
         logger.info(f"[쿠팡] 전체 수집 완료: {len(all_results)}개 상품")
         return all_results
@@ -5,8 +5,9 @@ Supabase 데이터 조회 -> matplotlib 차트 base64 인라인 -> 단일 HTML 
 """
 
 import base64
-import io
+import json
 import logging
+import os
 from datetime import datetime
 from pathlib import Path
 
@@ -18,11 +19,28 @@ import numpy as np
 import pandas as pd
 from scipy import stats
 
+from . import chart_cache, chart_renderer, peak_detector, svg_charts, trend_stats
+from .chart_renderer import ChartJob, render_charts
+from .config import LEAD_LAG_MAX_DAYS, PEAK_GAP_DAYS, PEAK_QUANTILE
+from .hashing import content_hash, module_digest
+from .peak_detector import daily_trend_avg, peak_periods
 from .supabase_loader import SupabaseLoader
+from .trend_stats import lead_lag_by_brand, trend_sales_correlation
 
 logger = logging.getLogger(__name__)
 
 OUTPUT_DIR = Path(__file__).parent.parent / "output"
+# 증분 빌드용 섹션 HTML 조각 (섹션별 입력 지문 + HTML)
+SECTION_CACHE_PATH = OUTPUT_DIR / "dashboard_cache" / "sections.json"
+# 섹션 HTML을 만드는 코드 - 이 중 하나라도 바뀌면 저장된 조각 전체 무효
+SECTION_MODULES = (
+    __name__,
+    svg_charts.__name__,
+    chart_renderer.__name__,
+    chart_cache.__name__,
+    trend_stats.__name__,
+    peak_detector.__name__,
+)
 
 BRAND_LABELS = {"minix": "미닉스", "thome": "톰", "protione": "프로티원"}
 BRAND_COLORS = {"minix": "#FF6B35", "thome": "#4A90D9", "protione": "#7ED321"}
@@ -45,6 +63,8 @@ CHANNEL_ORDER = ["coupang", "own_mall", "naver", "gs_home", "oliveyoung"]
 
 WEEKDAY_KR = ["월", "화", "수", "목", "금", "토", "일"]
 
+SOURCE_LABELS = {"google_trends": "Google Trends", "naver_datalab": "Naver DataLab"}
+
 # Slate palette for matplotlib charts
 _SLATE = {
     "bg": "#ffffff",
@@ -82,20 +102,29 @@ def _apply_chart_style(ax):
     ax.set_axisbelow(True)
 
 
-def _fig_to_base64(fig: plt.Figure) -> str:
-    """matplotlib Figure -> base64 PNG string"""
-    buf = io.BytesIO()
-    fig.savefig(buf, format="png", dpi=150, bbox_inches="tight", facecolor="white", edgecolor="none")
-    plt.close(fig)
-    buf.seek(0)
-    return base64.b64encode(buf.read()).decode("utf-8")
+_SAVEFIG = {"facecolor": "white", "edgecolor": "none"}
 
 
 class DashboardGenerator:
     """KPI 통합 대시보드 HTML 생성기"""
 
-    def __init__(self):
+    def __init__(self, incremental: bool = True, chart_format: str = "png"):
+        """
+        Args:
+            incremental: 입력이 지난 실행과 같은 섹션은 저장된 HTML 조각 재사용
+            chart_format: "png" (matplotlib base64 인라인) | "svg" (인라인 벡터 SVG, 렌더링 없음)
+        """
         self.loader = SupabaseLoader()
+        self.incremental = incremental
+        self.chart_format = chart_format
+        # PNG 그리기 함수 → 같은 인자를 받는 인라인 SVG 빌더 (chart_format="svg")
+        self.svg_builders = {
+            self._draw_correlation_heatmap: self._svg_correlation_heatmap,
+            self._draw_lead_lag: self._svg_lead_lag,
+            self._draw_peak_season: self._svg_peak_season,
+            self._draw_channel_mix: self._svg_channel_mix,
+            self._draw_weekday_heatmap: self._svg_weekday_heatmap,
+        }
 
     def run(self) -> str:
         """대시보드 생성 파이프라인"""
@@ -105,40 +134,29 @@ class DashboardGenerator:
         yesterday = self.loader.call_rpc("get_brand_kpis_yesterday")
         last_week = self.loader.call_rpc("get_brand_kpis_last_week")
         top_products = self.loader.call_rpc("get_top_products")
-        sales_data = self.loader.fetch_brand_sales(days=30)
-        trend_data = self.loader.fetch_search_trends(days=30)
-
-        # 2. DataFrame 변환
-        df_sales = pd.DataFrame(sales_data) if sales_data else pd.DataFrame()
-        if not df_sales.empty:
-            df_sales["sale_date"] = pd.to_datetime(df_sales["sale_date"])
-            df_sales["revenue"] = pd.to_numeric(df_sales["revenue"], errors="coerce").fillna(0)
-            df_sales["orders"] = pd.to_numeric(df_sales["orders"], errors="coerce").fillna(0)
-            df_sales["ad_spend"] = pd.to_numeric(df_sales.get("ad_spend", 0), errors="coerce").fillna(0)
-
-        df_trend = pd.DataFrame(trend_data) if trend_data else pd.DataFrame()
-        if not df_trend.empty:
-            df_trend["trend_date"] = pd.to_datetime(df_trend["trend_date"])
-            df_trend["trend_value"] = pd.to_numeric(df_trend["trend_value"], errors="coerce").fillna(0)
+        # 2. DataFrame 조회 (타입 변환은 로더 캐시에서 1회)
+        df_sales = self.loader.load_frame("brand_daily_sales", days=30)
+        df_trend = self.loader.load_frame("search_trends", days=30)
 
         # yesterday가 비어있으면 last_week 데이터로 대체 (샘플 데이터 대응)
         kpi_source = yesterday if yesterday else last_week
         kpi_compare = last_week if yesterday else []
 
-        # 3. 섹션별 HTML 생성
-        header_html = self._build_header(kpi_source, kpi_compare)
-        kpi_cards_html = self._build_kpi_cards(kpi_source, kpi_compare, df_sales)
-        trend_html = self._build_trend_section(df_trend, df_sales)
-        channel_html = self._build_channel_section(df_sales)
-        ad_perf_html = self._build_ad_performance_section(df_sales)
-        products_html = self._build_products_table(top_products)
-        actions_html = self._build_actions(df_sales, df_trend)
+        # 3. 섹션별 HTML 생성 (증분 모드: 입력이 지난 실행과 같은 섹션은 저장된 조각 재사용)
+        # (섹션 이름, 빌더, 빌더 인자, 빌더 인자 외 결과에 영향을 주는 값)
+        today_str = datetime.now().strftime("%Y-%m-%d")
+        sections = self._build_sections([
+            ("header", self._build_header, (kpi_source, kpi_compare), today_str),
+            ("kpi_cards", self._build_kpi_cards, (kpi_source, kpi_compare, df_sales), None),
+            ("trend", self._build_trend_section, (df_trend, df_sales), None),
+            ("channel", self._build_channel_section, (df_sales,), None),
+            ("ad_perf", self._build_ad_performance_section, (df_sales,), None),
+            ("products", self._build_products_table, (top_products,), None),
+            ("actions", self._build_actions, (df_sales, df_trend), None),
+        ])
 
         # 4. HTML 조립
-        html = self._assemble_html(
-            header_html, kpi_cards_html, trend_html,
-            channel_html, ad_perf_html, products_html, actions_html,
-        )
+        html = self._assemble_html(*sections)
 
         # 5. 저장
         OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
@@ -148,6 +166,74 @@ class DashboardGenerator:
 
         return f"[대시보드] 생성 완료: {output_path}"
 
+    def _build_sections(self, specs: list[tuple]) -> list[str]:
+        """섹션 입력 지문(내용 해시)이 저장된 조각과 같으면 재사용, 다르면 다시 생성"""
+        cache = self._load_section_cache() if self.incremental else {}
+        code_version = [
+            [module_digest(module) for module in SECTION_MODULES],
+            [LEAD_LAG_MAX_DAYS, PEAK_QUANTILE, PEAK_GAP_DAYS],
+        ]
+
+        fragments, rebuilt = [], []
+        for name, builder, args, extra in specs:
+            try:
+                fingerprint = content_hash([code_version, self.chart_format, name, list(args), extra])
+            except TypeError:
+                fingerprint = None
+            entry = cache.get(name)
+            if fingerprint and entry and entry.get("fingerprint") == fingerprint:
+                fragments.append(entry["html"])
+                continue
+            html = builder(*args)
+            fragments.append(html)
+            rebuilt.append(name)
+            cache[name] = {"fingerprint": fingerprint, "html": html}
+
+        if self.incremental:
+            logger.info(
+                f"[대시보드] 섹션 재생성 {len(rebuilt)}개 {rebuilt}, 재사용 {len(specs) - len(rebuilt)}개"
+            )
+            if rebuilt:
+                self._save_section_cache(cache)
+        return fragments
+
+    def _chart_html(self, *jobs: ChartJob | None) -> list[str | None]:
+        """차트 작업 -> HTML 요소 (None 작업/그릴 데이터 없음은 None)
+
+        png: render_charts로 PNG를 만들어 base64 <img> 인라인 (입력이 같으면 차트 캐시 재사용)
+        svg: svg_builders에 등록된 같은 인자의 SVG 빌더로 인라인 SVG 생성 (미등록 차트는 생성 전에 ValueError)
+        """
+        if self.chart_format == "svg":
+            missing = [job.filename for job in jobs if job is not None and job.draw not in self.svg_builders]
+            if missing:
+                raise ValueError(f"SVG 빌더가 등록되지 않은 차트: {missing}")
+            return [self.svg_builders[job.draw](**job.data) if job is not None else None for job in jobs]
+
+        results = iter(render_charts([job for job in jobs if job is not None], label="대시보드", as_bytes=True))
+        images = []
+        for job in jobs:
+            image = next(results).image if job is not None else None
+            if image is None:
+                images.append(None)
+                continue
+            b64 = base64.b64encode(image).decode("utf-8")
+            images.append(f'<img src="data:image/png;base64,{b64}" class="chart-img" alt="{job.title}">')
+        return images
+
+    @staticmethod
+    def _load_section_cache() -> dict:
+        try:
+            return json.loads(SECTION_CACHE_PATH.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+
+    @staticmethod
+    def _save_section_cache(cache: dict) -> None:
+        SECTION_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp = SECTION_CACHE_PATH.with_suffix(".tmp")
+        tmp.write_text(json.dumps(cache, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp, SECTION_CACHE_PATH)
+
     # ==================== 섹션 1: 스티키 헤더 ====================
 
     def _build_header(self, kpi_source: list[dict], kpi_compare: list[dict]) -> str:
@@ -328,24 +414,20 @@ class DashboardGenerator:
             return '<div class="card"><div class="card-header"><h3>검색 트렌드 상관 분석</h3></div><p class="no-data">트렌드 데이터가 없습니다.</p></div>'
 
         # 메인 차트: 상관 히트맵
-        heatmap_b64 = self._chart_correlation_heatmap(df_trend, df_sales)
+        heatmap_job = self._chart_correlation_heatmap(df_trend, df_sales)
 
         # 선행 지표
-        lead_b64, lead_results = self._chart_lead_lag(df_trend, df_sales)
+        lead_job, lead_results = self._chart_lead_lag(df_trend, df_sales)
 
         # 성수기
-        peak_b64, peak_results = self._chart_peak_season(df_trend)
+        peak_job, peak_results = self._chart_peak_season(df_trend)
+
+        charts = self._chart_html(heatmap_job, lead_job, peak_job)
 
         # 신호 해석 사이드바
         signals = self._build_signal_cards(df_trend, df_sales, lead_results, peak_results)
 
-        chart_parts = []
-        if heatmap_b64:
-            chart_parts.append(f'<img src="data:image/png;base64,{heatmap_b64}" class="chart-img" alt="상관 히트맵">')
-        if lead_b64:
-            chart_parts.append(f'<img src="data:image/png;base64,{lead_b64}" class="chart-img" alt="선행 지표">')
-        if peak_b64:
-            chart_parts.append(f'<img src="data:image/png;base64,{peak_b64}" class="chart-img" alt="성수기 탐지">')
+        chart_parts = [chart for chart in charts if chart]
 
         chart_content = "\n".join(chart_parts) if chart_parts else '<p class="no-data">분석 가능한 데이터 부족</p>'
 
@@ -430,37 +512,31 @@ class DashboardGenerator:
         </div>
         """
 
-    def _chart_correlation_heatmap(self, df_trend, df_sales) -> str | None:
+    def _chart_correlation_heatmap(self, df_trend, df_sales) -> ChartJob | None:
         if df_sales.empty:
             return None
 
-        daily_sales = df_sales.groupby(["sale_date", "brand"])["revenue"].sum().reset_index()
-        daily_trend = df_trend.groupby(["trend_date", "brand", "source"])["trend_value"].mean().reset_index()
-
         brands = sorted(df_trend["brand"].unique())
         sources = sorted(df_trend["source"].unique())
-        data = np.full((len(brands), len(sources)), np.nan)
-
-        for i, brand in enumerate(brands):
-            b_sales = daily_sales[daily_sales["brand"] == brand].set_index("sale_date")["revenue"]
-            for j, source in enumerate(sources):
-                b_trend = daily_trend[
-                    (daily_trend["brand"] == brand) & (daily_trend["source"] == source)
-                ].set_index("trend_date")["trend_value"]
-                common = b_sales.index.intersection(b_trend.index)
-                if len(common) >= 3:
-                    r, _ = stats.pearsonr(b_trend.loc[common].values, b_sales.loc[common].values)
-                    data[i, j] = r
+        corr = trend_sales_correlation(df_trend, df_sales)
+        if corr.empty:
+            return None
+        data = corr["pearson_r"].unstack("source").reindex(index=brands, columns=sources).to_numpy(dtype=float)
 
         if np.all(np.isnan(data)):
             return None
+        return ChartJob(
+            "dashboard_correlation_heatmap.png", self._draw_correlation_heatmap,
+            {"data": data, "brands": brands, "sources": sources}, "상관 히트맵", _SAVEFIG,
+        )
 
+    @staticmethod
+    def _draw_correlation_heatmap(data: np.ndarray, brands: list, sources: list) -> plt.Figure:
         fig, ax = plt.subplots(figsize=(7, 3.5))
         im = ax.imshow(data, cmap="RdYlGn", aspect="auto", vmin=-1, vmax=1)
 
-        source_labels = {"google_trends": "Google Trends", "naver_datalab": "Naver DataLab"}
         ax.set_xticks(range(len(sources)))
-        ax.set_xticklabels([source_labels.get(s, s) for s in sources], fontsize=10)
+        ax.set_xticklabels([SOURCE_LABELS.get(s, s) for s in sources], fontsize=10)
         ax.set_yticks(range(len(brands)))
         ax.set_yticklabels([BRAND_LABELS.get(b, b) for b in brands], fontsize=10)
         ax.spines[:].set_visible(False)
@@ -477,41 +553,27 @@ class DashboardGenerator:
         cbar = fig.colorbar(im, ax=ax, shrink=0.8, aspect=20)
         cbar.outline.set_visible(False)
         plt.tight_layout()
-        return _fig_to_base64(fig)
+        return fig
 
-    def _chart_lead_lag(self, df_trend, df_sales) -> tuple[str | None, dict]:
-        results = {}
-        if df_sales.empty:
-            return None, results
-
-        daily_sales = df_sales.groupby(["sale_date", "brand"])["revenue"].sum().reset_index()
-        daily_trend = df_trend.groupby(["trend_date", "brand"])["trend_value"].mean().reset_index()
+    @staticmethod
+    def _svg_correlation_heatmap(data: np.ndarray, brands: list, sources: list) -> str:
+        return svg_charts.heatmap(
+            data, [BRAND_LABELS.get(b, b) for b in brands], [SOURCE_LABELS.get(s, s) for s in sources],
+            cmap="RdYlGn", fmt="{:.3f}", light=np.abs(np.nan_to_num(data)) > 0.5,
+            title="트렌드-매출 상관계수 (Pearson r)", vmin=-1, vmax=1,
+        )
 
-        for brand in sorted(df_trend["brand"].unique()):
-            b_sales = daily_sales[daily_sales["brand"] == brand].sort_values("sale_date")
-            b_trend = daily_trend[daily_trend["brand"] == brand].sort_values("trend_date")
-            if len(b_sales) < 5 or len(b_trend) < 5:
-                continue
-            sales_ts = b_sales.set_index("sale_date")["revenue"]
-            trend_ts = b_trend.set_index("trend_date")["trend_value"]
-            lag_corrs = {}
-            best_lag, best_corr = 0, -1
-            for lag in range(-7, 8):
-                shifted = trend_ts.copy()
-                shifted.index = shifted.index + pd.Timedelta(days=lag)
-                common = sales_ts.index.intersection(shifted.index)
-                if len(common) < 3:
-                    continue
-                r, _ = stats.pearsonr(shifted.loc[common].values, sales_ts.loc[common].values)
-                lag_corrs[lag] = r
-                if abs(r) > abs(best_corr):
-                    best_corr = r
-                    best_lag = lag
-            results[brand] = {"best_lag": best_lag, "best_corr": best_corr, "lags": lag_corrs}
+    def _chart_lead_lag(self, df_trend, df_sales) -> tuple[ChartJob | None, dict]:
+        if df_sales.empty:
+            return None, {}
 
+        results = lead_lag_by_brand(df_trend, df_sales, LEAD_LAG_MAX_DAYS)
         if not results:
             return None, results
+        return ChartJob("dashboard_lead_lag.png", self._draw_lead_lag, {"results": results}, "선행 지표", _SAVEFIG), results
 
+    @staticmethod
+    def _draw_lead_lag(results: dict) -> plt.Figure:
         n = len(results)
         fig, axes = plt.subplots(1, n, figsize=(5 * n, 3))
         if n == 1:
@@ -538,28 +600,65 @@ class DashboardGenerator:
 
         fig.suptitle("선행 지표 분석 (Cross-Correlation)", fontsize=12, fontweight="bold", color=_SLATE["text"], y=1.02)
         plt.tight_layout()
-        return _fig_to_base64(fig), results
+        return fig
+
+    @staticmethod
+    def _svg_lead_lag(results: dict) -> str:
+        panels = []
+        for brand in sorted(results.keys()):
+            lag_data = results[brand]["lags"]
+            if not lag_data:
+                continue
+            color = BRAND_COLORS.get(brand, "#475569")
+            lags = sorted(lag_data.keys())
+            panels.append({
+                "title": BRAND_LABELS.get(brand, brand),
+                "x": lags,
+                "y": [lag_data[l] for l in lags],
+                "colors": [color if l == results[brand]["best_lag"] else "#e2e8f0" for l in lags],
+            })
+        return svg_charts.bar_panels(
+            panels, ylim=(-1, 1), title="선행 지표 분석 (Cross-Correlation)",
+            xlabel="Lag (일)", ylabel="Pearson r", marker_x=0,
+        )
 
-    def _chart_peak_season(self, df_trend) -> tuple[str | None, dict]:
+    def _chart_peak_season(self, df_trend) -> tuple[ChartJob | None, dict]:
         brands = sorted(df_trend["brand"].unique())
         if not brands:
             return None, {}
 
+        daily = daily_trend_avg(df_trend)
         results = {}
+        series = {}
+        for brand in brands:
+            daily_avg = daily[brand].dropna()
+            if daily_avg.empty:
+                continue
+
+            threshold = daily_avg.quantile(PEAK_QUANTILE)
+            periods = peak_periods(daily_avg, threshold)
+            series[brand] = {"daily_avg": daily_avg, "threshold": threshold, "periods": periods}
+            results[brand] = periods
+
+        job = ChartJob(
+            "dashboard_peak_season.png", self._draw_peak_season,
+            {"brands": brands, "series": series}, "성수기 탐지", _SAVEFIG,
+        )
+        return job, results
+
+    @staticmethod
+    def _draw_peak_season(brands: list, series: dict) -> plt.Figure:
         fig, axes = plt.subplots(len(brands), 1, figsize=(10, 3 * len(brands)), sharex=True)
         if len(brands) == 1:
             axes = [axes]
 
         for ax, brand in zip(axes, brands):
+            if brand not in series:
+                continue
             label = BRAND_LABELS.get(brand, brand)
             color = BRAND_COLORS.get(brand, "#475569")
-            brand_data = df_trend[df_trend["brand"] == brand]
-            daily_avg = brand_data.groupby("trend_date")["trend_value"].mean().sort_index()
-            if daily_avg.empty:
-                continue
-
-            threshold = daily_avg.quantile(0.75)
-            peak_dates = daily_avg[daily_avg > threshold].index.tolist()
+            daily_avg = series[brand]["daily_avg"]
+            threshold = series[brand]["threshold"]
 
             ax.fill_between(daily_avg.index, daily_avg.values, alpha=0.15, color=color)
             ax.plot(daily_avg.index, daily_avg.values, color=color, linewidth=2)
@@ -569,32 +668,29 @@ class DashboardGenerator:
             ax.set_ylim(0, 100)
             _apply_chart_style(ax)
 
-            periods = self._group_peak_periods(peak_dates) if peak_dates else []
-            for p in periods:
+            for p in series[brand]["periods"]:
                 ax.axvspan(p["start"], p["end"], alpha=0.08, color="#f87171")
-            results[brand] = periods
 
         axes[-1].tick_params(axis="x", rotation=45)
         fig.suptitle("성수기 탐지 (75th percentile 초과)", fontsize=12, fontweight="bold", color=_SLATE["text"], y=1.01)
         plt.tight_layout()
-        return _fig_to_base64(fig), results
+        return fig
 
     @staticmethod
-    def _group_peak_periods(peak_dates: list) -> list[dict]:
-        periods = []
-        if not peak_dates:
-            return periods
-        current_start = peak_dates[0]
-        current_end = peak_dates[0]
-        for date in peak_dates[1:]:
-            if (date - current_end).days <= 2:
-                current_end = date
-            else:
-                periods.append({"start": current_start, "end": current_end, "days": (current_end - current_start).days + 1})
-                current_start = date
-                current_end = date
-        periods.append({"start": current_start, "end": current_end, "days": (current_end - current_start).days + 1})
-        return periods
+    def _svg_peak_season(brands: list, series: dict) -> str:
+        panels = [
+            {
+                "title": BRAND_LABELS.get(brand, brand),
+                "x": series[brand]["daily_avg"].index,
+                "y": series[brand]["daily_avg"].values,
+                "color": BRAND_COLORS.get(brand, "#475569"),
+                "threshold": series[brand]["threshold"],
+                "spans": [(p["start"], p["end"]) for p in series[brand]["periods"]],
+            }
+            for brand in brands
+            if brand in series
+        ]
+        return svg_charts.line_panels(panels, ylim=(0, 100), title="성수기 탐지 (75th percentile 초과)", ylabel="트렌드")
 
     # ==================== 섹션 4: 채널 믹스 & 요일 (2열) ====================
 
@@ -602,11 +698,10 @@ class DashboardGenerator:
         if df_sales.empty:
             return '<div class="card"><div class="card-header"><h3>채널 믹스 & 요일 패턴</h3></div><p class="no-data">매출 데이터 없음</p></div>'
 
-        mix_b64 = self._chart_channel_mix(df_sales)
-        heat_b64 = self._chart_weekday_heatmap(df_sales)
+        mix, heat = self._chart_html(self._chart_channel_mix(df_sales), self._chart_weekday_heatmap(df_sales))
 
-        left = f'<img src="data:image/png;base64,{mix_b64}" class="chart-img">' if mix_b64 else '<p class="no-data">데이터 부족</p>'
-        right = f'<img src="data:image/png;base64,{heat_b64}" class="chart-img">' if heat_b64 else '<p class="no-data">데이터 부족</p>'
+        left = mix or '<p class="no-data">데이터 부족</p>'
+        right = heat or '<p class="no-data">데이터 부족</p>'
 
         return f"""
         <div class="grid-2">
@@ -621,20 +716,22 @@ class DashboardGenerator:
         </div>
         """
 
-    def _chart_channel_mix(self, df_sales) -> str | None:
+    def _chart_channel_mix(self, df_sales) -> ChartJob | None:
         brands = sorted(df_sales["brand"].unique())
         if not brands:
             return None
+        # 차트에 쓰는 컬럼만 넘겨 캐시 키가 다른 컬럼 변화에 영향받지 않도록
+        data = {"df_sales": df_sales[["sale_date", "brand", "channel", "revenue"]], "brands": brands}
+        return ChartJob("dashboard_channel_mix.png", self._draw_channel_mix, data, "채널 비중", _SAVEFIG)
+
+    @staticmethod
+    def _draw_channel_mix(df_sales: pd.DataFrame, brands: list) -> plt.Figure:
         fig, axes = plt.subplots(1, len(brands), figsize=(6 * len(brands), 4))
         if len(brands) == 1:
             axes = [axes]
         for ax, brand in zip(axes, brands):
-            brand_df = df_sales[df_sales["brand"] == brand].copy()
             label = BRAND_LABELS.get(brand, brand)
-            pivot = brand_df.pivot_table(index="sale_date", columns="channel", values="revenue", aggfunc="sum", fill_value=0)
-            row_totals = pivot.sum(axis=1)
-            pivot_pct = pivot.div(row_totals.replace(0, np.nan), axis=0).fillna(0) * 100
-            pivot_smooth = pivot_pct.rolling(3, min_periods=1).mean()
+            pivot_smooth = DashboardGenerator._channel_share(df_sales, brand)
             channels = [c for c in CHANNEL_ORDER if c in pivot_smooth.columns]
             ax.stackplot(
                 pivot_smooth.index,
@@ -650,9 +747,34 @@ class DashboardGenerator:
             ax.tick_params(axis="x", rotation=45)
             _apply_chart_style(ax)
         plt.tight_layout()
-        return _fig_to_base64(fig)
+        return fig
+
+    @staticmethod
+    def _svg_channel_mix(df_sales: pd.DataFrame, brands: list) -> str:
+        panels = []
+        for brand in brands:
+            pivot_smooth = DashboardGenerator._channel_share(df_sales, brand)
+            channels = [c for c in CHANNEL_ORDER if c in pivot_smooth.columns]
+            panels.append({
+                "title": BRAND_LABELS.get(brand, brand),
+                "x": pivot_smooth.index,
+                "series": [
+                    (CHANNEL_LABELS.get(ch, ch), CHANNEL_COLORS.get(ch, "#94a3b8"), pivot_smooth[ch].values)
+                    for ch in channels
+                ],
+            })
+        return svg_charts.stacked_area_panels(panels, ylim=(0, 100), ylabel="비중 (%)")
 
-    def _chart_weekday_heatmap(self, df_sales) -> str | None:
+    @staticmethod
+    def _channel_share(df_sales: pd.DataFrame, brand: str) -> pd.DataFrame:
+        """브랜드의 일별 채널 매출 비중(%) 3일 이동평균"""
+        brand_df = df_sales[df_sales["brand"] == brand]
+        pivot = brand_df.pivot_table(index="sale_date", columns="channel", values="revenue", aggfunc="sum", fill_value=0)
+        row_totals = pivot.sum(axis=1)
+        pivot_pct = pivot.div(row_totals.replace(0, np.nan), axis=0).fillna(0) * 100
+        return pivot_pct.rolling(3, min_periods=1).mean()
+
+    def _chart_weekday_heatmap(self, df_sales) -> ChartJob | None:
         df = df_sales.copy()
         df["day_of_week"] = df["sale_date"].dt.dayofweek
         heatmap_data = df.groupby(["brand", "day_of_week"])["revenue"].mean().unstack(fill_value=0)
@@ -660,7 +782,13 @@ class DashboardGenerator:
             return None
         brands = sorted(heatmap_data.index)
         data = heatmap_data.loc[brands].values / 10000
+        return ChartJob(
+            "dashboard_weekday_heatmap.png", self._draw_weekday_heatmap,
+            {"data": data, "brands": brands}, "요일별 매출", _SAVEFIG,
+        )
 
+    @staticmethod
+    def _draw_weekday_heatmap(data: np.ndarray, brands: list) -> plt.Figure:
         fig, ax = plt.subplots(figsize=(8, 3.5))
         im = ax.imshow(data, cmap="YlOrRd", aspect="auto")
         ax.set_xticks(range(7))
@@ -680,7 +808,14 @@ class DashboardGenerator:
         cbar = fig.colorbar(im, ax=ax, shrink=0.8, aspect=20)
         cbar.outline.set_visible(False)
         plt.tight_layout()
-        return _fig_to_base64(fig)
+        return fig
+
+    @staticmethod
+    def _svg_weekday_heatmap(data: np.ndarray, brands: list) -> str:
+        return svg_charts.heatmap(
+            data, [BRAND_LABELS.get(b, b) for b in brands], WEEKDAY_KR,
+            cmap="YlOrRd", fmt="₩{:,.0f}만", light=data > data.max() * 0.6, title="브랜드별 요일 평균 매출",
+        )
 
     # ==================== 섹션 5: 광고 퍼포먼스 ====================
 
@@ -1269,6 +1404,13 @@ main {{
     margin: 8px auto 16px;
     border-radius: 12px;
 }}
+.chart-svg {{
+    display: block;
+    width: 100%;
+    height: auto;
+    margin: 8px auto 16px;
+    font-family: inherit;
+}}
 
 /* === Data Table === */
 .data-table {{
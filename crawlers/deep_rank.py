@@ -0,0 +1,47 @@
+"""
+딥 랭킹 크롤링 공통 유틸 - 페이지 분할 / 병렬 조회 / 순위 이어붙이기
+키워드당 상위 100~200위 추적 시 페이지를 동시에 요청해 키워드당 약 1 RTT로 수집한다.
+"""
+
+import logging
+import math
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+
+from .config import DEEP_RANK_PAGE_WORKERS
+
+logger = logging.getLogger(__name__)
+
+
+def page_offsets(depth: int, page_size: int, max_offset: int | None = None) -> list[int]:
+    """depth위까지 덮는 페이지별 시작 순위 오프셋 (0, page_size, 2*page_size, ...)"""
+    offsets = [i * page_size for i in range(math.ceil(depth / page_size))]
+    if max_offset is not None:
+        offsets = [o for o in offsets if o <= max_offset]
+    return offsets
+
+
+def fetch_pages(fetch_page: Callable[[int], list[dict]], offsets: list[int]) -> list[list[dict]]:
+    """페이지별 fetch_page(offset)를 병렬 실행. 결과는 offsets 순서 유지"""
+    if len(offsets) == 1:
+        return [fetch_page(offsets[0])]
+    with ThreadPoolExecutor(max_workers=min(len(offsets), DEEP_RANK_PAGE_WORKERS)) as pool:
+        return list(pool.map(fetch_page, offsets))
+
+
+def stitch_ranked(pages: list[list[dict]], depth: int) -> list[dict]:
+    """페이지별 레코드를 순위순으로 이어붙이고 중복 상품은 최고 순위만 유지
+
+    중복 기준은 product_name (market_competitors UNIQUE(crawl_date, source, product_name)와 동일).
+    """
+    seen = set()
+    results = []
+    for record in sorted((r for page in pages for r in page), key=lambda r: r["ranking"]):
+        if record["ranking"] > depth:
+            break
+        name = record["product_name"]
+        if name in seen:
+            continue
+        seen.add(name)
+        results.append(record)
+    return results
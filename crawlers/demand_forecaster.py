@@ -1,7 +1,7 @@
 """
 매출 예측 모듈 (ML 기반 Demand Forecasting)
 브랜드별 일일 매출을 학습하여 다음 7일 예측.
-Feature Engineering + Random Forest + 교차 검증 + Feature Importance 분석.
+Feature Engineering + Random Forest + 시계열 백테스트 + Feature Importance 분석.
 (시뮬레이션 데이터 기반 — 실무 운영 데이터 투입 시 동일 파이프라인으로 예측 가능)
 """
 
@@ -15,19 +15,37 @@ import matplotlib.pyplot as plt
 import matplotlib.font_manager as fm
 import numpy as np
 import pandas as pd
+import sklearn
 from sklearn.ensemble import RandomForestRegressor
 from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
-from sklearn.model_selection import cross_val_score
 from sklearn.preprocessing import LabelEncoder
 
+from .backtest import backtest
+from .chart_renderer import ChartJob, render_charts
+from .config import (
+    BACKTEST_MODE,
+    BACKTEST_TEST_DAYS,
+    MODEL_DRIFT_RATIO,
+    MODEL_MAX_TREES,
+    MODEL_RETRAIN_DAYS,
+    MODEL_WARM_START_TREES,
+)
+from .feature_pipeline import TIME_FEATURES, FeaturePipeline
+from .hashing import content_hash
+from .model_registry import ModelRegistry
 from .supabase_loader import SupabaseLoader
 
 logger = logging.getLogger(__name__)
 
 OUTPUT_DIR = Path(__file__).parent.parent / "output"
 
+FORECAST_DAYS = 60  # 학습 데이터 기간 (일)
+
 BRAND_LABELS = {"minix": "미닉스", "thome": "톰", "protione": "프로티원"}
 
+MODEL_NAME = "demand_forecaster"
+MODEL_PARAMS = {"n_estimators": 100, "max_depth": 10, "min_samples_leaf": 3, "random_state": 42}
+
 
 def _setup_korean_font():
     font_candidates = ["Malgun Gothic", "NanumGothic", "AppleGothic", "DejaVu Sans"]
@@ -49,8 +67,16 @@ class DemandForecaster:
     모델: Random Forest Regressor (해석 가능성 + 비선형 패턴 학습)
     """
 
-    def __init__(self):
+    def __init__(self, retrain: bool = False, use_cache: bool = True):
+        """
+        Args:
+            retrain: 저장된 모델을 무시하고 전체 재학습
+            use_cache: feature 증분 계산 캐시 사용
+        """
         self.loader = SupabaseLoader()
+        self.features = FeaturePipeline() if use_cache else FeaturePipeline(cache_path=None)
+        self.registry = ModelRegistry()
+        self.retrain = retrain
         self.model = None
         self.le_brand = LabelEncoder()
         self.le_channel = LabelEncoder()
@@ -58,15 +84,10 @@ class DemandForecaster:
 
     def run(self) -> str:
         """전체 예측 파이프라인 실행"""
-        raw_data = self.loader.fetch_brand_sales(days=60)
-        if not raw_data:
+        df = self.loader.load_frame("brand_daily_sales", days=FORECAST_DAYS)
+        if df.empty:
             return "[예측] 데이터가 없습니다. Supabase 연결을 확인해주세요."
 
-        df = pd.DataFrame(raw_data)
-        df["sale_date"] = pd.to_datetime(df["sale_date"])
-        for col in ["revenue", "orders", "ad_spend", "roas"]:
-            df[col] = pd.to_numeric(df[col], errors="coerce").fillna(0)
-
         lines = [
             "📈 매출 예측 분석 (ML Demand Forecasting)",
             "※ 시뮬레이션 데이터 기반 | 실무 운영 데이터 투입 시 동일 파이프라인 적용 가능",
@@ -92,8 +113,17 @@ class DemandForecaster:
         lines.extend(pred_lines)
 
         # 5. 시각화
-        self._plot_actual_vs_predicted(df_pred)
-        self._plot_feature_importance()
+        jobs = [ChartJob("forecast_actual_vs_pred.png", self._plot_actual_vs_predicted, {"df_pred": df_pred}, "실제 vs 예측 차트")]
+        if self.model is not None:
+            jobs.append(
+                ChartJob(
+                    "forecast_feature_importance.png",
+                    self._plot_feature_importance,
+                    {"importances": self.model.feature_importances_, "feature_names": self.feature_names},
+                    "Feature Importance 차트",
+                )
+            )
+        render_charts(jobs, label="예측", output_dir=OUTPUT_DIR)
         lines.append("")
         lines.append("[차트] output/forecast_actual_vs_pred.png - 실제 vs 예측 매출 비교")
         lines.append("[차트] output/forecast_feature_importance.png - Feature Importance Top 10")
@@ -125,61 +155,37 @@ class DemandForecaster:
         return lines
 
     def _engineer_features(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Feature Engineering"""
-        df = df.copy()
-
-        # 시간 기반 features
-        df["day_of_week"] = df["sale_date"].dt.dayofweek
-        df["week_of_month"] = (df["sale_date"].dt.day - 1) // 7 + 1
-        df["is_weekend"] = (df["day_of_week"] >= 5).astype(int)
-        df["month"] = df["sale_date"].dt.month
-        df["day_of_month"] = df["sale_date"].dt.day
+        """Feature Engineering (시간/lag/rolling/EWM은 FeaturePipeline 증분 계산)"""
+        df = self.features.transform(df)
 
         # 브랜드/채널 인코딩
         df["brand_enc"] = self.le_brand.fit_transform(df["brand"])
         df["channel_enc"] = self.le_channel.fit_transform(df["channel"])
 
-        # Lag features (브랜드+채널 그룹별)
-        df = df.sort_values(["brand", "channel", "sale_date"])
-        for lag in [1, 7]:
-            df[f"revenue_lag_{lag}d"] = (
-                df.groupby(["brand", "channel"])["revenue"]
-                .shift(lag)
-            )
-
-        # Rolling mean (7일 이동평균)
-        df["revenue_rolling_7d"] = (
-            df.groupby(["brand", "channel"])["revenue"]
-            .transform(lambda x: x.rolling(7, min_periods=1).mean())
-        )
-
         # 채널 ROAS를 feature로 활용
         df["roas_feature"] = df["roas"].fillna(0)
 
-        # NaN 행 제거 (lag feature로 인한 첫 7일)
-        df = df.dropna(subset=["revenue_lag_1d", "revenue_lag_7d"])
-
-        return df
+        # NaN 행 제거 (lag 이력이 없는 초기 데이터)
+        return df.dropna(subset=self.features.lag_features)
 
     def _feature_summary(self, df: pd.DataFrame) -> list[str]:
         """Feature Engineering 요약"""
         self.feature_names = [
-            "day_of_week", "week_of_month", "is_weekend", "month", "day_of_month",
-            "brand_enc", "channel_enc",
-            "revenue_lag_1d", "revenue_lag_7d", "revenue_rolling_7d",
-            "roas_feature",
+            *TIME_FEATURES, "brand_enc", "channel_enc",
+            *self.features.lag_features, *self.features.window_features, "roas_feature",
         ]
+        windows = "/".join(str(w) for w in self.features.windows)
         lines = [
             "⚙️ Feature Engineering",
             "━" * 50,
             f"  총 Features: {len(self.feature_names)}개",
-            f"  학습 데이터: {len(df):,}건 (lag feature로 인한 초기 데이터 제외)",
+            f"  학습 데이터: {len(df):,}건 (lag 이력이 없는 초기 데이터 제외)",
             "",
             "  Feature 목록:",
             "    [시간] day_of_week, week_of_month, is_weekend, month, day_of_month",
             "    [범주] brand_enc, channel_enc",
-            "    [Lag]  revenue_lag_1d(전일), revenue_lag_7d(전주 동일 요일)",
-            "    [통계] revenue_rolling_7d(7일 이동평균)",
+            f"    [Lag]  {', '.join(self.features.lag_features)} (전일/전주 동일 요일)",
+            f"    [통계] {windows}일 이동평균(rolling) / 표준편차(std) / 지수가중평균(ewm)",
             "    [마케팅] roas_feature(광고 수익률)",
             "",
         ]
@@ -210,15 +216,10 @@ class DemandForecaster:
         lines.append(f"  모델: Random Forest Regressor")
         lines.append(f"    n_estimators=100, max_depth=10, min_samples_leaf=3")
 
-        # 학습
-        self.model = RandomForestRegressor(
-            n_estimators=100,
-            max_depth=10,
-            min_samples_leaf=3,
-            random_state=42,
-            n_jobs=-1,
-        )
-        self.model.fit(X_train, y_train)
+        # 학습 (레지스트리: 재사용 / warm start / 전체 학습)
+        train_dates = df.loc[train_mask, "sale_date"]
+        self.model, meta, status = self._fit_model(X_train, y_train, train_dates)
+        lines.append(f"    레지스트리: {status} (트리 {len(self.model.estimators_)}개)")
 
         # 평가
         y_pred = self.model.predict(X_test)
@@ -226,7 +227,7 @@ class DemandForecaster:
         mae = mean_absolute_error(y_test, y_pred)
         rmse = math.sqrt(mean_squared_error(y_test, y_pred))
         r2 = r2_score(y_test, y_pred)
-        mape = np.mean(np.abs((y_test - y_pred) / np.where(y_test == 0, 1, y_test))) * 100
+        mape = self._mape(y_test, y_pred)
 
         lines.append(f"\n  📊 Test Set 평가 지표")
         lines.append(f"    MAE:  ₩{mae:,.0f} (평균 절대 오차)")
@@ -234,14 +235,14 @@ class DemandForecaster:
         lines.append(f"    R²:   {r2:.4f} (결정 계수)")
         lines.append(f"    MAPE: {mape:.1f}% (평균 절대 백분율 오차)")
 
-        # 교차 검증 (시계열이므로 참고용)
-        cv_scores = cross_val_score(
-            RandomForestRegressor(n_estimators=100, max_depth=10, min_samples_leaf=3, random_state=42),
-            X_train, y_train, cv=5, scoring="r2",
-        )
-        lines.append(f"\n  🔄 5-Fold Cross Validation (Train set)")
-        lines.append(f"    R² 평균: {cv_scores.mean():.4f} (±{cv_scores.std():.4f})")
-        lines.append(f"    각 fold: {', '.join(f'{s:.3f}' for s in cv_scores)}")
+        # 시계열 백테스트 (날짜 기준 fold 병렬 학습) - 전체 학습 때만 다시 계산
+        if "backtest" not in meta:
+            meta["backtest"] = backtest(RandomForestRegressor(**MODEL_PARAMS), X_train, y_train, train_dates)
+            meta["test_mape"] = mape
+        lines.extend(self._backtest_lines(meta["backtest"], "" if status.startswith("전체 학습") else meta["full_train_end"]))
+
+        if not status.startswith("재사용"):
+            self.registry.save(MODEL_NAME, self.model, meta)
 
         # R² 해석
         if r2 >= 0.9:
@@ -276,6 +277,85 @@ class DemandForecaster:
 
         return lines, df_test
 
+    @staticmethod
+    def _backtest_lines(folds: list[dict], full_train_end: str) -> list[str]:
+        """fold별 백테스트 지표 (full_train_end가 있으면 재사용한 결과임을 표시)"""
+        note = f" - {full_train_end} 전체 학습 기준" if full_train_end else ""
+        lines = [f"\n  🔄 시계열 백테스트 ({BACKTEST_MODE}, {len(folds)}-Fold, 검증 {BACKTEST_TEST_DAYS}일씩){note}"]
+        if not folds:
+            lines.append("    데이터 부족으로 백테스트 불가")
+            return lines
+
+        r2 = np.array([f["r2"] for f in folds])
+        mape = np.array([f["mape"] for f in folds])
+        lines.append(f"    R² 평균: {r2.mean():.4f} (±{r2.std():.4f}) | MAPE 평균: {mape.mean():.1f}%")
+        for f in folds:
+            lines.append(
+                f"    fold {f['fold']}: 학습 {f['train_start'][5:]}~{f['train_end'][5:]} ({f['train_rows']:,}건) "
+                f"→ 검증 {f['test_start'][5:]}~{f['test_end'][5:]} | R² {f['r2']:.3f}, MAPE {f['mape']:.1f}% "
+                f"({f['seconds']:.1f}초)"
+            )
+        return lines
+
+    @staticmethod
+    def _mape(y_true: np.ndarray, y_pred: np.ndarray) -> float:
+        return float(np.mean(np.abs((y_true - y_pred) / np.where(y_true == 0, 1, y_true))) * 100)
+
+    def _fit_model(
+        self, X_train: np.ndarray, y_train: np.ndarray, train_dates: pd.Series
+    ) -> tuple[RandomForestRegressor, dict, str]:
+        """저장된 모델 재사용 / warm start 트리 추가 / 전체 학습 중 선택해 학습
+
+        feature 구성(이름, 인코딩, 하이퍼파라미터, sklearn 버전)이 바뀌면 항상 전체 학습.
+        반환: (모델, 메타데이터, 상태 문구). 메타데이터의 backtest가 없으면 호출 측에서 다시 계산
+        """
+        feature_key = content_hash([
+            self.feature_names, list(self.le_brand.classes_), list(self.le_channel.classes_),
+            MODEL_PARAMS, sklearn.__version__,
+        ])
+        data_hash = content_hash([X_train, y_train])
+        train_end = train_dates.max()
+        meta = {
+            "feature_key": feature_key,
+            "data_hash": data_hash,
+            "train_start": train_dates.min().date().isoformat(),
+            "train_end": train_end.date().isoformat(),
+            "n_rows": len(y_train),
+        }
+
+        model, saved = (None, {}) if self.retrain else self.registry.load(MODEL_NAME)
+        reason = "--retrain" if self.retrain else "저장 모델 없음"
+        if model is not None:
+            new_rows = (train_dates > pd.Timestamp(saved["train_end"])).to_numpy()
+            if saved["feature_key"] != feature_key:
+                reason = "feature 구성 변경"
+            elif saved["data_hash"] == data_hash:
+                logger.info(f"[예측] 학습 데이터 동일 → 저장 모델 재사용 ({saved['train_end']})")
+                return model, saved, "재사용"
+            elif not new_rows.any():
+                reason = "기존 학습 구간 데이터 변경"
+            elif (train_end - pd.Timestamp(saved["full_train_end"])).days >= MODEL_RETRAIN_DAYS:
+                reason = f"정기 재학습 ({MODEL_RETRAIN_DAYS}일 경과)"
+            elif len(model.estimators_) + MODEL_WARM_START_TREES > MODEL_MAX_TREES:
+                reason = f"트리 수 한도 {MODEL_MAX_TREES}개"
+            else:
+                drift = self._mape(y_train[new_rows], model.predict(X_train[new_rows]))
+                if drift > saved["test_mape"] * MODEL_DRIFT_RATIO:
+                    reason = f"드리프트 (새 날짜 MAPE {drift:.1f}% > 기준 {saved['test_mape']:.1f}%)"
+                else:
+                    # 새 날짜를 포함한 학습 구간으로 트리만 추가
+                    model.set_params(warm_start=True, n_estimators=len(model.estimators_) + MODEL_WARM_START_TREES)
+                    model.fit(X_train, y_train)
+                    meta.update({k: saved[k] for k in ("full_train_end", "test_mape", "backtest") if k in saved})
+                    logger.info(f"[예측] warm start: 트리 {MODEL_WARM_START_TREES}개 추가 (새 학습 행 {new_rows.sum()}건)")
+                    return model, meta, f"warm start +{MODEL_WARM_START_TREES}"
+
+        logger.info(f"[예측] 전체 학습: {reason}")
+        model = RandomForestRegressor(**MODEL_PARAMS, n_jobs=-1)
+        model.fit(X_train, y_train)
+        meta["full_train_end"] = meta["train_end"]
+        return model, meta, f"전체 학습 ({reason})"
+
     def _brand_predictions(self, df_full: pd.DataFrame, df_pred: pd.DataFrame) -> list[str]:
         """브랜드별 예측 결과 요약"""
         lines = [
@@ -315,10 +395,9 @@ class DemandForecaster:
 
         return lines
 
-    def _plot_actual_vs_predicted(self, df_pred: pd.DataFrame) -> None:
+    @staticmethod
+    def _plot_actual_vs_predicted(df_pred: pd.DataFrame) -> plt.Figure | None:
         """실제 vs 예측 매출 비교 차트"""
-        OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-
         brands = sorted(df_pred["brand"].unique())
         fig, axes = plt.subplots(1, len(brands), figsize=(6 * len(brands), 5))
         if len(brands) == 1:
@@ -349,21 +428,13 @@ class DemandForecaster:
             ax.grid(True, axis="y", alpha=0.3)
 
         plt.tight_layout()
-        path = OUTPUT_DIR / "forecast_actual_vs_pred.png"
-        fig.savefig(path, dpi=150, bbox_inches="tight")
-        plt.close(fig)
-        logger.info(f"[예측] 실제 vs 예측 차트 저장: {path}")
+        return fig
 
-    def _plot_feature_importance(self) -> None:
+    @staticmethod
+    def _plot_feature_importance(importances: np.ndarray, feature_names: list[str]) -> plt.Figure | None:
         """Feature Importance 차트"""
-        if self.model is None:
-            return
-
-        OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-
-        importances = self.model.feature_importances_
         feat_imp = sorted(
-            zip(self.feature_names, importances),
+            zip(feature_names, importances),
             key=lambda x: x[1],
             reverse=True,
         )[:10]
@@ -376,6 +447,14 @@ class DemandForecaster:
             "revenue_lag_1d": "전일 매출",
             "revenue_lag_7d": "전주 동요일 매출",
             "revenue_rolling_7d": "7일 이동평균",
+            "revenue_rolling_14d": "14일 이동평균",
+            "revenue_rolling_28d": "28일 이동평균",
+            "revenue_std_7d": "7일 표준편차",
+            "revenue_std_14d": "14일 표준편차",
+            "revenue_std_28d": "28일 표준편차",
+            "revenue_ewm_7d": "7일 지수평균",
+            "revenue_ewm_14d": "14일 지수평균",
+            "revenue_ewm_28d": "28일 지수평균",
             "day_of_week": "요일",
             "channel_enc": "채널",
             "brand_enc": "브랜드",
@@ -406,7 +485,4 @@ class DemandForecaster:
         ax.grid(True, axis="x", alpha=0.3)
 
         plt.tight_layout()
-        path = OUTPUT_DIR / "forecast_feature_importance.png"
-        fig.savefig(path, dpi=150, bbox_inches="tight")
-        plt.close(fig)
-        logger.info(f"[예측] Feature Importance 차트 저장: {path}")
+        return fig
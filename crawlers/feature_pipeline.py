@@ -0,0 +1,174 @@
+"""
+매출 예측 Feature 파이프라인 - (브랜드, 채널)별 시계열 feature를 그룹 단위 벡터 연산으로 계산
+- 한 번 정렬한 뒤 lag / rolling mean·std / EWM을 pandas groupby 내장 연산(Python 콜백 없음)으로 일괄 계산
+- 계산 결과를 날짜별 입력 해시와 함께 캐시해, 다음 실행에서는 입력이 바뀐 첫 날짜 이후만 다시 계산
+  (rolling/lag은 직전 행 문맥, EWM은 직전 값에서 이어 계산 → 전체 재계산과 같은 값)
+"""
+
+import logging
+import os
+from pathlib import Path
+
+import pandas as pd
+
+from .config import FEATURE_CACHE_PATH, FEATURE_LAGS, FEATURE_WINDOWS
+from .hashing import content_hash, module_digest
+
+logger = logging.getLogger(__name__)
+
+GROUP_COLUMNS = ["brand", "channel"]
+DATE_COLUMN = "sale_date"
+TIME_FEATURES = ["day_of_week", "week_of_month", "is_weekend", "month", "day_of_month"]
+
+
+class FeaturePipeline:
+    """brand_daily_sales 행 → 시간/lag/rolling/EWM feature (증분 캐시)
+
+    feature는 입력 조회 기간이 아니라 지금까지 본 전체 이력 기준이다.
+    캐시가 있으면 조회 기간 앞쪽 행도 이전 실행에서 계산한(더 긴 이력의) 값을 그대로 쓴다.
+    """
+
+    def __init__(
+        self,
+        cache_path: Path | str | None = FEATURE_CACHE_PATH,
+        lags: tuple[int, ...] = FEATURE_LAGS,
+        windows: tuple[int, ...] = FEATURE_WINDOWS,
+    ):
+        self.cache_path = Path(cache_path) if cache_path else None
+        self.lags = lags
+        self.windows = windows
+
+    @property
+    def lag_features(self) -> list[str]:
+        return [f"revenue_lag_{lag}d" for lag in self.lags]
+
+    @property
+    def window_features(self) -> list[str]:
+        return [f"revenue_{stat}_{w}d" for w in self.windows for stat in ("rolling", "std", "ewm")]
+
+    @property
+    def feature_names(self) -> list[str]:
+        return TIME_FEATURES + self.lag_features + self.window_features
+
+    @property
+    def context_rows(self) -> int:
+        """새 행의 lag/rolling 계산에 필요한 그룹별 직전 행 수"""
+        return max(*self.lags, *self.windows)
+
+    def _cache_key(self) -> str:
+        return content_hash([self.lags, self.windows, module_digest(__name__)])
+
+    # ---------- 변환 ----------
+
+    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        """(브랜드, 채널, 날짜) 순으로 정렬된 원본 컬럼 + feature 컬럼 DataFrame"""
+        df = df.sort_values([*GROUP_COLUMNS, DATE_COLUMN], kind="stable", ignore_index=True)
+        hashes = self._date_hashes(df)
+        cached = self._load_cache()
+
+        changed = self._first_changed_date(hashes, cached)
+        if cached is None:
+            full = self._compute(df, pd.Series(True, index=df.index))
+            logger.info(f"[Feature] 전체 계산: {len(df):,}행")
+        elif changed is None:
+            full = cached["frame"]
+            logger.info("[Feature] 입력 변경 없음 → 캐시 재사용")
+            return full[full[DATE_COLUMN] >= df[DATE_COLUMN].min()].reset_index(drop=True)
+        else:
+            history = cached["frame"][cached["frame"][DATE_COLUMN] < changed]
+            context = history.groupby(GROUP_COLUMNS, sort=False).tail(self.context_rows)
+            new = df[df[DATE_COLUMN] >= changed]
+            frame = pd.concat([context.assign(_new=False), new.assign(_new=True)]).sort_values(
+                [*GROUP_COLUMNS, DATE_COLUMN], kind="stable", ignore_index=True
+            )
+            computed = self._compute(frame.drop(columns="_new"), frame["_new"])
+            full = pd.concat([history, computed]).sort_values([*GROUP_COLUMNS, DATE_COLUMN], kind="stable")
+            logger.info(f"[Feature] {changed.date()} 이후 {len(new):,}행만 계산 (재사용 {len(history):,}행)")
+
+        window_start = df[DATE_COLUMN].min()
+        self._save_cache(full, hashes, window_start)
+        return full[full[DATE_COLUMN] >= window_start].reset_index(drop=True)
+
+    def _compute(self, frame: pd.DataFrame, is_new: pd.Series) -> pd.DataFrame:
+        """frame(그룹/날짜 정렬, 기본 index)의 feature 계산 후 is_new 행만 반환
+
+        is_new가 아닌 행은 직전 문맥(캐시된 이전 행, EWM 컬럼 포함)이다.
+        """
+        g = frame.groupby(GROUP_COLUMNS, sort=False)["revenue"]
+        dates = frame[DATE_COLUMN].dt
+        features = {
+            "day_of_week": dates.dayofweek,
+            "week_of_month": (dates.day - 1) // 7 + 1,
+            "is_weekend": (dates.dayofweek >= 5).astype(int),
+            "month": dates.month,
+            "day_of_month": dates.day,
+        }
+        for lag in self.lags:
+            features[f"revenue_lag_{lag}d"] = g.shift(lag)
+
+        # 윈도우 통계는 전일까지의 매출로 계산 (당일 매출 = 예측 대상이므로 제외)
+        previous = g.shift(1).astype(float)
+        keys = [frame[c] for c in GROUP_COLUMNS]
+        # EWM(adjust=False)은 직전 EWM 값에서 이어진다: 문맥 마지막 행의 값을 이전 EWM으로 바꿔 시작점으로 사용
+        seeds = frame[~is_new].groupby(GROUP_COLUMNS, sort=False).tail(1).index
+        keep = is_new.to_numpy() | frame.index.isin(seeds)
+        for w in self.windows:
+            rolling = previous.groupby(keys, sort=False).rolling(w, min_periods=1)
+            features[f"revenue_rolling_{w}d"] = rolling.mean().droplevel([0, 1])
+            features[f"revenue_std_{w}d"] = rolling.std().droplevel([0, 1]).fillna(0)
+
+            values = previous.copy()
+            if len(seeds):
+                values.loc[seeds] = frame.loc[seeds, f"revenue_ewm_{w}d"]
+            ewm = (
+                values[keep]
+                .groupby([frame.loc[keep, c] for c in GROUP_COLUMNS], sort=False)
+                .ewm(span=w, adjust=False)
+                .mean()
+                .droplevel([0, 1])
+            )
+            features[f"revenue_ewm_{w}d"] = ewm
+
+        return frame.assign(**features)[is_new.to_numpy()]
+
+    # ---------- 캐시 ----------
+
+    @staticmethod
+    def _date_hashes(df: pd.DataFrame) -> dict:
+        """날짜별 입력 행 해시 (행 해시의 합, 순서 무관)"""
+        row_hash = pd.util.hash_pandas_object(df[sorted(df.columns)], index=False)
+        sums = row_hash.groupby(df[DATE_COLUMN].to_numpy()).sum()
+        return {pd.Timestamp(d): int(h) for d, h in sums.items()}
+
+    @staticmethod
+    def _first_changed_date(hashes: dict, cached: dict | None) -> pd.Timestamp | None:
+        """캐시와 입력이 달라지는 첫 날짜 (새 날짜 / 행 변경 / 캐시에만 있는 조회 기간 내 날짜)"""
+        if cached is None:
+            return None
+        start = min(hashes)
+        old = {d: h for d, h in cached["hashes"].items() if d >= start}
+        changed = [d for d in hashes.keys() | old.keys() if hashes.get(d) != old.get(d)]
+        return min(changed) if changed else None
+
+    def _load_cache(self) -> dict | None:
+        if self.cache_path is None:
+            return None
+        try:
+            cached = pd.read_pickle(self.cache_path)
+        except (OSError, ValueError, EOFError, AttributeError, ImportError):
+            return None
+        if cached.get("key") != self._cache_key():
+            logger.info("[Feature] 설정/코드 변경 → 캐시 무시")
+            return None
+        return cached
+
+    def _save_cache(self, full: pd.DataFrame, hashes: dict, window_start: pd.Timestamp) -> None:
+        """조회 기간 행 + 그 이전 문맥 행만 보관 (캐시 크기 상한)"""
+        if self.cache_path is None:
+            return
+        before = full[full[DATE_COLUMN] < window_start].groupby(GROUP_COLUMNS, sort=False).tail(self.context_rows)
+        frame = pd.concat([before, full[full[DATE_COLUMN] >= window_start]])
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.cache_path.with_suffix(".tmp")
+        pd.to_pickle({"key": self._cache_key(), "hashes": hashes, "frame": frame}, tmp)
+        os.replace(tmp, self.cache_path)
@@ -0,0 +1,65 @@
+"""
+내용 해시 유틸 - 캐시 키/지문 계산 공용 (차트 캐시, 대시보드 섹션, feature 캐시, 모델 레지스트리)
+중첩된 dict/list/DataFrame 값을 pandas 행 해시로 빠르게 식별하고, 모듈 소스 해시로 코드 변경을 반영한다.
+"""
+
+import datetime as dt
+import functools
+import hashlib
+import inspect
+import pickle
+import sys
+
+import numpy as np
+import pandas as pd
+
+# repr로 충분히 식별되는 스칼라 타입
+_SCALARS = (str, int, float, bool, type(None), np.generic, dt.date, dt.datetime, pd.Timestamp, pd.Timedelta)
+
+
+@functools.cache
+def module_digest(module_name: str) -> str:
+    """모듈 소스 해시 - 함수 본문 외에 같은 모듈의 공용 함수/상수 수정도 캐시 무효화에 반영"""
+    try:
+        source = inspect.getsource(sys.modules[module_name])
+    except (KeyError, OSError, TypeError):
+        return ""
+    return hashlib.sha256(source.encode()).hexdigest()
+
+
+def update_hash(h, value) -> None:
+    """값을 해시에 누적 (DataFrame/Series는 pandas 행 해시, 컨테이너는 재귀). 식별 불가 값은 TypeError"""
+    h.update(type(value).__name__.encode())
+    if isinstance(value, pd.DataFrame):
+        h.update(repr((list(value.columns), [str(t) for t in value.dtypes])).encode())
+        h.update(pd.util.hash_pandas_object(value, index=True).values.tobytes())
+    elif isinstance(value, (pd.Series, pd.Index)):
+        h.update(repr((value.name, str(value.dtype))).encode())
+        h.update(pd.util.hash_pandas_object(value).values.tobytes())
+    elif isinstance(value, np.ndarray):
+        h.update(repr((value.dtype.str, value.shape)).encode())
+        h.update(repr(value.tolist()).encode() if value.dtype == object else value.tobytes())
+    elif isinstance(value, dict):
+        h.update(str(len(value)).encode())
+        for k, v in value.items():
+            update_hash(h, k)
+            update_hash(h, v)
+    elif isinstance(value, (list, tuple)):
+        h.update(str(len(value)).encode())
+        for v in value:
+            update_hash(h, v)
+    elif isinstance(value, _SCALARS):
+        h.update(repr(value).encode())
+    else:
+        try:
+            h.update(pickle.dumps(value))
+        except (pickle.PicklingError, AttributeError, TypeError) as e:
+            raise TypeError(f"해시할 수 없는 값: {type(value).__name__}") from e
+    h.update(b"\x00")
+
+
+def content_hash(value) -> str:
+    """값의 내용 해시 (dict/list/DataFrame 중첩 가능). 해시할 수 없는 값이 있으면 TypeError"""
+    h = hashlib.sha256()
+    update_hash(h, value)
+    return h.hexdigest()
@@ -0,0 +1,122 @@
+"""
+쿠팡 검색 결과 HTML 파서 백엔드
+- lxml: libxml2(C) 풀 파서에 문서를 조각 단위로 넣으며 li.search-product를 수집, 필요한 개수만 채우면 중단
+  (문서 처음부터 HTML로 파싱하므로 <script>/<style> 안의 템플릿 문자열은 상품으로 잡히지 않음)
+- bs4: BeautifulSoup html.parser 전체 트리 파싱 (lxml 미설치 시 fallback)
+두 백엔드 모두 상품별 원시 텍스트(name/price/rating/review)를 같은 형태로 반환한다.
+"""
+
+import logging
+
+from bs4 import BeautifulSoup
+
+try:
+    from lxml import etree
+except ImportError:  # pragma: no cover - lxml 미설치 환경
+    etree = None
+
+logger = logging.getLogger(__name__)
+
+FIELDS = ("name", "price", "rating", "review")
+
+_FEED_CHUNK = 16 * 1024
+
+
+def _has_class(name: str) -> str:
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+# bs4 CSS 셀렉터와 동일한 의미의 XPath (union은 문서 순서 → [1]이 select_one과 같은 요소)
+_XPATH_EXPRS = {
+    "name": f"(.//div[{_has_class('name')}])[1]",
+    "price": f"(.//strong[{_has_class('price-value')}] | .//em[{_has_class('sale')}]//strong)[1]",
+    "rating": f"(.//em[{_has_class('rating')}])[1]",
+    "review": f"(.//span[{_has_class('rating-total-count')}] | .//span[{_has_class('count')}])[1]",
+}
+_XPATHS = {field: etree.XPath(expr) for field, expr in _XPATH_EXPRS.items()} if etree is not None else {}
+
+_BS4_SELECTORS = {
+    "name": "div.name, a.search-product-link div.name",
+    "price": "strong.price-value, em.sale strong",
+    "rating": "em.rating",
+    "review": "span.rating-total-count, span.count",
+}
+
+
+def _lxml_text(element) -> str:
+    # BeautifulSoup get_text(strip=True)와 동일: 텍스트 노드별 strip 후 이어붙임
+    return "".join(s.strip() for s in element.itertext())
+
+
+def _lxml_fields(item) -> dict:
+    fields = {}
+    for field in FIELDS:
+        found = _XPATHS[field](item)
+        fields[field] = _lxml_text(found[0]) if found else None
+    return fields
+
+
+def _extract_lxml(html: str, limit: int) -> list[dict]:
+    parser = etree.HTMLPullParser(events=("end",), tag="li")
+    exact, partial = [], []
+    for offset in range(0, len(html), _FEED_CHUNK):
+        parser.feed(html[offset : offset + _FEED_CHUNK])
+        for _, item in parser.read_events():
+            classes = item.get("class", "")
+            if "search-product" not in classes:
+                continue
+            fields = _lxml_fields(item)
+            if "search-product" in classes.split():
+                exact.append(fields)
+            elif not exact and len(partial) < limit:
+                partial.append(fields)
+        if len(exact) >= limit:
+            break
+    else:
+        parser.close()
+
+    # bs4 경로와 동일: li.search-product가 없을 때만 class*='search-product' 사용
+    return (exact or partial)[:limit]
+
+
+def _extract_bs4(html: str, limit: int) -> list[dict]:
+    soup = BeautifulSoup(html, "html.parser")
+    items = soup.select("li.search-product")
+    if not items:
+        items = soup.select("li[class*='search-product']")
+
+    results = []
+    for item in items[:limit]:
+        fields = {}
+        for field in FIELDS:
+            tag = item.select_one(_BS4_SELECTORS[field])
+            fields[field] = tag.get_text(strip=True) if tag else None
+        results.append(fields)
+    return results
+
+
+BACKENDS = {
+    "lxml": _extract_lxml,
+    "bs4": _extract_bs4,
+}
+
+
+def resolve_backend(backend: str = "auto") -> str:
+    """설정값(auto/lxml/bs4) → 실제 사용할 백엔드 이름"""
+    if backend == "auto":
+        return "lxml" if etree is not None else "bs4"
+    if backend == "lxml" and etree is None:
+        logger.warning("[파서] lxml 미설치 — BeautifulSoup으로 대체. pip install lxml")
+        return "bs4"
+    if backend not in BACKENDS:
+        raise ValueError(f"알 수 없는 HTML 파서 백엔드: {backend}")
+    return backend
+
+
+def extract_products(html: str, limit: int, backend: str = "auto") -> list[dict]:
+    """검색 결과 HTML → 상위 limit개 상품의 원시 필드 목록
+
+    Returns:
+        list[dict]: [{"name": str | None, "price": ..., "rating": ..., "review": ...}, ...]
+    """
+    return BACKENDS[resolve_backend(backend)](html, limit)
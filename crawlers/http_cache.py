@@ -0,0 +1,149 @@
+"""
+크롤러 HTTP 응답 디스크 캐시
+URL+params 키, TTL(같은 크롤링 날짜 안에서만 유효), ETag/Last-Modified 조건부 재검증,
+zlib 압축 본문 저장, 용량 초과 시 LRU 삭제.
+재실행/부분 실패 재시도 시 같은 날 이미 받은 페이지는 업스트림 요청 없이 재사용한다.
+"""
+
+import hashlib
+import json
+import logging
+import time
+import zlib
+from datetime import date, timedelta
+from pathlib import Path
+from urllib.parse import urlencode
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from .config import HTTP_CACHE_DIR, HTTP_CACHE_MAX_BYTES, HTTP_CACHE_TTL
+from .lru_store import LruDirectoryStore
+
+logger = logging.getLogger(__name__)
+
+# 캐시에 보존할 응답 헤더 (재검증 + 본문 디코딩용)
+_KEPT_HEADERS = ("Content-Type", "ETag", "Last-Modified")
+
+
+class HttpCache(LruDirectoryStore):
+    """URL+params 기반 HTTP 응답 캐시 (zlib 압축, TTL, 조건부 요청, LRU 용량 제한)
+
+    항목 = 메타(.json, LRU 기준) + 압축 본문(.z)
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path | str = HTTP_CACHE_DIR,
+        ttl: float = HTTP_CACHE_TTL,
+        max_bytes: int = HTTP_CACHE_MAX_BYTES,
+    ):
+        super().__init__(cache_dir, max_bytes, suffixes=(".json", ".z"), label="HTTP 캐시")
+        self.ttl = ttl
+
+    @staticmethod
+    def make_key(url: str, params: dict | None = None) -> str:
+        query = urlencode(sorted((params or {}).items()), doseq=True)
+        return hashlib.sha256(f"{url}?{query}".encode()).hexdigest()
+
+    def load(self, key: str) -> tuple[dict, bytes] | None:
+        try:
+            meta = json.loads(self.path(key, ".json").read_text(encoding="utf-8"))
+            body = zlib.decompress(self.path(key, ".z").read_bytes())
+            self.mark_used(key)
+        except (OSError, ValueError, zlib.error):
+            return None
+        return meta, body
+
+    def is_fresh(self, meta: dict) -> bool:
+        stored_at = meta["stored_at"]
+        same_day = date.fromtimestamp(stored_at) == date.today()
+        return same_day and time.time() - stored_at < self.ttl
+
+    @staticmethod
+    def validators(meta: dict) -> dict:
+        """조건부 요청 헤더 (If-None-Match / If-Modified-Since)"""
+        headers = {}
+        if meta["headers"].get("ETag"):
+            headers["If-None-Match"] = meta["headers"]["ETag"]
+        if meta["headers"].get("Last-Modified"):
+            headers["If-Modified-Since"] = meta["headers"]["Last-Modified"]
+        return headers
+
+    def store(self, key: str, response: requests.Response) -> None:
+        meta = {
+            "url": response.url,
+            "status": response.status_code,
+            "headers": {h: response.headers[h] for h in _KEPT_HEADERS if h in response.headers},
+            "encoding": response.encoding or response.apparent_encoding,
+            "stored_at": time.time(),
+        }
+        self._write(key, meta, zlib.compress(response.content))
+
+    def touch(self, key: str, meta: dict, body: bytes) -> None:
+        """304 Not Modified → 저장 시각만 갱신"""
+        self._write(key, {**meta, "stored_at": time.time()}, zlib.compress(body))
+
+    def _write(self, key: str, meta: dict, compressed: bytes) -> None:
+        self.write(key, {".z": compressed, ".json": json.dumps(meta).encode("utf-8")})
+
+    @staticmethod
+    def to_response(meta: dict, body: bytes) -> requests.Response:
+        response = requests.Response()
+        response.status_code = meta["status"]
+        response._content = body
+        response.headers = CaseInsensitiveDict(meta["headers"])
+        response.url = meta["url"]
+        response.encoding = meta["encoding"]
+        response.elapsed = timedelta(0)
+        response.from_cache = True
+        return response
+
+
+def cached_get(
+    session: requests.Session,
+    url: str,
+    *,
+    params: dict | None = None,
+    headers: dict | None = None,
+    timeout: float = 15,
+    rate_limiter=None,
+    cache: HttpCache | None = None,
+) -> requests.Response:
+    """캐시 → (조건부) GET 순서로 응답 반환
+
+    신선한 캐시 항목은 네트워크/리미터를 거치지 않는다. 요청이 나가는 경우에만
+    rate_limiter.acquire/record를 수행한다. 연결 오류는 그대로 raise.
+    """
+    key = entry = None
+    headers = dict(headers or {})
+    if cache is not None:
+        key = cache.make_key(url, params)
+        entry = cache.load(key)
+        if entry is not None:
+            meta, body = entry
+            if cache.is_fresh(meta):
+                logger.debug(f"[HTTP 캐시] hit: {meta['url']}")
+                return cache.to_response(meta, body)
+            headers.update(cache.validators(meta))
+
+    if rate_limiter is not None:
+        rate_limiter.acquire()
+    try:
+        response = session.get(url, params=params, headers=headers, timeout=timeout)
+    except requests.RequestException:
+        if rate_limiter is not None:
+            rate_limiter.record_error()
+        raise
+    if rate_limiter is not None:
+        rate_limiter.record_response(response)
+
+    if cache is not None:
+        if response.status_code == 304 and entry is not None:
+            meta, body = entry
+            cache.touch(key, meta, body)
+            logger.debug(f"[HTTP 캐시] 재검증 (304): {meta['url']}")
+            return cache.to_response(meta, body)
+        if response.status_code == 200:
+            cache.store(key, response)
+    return response
@@ -14,6 +14,7 @@ import numpy as np
 import pandas as pd
 from scipy import stats
 
+from .chart_renderer import ChartJob, render_charts
 from .supabase_loader import SupabaseLoader
 
 logger = logging.getLogger(__name__)
@@ -66,17 +67,14 @@ class InsightAnalyzer:
     def run(self, days: int = 30) -> str:
         """전체 인사이트 분석 파이프라인"""
         # 1. 데이터 조회
-        sales_data = self.loader.fetch_brand_sales(days=days)
-        competitor_data = self.loader.fetch_competitors_extended(weeks=8)
+        df_sales = self.loader.load_frame("brand_daily_sales", days=days)
+        df_comp = self.loader.load_frame(
+            "market_competitors", days=8 * 7, order="crawl_date.asc,source,category,ranking"
+        )
 
-        if not sales_data:
+        if df_sales.empty:
             return "[인사이트] 매출 데이터가 없습니다. Supabase 연결을 확인해주세요."
 
-        df_sales = pd.DataFrame(sales_data)
-        df_sales["sale_date"] = pd.to_datetime(df_sales["sale_date"])
-        df_sales["revenue"] = pd.to_numeric(df_sales["revenue"], errors="coerce").fillna(0)
-        df_sales["orders"] = pd.to_numeric(df_sales["orders"], errors="coerce").fillna(0)
-
         lines = [
             "🔍 앳홈 비즈니스 인사이트 분석",
             "=" * 55,
@@ -92,9 +90,7 @@ class InsightAnalyzer:
         lines.extend(weekday_insights)
 
         # 4. 경쟁사-매출 상관 분석
-        if competitor_data:
-            df_comp = pd.DataFrame(competitor_data)
-            df_comp["crawl_date"] = pd.to_datetime(df_comp["crawl_date"])
+        if not df_comp.empty:
             comp_insights = self.competitor_impact(df_sales, df_comp)
             lines.extend(comp_insights)
 
@@ -103,8 +99,14 @@ class InsightAnalyzer:
         lines.extend(recommendations)
 
         # 6. 시각화
-        self._plot_channel_mix(df_sales)
-        self._plot_weekday_heatmap(df_sales)
+        render_charts(
+            [
+                ChartJob("channel_mix_trend.png", self._plot_channel_mix, {"df": df_sales}, "채널 믹스 차트"),
+                ChartJob("weekday_heatmap.png", self._plot_weekday_heatmap, {"df": df_sales}, "요일 히트맵"),
+            ],
+            label="인사이트",
+            output_dir=OUTPUT_DIR,
+        )
         lines.append("")
         lines.append("[차트] output/channel_mix_trend.png - 채널 비중 변화 추이")
         lines.append("[차트] output/weekday_heatmap.png - 브랜드x요일 매출 히트맵")
@@ -373,10 +375,9 @@ class InsightAnalyzer:
         lines.append("")
         return lines
 
-    def _plot_channel_mix(self, df: pd.DataFrame) -> None:
+    @staticmethod
+    def _plot_channel_mix(df: pd.DataFrame) -> plt.Figure | None:
         """채널 비중 변화 stacked area chart"""
-        OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-
         fig, axes = plt.subplots(1, 3, figsize=(18, 6))
 
         brands = sorted(df["brand"].unique())
@@ -422,15 +423,11 @@ class InsightAnalyzer:
             ax.grid(True, alpha=0.3)
 
         plt.tight_layout()
-        path = OUTPUT_DIR / "channel_mix_trend.png"
-        fig.savefig(path, dpi=150, bbox_inches="tight")
-        plt.close(fig)
-        logger.info(f"[인사이트] 채널 믹스 차트 저장: {path}")
+        return fig
 
-    def _plot_weekday_heatmap(self, df: pd.DataFrame) -> None:
+    @staticmethod
+    def _plot_weekday_heatmap(df: pd.DataFrame) -> plt.Figure | None:
         """브랜드x요일 매출 히트맵"""
-        OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-
         df = df.copy()
         df["day_of_week"] = df["sale_date"].dt.dayofweek
 
@@ -461,7 +458,4 @@ class InsightAnalyzer:
         fig.colorbar(im, ax=ax, label="평균 매출 (만원)")
 
         plt.tight_layout()
-        path = OUTPUT_DIR / "weekday_heatmap.png"
-        fig.savefig(path, dpi=150, bbox_inches="tight")
-        plt.close(fig)
-        logger.info(f"[인사이트] 요일 히트맵 저장: {path}")
+        return fig
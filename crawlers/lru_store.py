@@ -0,0 +1,90 @@
+"""
+용량 제한 디스크 저장소 (LRU) - HTTP 응답 캐시 / 차트 이미지 캐시 공용
+키 하나 = 같은 이름(key)의 파일 묶음 (cache_dir/key[:2]/key.<확장자>).
+LRU 기준은 대표 파일의 mtime(마지막 사용 시각), 한도 초과 시 오래 안 쓴 항목부터 삭제.
+동시 실행 프로세스가 같은 디렉토리를 공유하므로 파일은 임시 파일 → rename으로 원자적 교체.
+"""
+
+import logging
+import os
+import threading
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+class LruDirectoryStore:
+    """키별 파일 묶음 디스크 저장소 (누적 크기 추적, 한도 초과 시 LRU 삭제)
+
+    Args:
+        cache_dir: 저장 디렉토리
+        max_bytes: 용량 한도 (초과 시 한도의 90%까지 축소)
+        suffixes: 항목을 이루는 파일 확장자. 첫 번째가 대표 파일 (스캔/LRU 기준, 마지막에 기록)
+        label: 로그 접두어 (예: "HTTP 캐시")
+    """
+
+    def __init__(self, cache_dir: Path | str, max_bytes: int, suffixes: tuple[str, ...], label: str):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.suffixes = suffixes
+        self.label = label
+        self.lock = threading.Lock()
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        # 매 저장마다 디렉토리를 훑지 않도록 누적 크기를 추적, 한도 초과 시에만 재스캔
+        self.total_bytes = sum(size for _, _, size in self._scan())
+
+    def path(self, key: str, suffix: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}{suffix}"
+
+    def mark_used(self, key: str) -> None:
+        """사용 시각 갱신 (LRU 기준 = 대표 파일 mtime)"""
+        os.utime(self.path(key, self.suffixes[0]))
+
+    def write(self, key: str, files: dict[str, bytes]) -> None:
+        """항목 파일 기록 (대표 파일은 마지막 → 스캔에 보이는 항목은 항상 완전함), 한도 초과 시 LRU 삭제"""
+        primary = self.suffixes[0]
+        self.path(key, primary).parent.mkdir(parents=True, exist_ok=True)
+        for suffix in sorted(files, key=lambda s: s == primary):
+            path = self.path(key, suffix)
+            tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp.write_bytes(files[suffix])
+            os.replace(tmp, path)
+
+        with self.lock:
+            self.total_bytes += sum(len(data) for data in files.values())
+            if self.total_bytes > self.max_bytes:
+                self._evict()
+
+    def _scan(self) -> list[tuple[float, str, int]]:
+        """(대표 파일 mtime, 키, 항목 전체 크기) 목록"""
+        entries = []
+        for primary in self.cache_dir.glob(f"*/*{self.suffixes[0]}"):
+            key = primary.name[: -len(self.suffixes[0])]
+            try:
+                stat = primary.stat()
+            except OSError:
+                continue
+            size = stat.st_size
+            for suffix in self.suffixes[1:]:
+                try:
+                    size += self.path(key, suffix).stat().st_size
+                except OSError:
+                    pass
+            entries.append((stat.st_mtime, key, size))
+        return entries
+
+    def _evict(self) -> None:
+        """오래 안 쓴 항목부터 삭제해 한도의 90%까지 축소 (lock 보유 상태에서 호출)"""
+        entries = sorted(self._scan())
+        total = sum(size for _, _, size in entries)
+        removed = 0
+        for _, key, size in entries:
+            if total <= self.max_bytes * 0.9:
+                break
+            for suffix in self.suffixes:
+                self.path(key, suffix).unlink(missing_ok=True)
+            total -= size
+            removed += 1
+        self.total_bytes = total
+        if removed:
+            logger.info(f"[{self.label}] 용량 초과 → 오래된 항목 {removed}개 삭제")
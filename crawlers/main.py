@@ -7,6 +7,11 @@ Usage:
     python -m crawlers.main --crawl            # 크롤링 + 적재만
     python -m crawlers.main --analyze          # 분석만 (Supabase 기존 데이터)
     python -m crawlers.main --crawl --source coupang  # 쿠팡만 크롤링
+    python -m crawlers.main --crawl --concurrent  # 쿠팡/네이버 동시 크롤링
+    python -m crawlers.main --crawl --depth 200   # 키워드당 200위까지 딥 랭킹 크롤링
+    python -m crawlers.main --crawl --no-cache    # HTTP 캐시 무시하고 새로 크롤링
+    python -m crawlers.main --dashboard --no-cache  # 차트/섹션 캐시 무시하고 대시보드 전체 다시 생성
+    python -m crawlers.main --snapshot --insight  # 로컬 Parquet 스냅샷 증분 동기화 후 분석
     python -m crawlers.main --report weekly    # 주간 요약 리포트
     python -m crawlers.main --report monthly   # 월간 요약 리포트 + 차트
     python -m crawlers.main --insight          # 비즈니스 인사이트 분석
@@ -15,6 +20,7 @@ Usage:
     python -m crawlers.main --trend-collect    # 검색 트렌드 수집 (Google Trends + Naver DataLab)
     python -m crawlers.main --trend            # 트렌드-매출 상관 분석 + 차트
     python -m crawlers.main --dashboard        # KPI 통합 대시보드 (HTML)
+    python -m crawlers.main --dashboard --dashboard-charts svg  # 차트를 인라인 SVG로 (경량 HTML)
     python -m crawlers.main --ad-perf          # 광고 퍼포먼스 분석
 """
 
@@ -32,7 +38,7 @@ if sys.stderr.encoding != "utf-8":
     sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding="utf-8", errors="replace")
 
 from .analyzer import CompetitorAnalyzer
-from .config import CRAWL_TARGETS
+from .config import CRAWL_TARGETS, SNAPSHOT_DIR
 from .coupang_crawler import CoupangCrawler
 from .naver_crawler import NaverShoppingCrawler
 from .supabase_loader import SupabaseLoader
@@ -45,20 +51,30 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def crawl(source: str | None = None) -> list[dict]:
-    """크롤링 실행 → 결과 리스트 반환"""
+def crawl(
+    source: str | None = None, concurrent: bool = False, depth: int | None = None, use_cache: bool = True
+) -> list[dict]:
+    """크롤링 실행 → 결과 리스트 반환 (depth: 키워드당 추적 순위, None이면 MAX_RESULTS_PER_KEYWORD)"""
+    if concurrent:
+        from .async_crawler import AsyncCrawlEngine
+
+        logger.info("=" * 40 + " 동시 크롤링 시작 " + "=" * 40)
+        records = AsyncCrawlEngine(use_cache=use_cache).run(CRAWL_TARGETS, source=source, depth=depth)
+        logger.info(f"크롤링 완료: 총 {len(records)}건 수집")
+        return records
+
     all_records = []
 
     if source is None or source == "coupang":
         logger.info("=" * 40 + " 쿠팡 크롤링 시작 " + "=" * 40)
-        crawler = CoupangCrawler()
-        results = crawler.crawl_all(CRAWL_TARGETS["coupang"])
+        crawler = CoupangCrawler(use_cache=use_cache)
+        results = crawler.crawl_all(CRAWL_TARGETS["coupang"], depth=depth)
         all_records.extend(results)
 
     if source is None or source == "naver":
         logger.info("=" * 40 + " 네이버 크롤링 시작 " + "=" * 40)
-        crawler = NaverShoppingCrawler()
-        results = crawler.crawl_all(CRAWL_TARGETS["naver"])
+        crawler = NaverShoppingCrawler(use_cache=use_cache)
+        results = crawler.crawl_all(CRAWL_TARGETS["naver"], depth=depth)
         all_records.extend(results)
 
     logger.info(f"크롤링 완료: 총 {len(all_records)}건 수집")
@@ -80,13 +96,13 @@ def analyze() -> None:
     logger.info("=" * 40 + " 데이터 분석 시작 " + "=" * 40)
 
     loader = SupabaseLoader()
-    data = loader.fetch_competitors()
+    data = loader.load_frame("market_competitors", days=30)
 
-    if not data:
+    if data.empty:
         logger.error("분석할 데이터가 없습니다.")
         return
 
-    analyzer = CompetitorAnalyzer(data)
+    analyzer = CompetitorAnalyzer(data.to_dict("records"))
 
     # 콘솔 요약 출력
     print(analyzer.summary_stats())
@@ -101,6 +117,18 @@ def analyze() -> None:
         print("\n[경고] 차트를 생성하지 못했습니다.")
 
 
+def snapshot(snapshot_dir: str) -> None:
+    """로컬 스냅샷 증분 동기화 후 분석기 조회 경로를 스냅샷으로 전환 (동기화 실패 시 로컬 데이터로 진행)"""
+    from .snapshot_store import SnapshotStore
+    from .supabase_loader import use_snapshot_store
+
+    logger.info("=" * 40 + " 스냅샷 동기화 " + "=" * 40)
+    store = SnapshotStore(snapshot_dir)
+    synced = store.sync(SupabaseLoader())
+    logger.info(f"[스냅샷] 동기화 완료: {synced}")
+    use_snapshot_store(store)
+
+
 def report(report_type: str) -> None:
     """주간/월간 요약 리포트 생성"""
     from .report_generator import WeeklyReportGenerator, MonthlyReportGenerator
@@ -141,42 +169,42 @@ def abtest() -> None:
     print(result)
 
 
-def forecast() -> None:
+def forecast(retrain: bool = False, use_cache: bool = True) -> None:
     """ML 매출 예측"""
     from .demand_forecaster import DemandForecaster
 
     logger.info("=" * 40 + " ML 매출 예측 " + "=" * 40)
-    forecaster = DemandForecaster()
+    forecaster = DemandForecaster(retrain=retrain, use_cache=use_cache)
     result = forecaster.run()
     print(result)
 
 
-def trend_collect() -> None:
+def trend_collect(full: bool = False) -> None:
     """검색 트렌드 수집 (Google Trends + Naver DataLab)"""
     from .trend_collector import TrendCollector
 
     logger.info("=" * 40 + " 트렌드 수집 " + "=" * 40)
-    collector = TrendCollector()
+    collector = TrendCollector(full=full)
     result = collector.run()
     print(result)
 
 
-def trend() -> None:
+def trend(rebuild_peaks: bool = False) -> None:
     """트렌드-매출 상관 분석"""
     from .trend_analyzer import TrendAnalyzer
 
     logger.info("=" * 40 + " 트렌드 분석 " + "=" * 40)
     analyzer = TrendAnalyzer()
-    result = analyzer.run()
+    result = analyzer.run(rebuild_peaks=rebuild_peaks)
     print(result)
 
 
-def dashboard() -> None:
-    """KPI 통합 대시보드 HTML 생성"""
+def dashboard(incremental: bool = True, chart_format: str = "png") -> None:
+    """KPI 통합 대시보드 HTML 생성 (incremental: 입력이 바뀐 섹션만 재생성, chart_format: png | svg)"""
     from .dashboard_generator import DashboardGenerator
 
     logger.info("=" * 40 + " 대시보드 생성 " + "=" * 40)
-    generator = DashboardGenerator()
+    generator = DashboardGenerator(incremental=incremental, chart_format=chart_format)
     result = generator.run()
     print(result)
 
@@ -200,6 +228,11 @@ Examples:
   python -m crawlers.main --all                   전체 파이프라인
   python -m crawlers.main --crawl                 크롤링 + 적재만
   python -m crawlers.main --crawl --source naver  네이버만 크롤링
+  python -m crawlers.main --crawl --concurrent    쿠팡/네이버 동시 크롤링
+  python -m crawlers.main --crawl --depth 200     키워드당 200위까지 딥 랭킹
+  python -m crawlers.main --crawl --no-cache      HTTP 캐시 무시
+  python -m crawlers.main --dashboard --no-cache  차트/섹션 캐시 무시 (전체 다시 생성)
+  python -m crawlers.main --snapshot --forecast   로컬 스냅샷(증분 동기화) 기반 분석
   python -m crawlers.main --analyze               분석 + 시각화만
   python -m crawlers.main --report weekly         주간 요약 리포트
   python -m crawlers.main --report monthly        월간 요약 리포트 + 차트
@@ -209,6 +242,7 @@ Examples:
   python -m crawlers.main --trend-collect          검색 트렌드 수집
   python -m crawlers.main --trend                  트렌드-매출 상관 분석
   python -m crawlers.main --dashboard              KPI 통합 대시보드 HTML
+  python -m crawlers.main --dashboard --dashboard-charts svg  차트를 인라인 SVG로 (경량 HTML)
   python -m crawlers.main --ad-perf                광고 퍼포먼스 분석
         """,
     )
@@ -216,13 +250,39 @@ Examples:
     parser.add_argument("--crawl", action="store_true", help="크롤링 + Supabase 적재")
     parser.add_argument("--analyze", action="store_true", help="Supabase 데이터 분석 + 시각화")
     parser.add_argument("--source", choices=["coupang", "naver"], help="특정 소스만 크롤링")
+    parser.add_argument("--depth", type=int, help="딥 랭킹 모드: 키워드당 추적할 최대 순위 (예: 100, 200)")
+    parser.add_argument("--no-cache", action="store_true", help="크롤러 HTTP 응답 캐시 / 차트 이미지 캐시 / 대시보드 섹션 캐시 / 예측 feature 캐시 사용 안 함 (항상 새로 요청/생성)")
+    parser.add_argument(
+        "--snapshot",
+        nargs="?",
+        const=str(SNAPSHOT_DIR),
+        metavar="DIR",
+        help="분석 데이터를 로컬 Parquet 스냅샷에서 조회 (실행 시 증분 동기화, 오프라인 가능)",
+    )
+    parser.add_argument("--concurrent", action="store_true", help="asyncio 동시 크롤링 (소스별 동시성 제한 + 토큰 버킷)")
     parser.add_argument("--report", choices=["weekly", "monthly"], help="주간/월간 요약 리포트 생성")
     parser.add_argument("--insight", action="store_true", help="비즈니스 인사이트 분석 (채널 믹스, 경쟁사 상관, 요일 패턴)")
     parser.add_argument("--abtest", action="store_true", help="A/B 테스트 분석 (통계 검정 + 비즈니스 해석)")
     parser.add_argument("--forecast", action="store_true", help="ML 매출 예측 (Random Forest + Feature Importance)")
+    parser.add_argument(
+        "--retrain", action="store_true",
+        help="--forecast 저장 모델(output/models/) 무시하고 전체 재학습 (기본: 재사용/warm start, 드리프트·주기 조건 시 재학습)",
+    )
     parser.add_argument("--trend-collect", action="store_true", help="검색 트렌드 수집 (Google Trends + Naver DataLab)")
+    parser.add_argument(
+        "--trend-full", action="store_true",
+        help="--trend-collect 시 키워드별 워터마크(output/trend_watermarks.json) 무시하고 최근 30일 전체 재수집",
+    )
     parser.add_argument("--trend", action="store_true", help="트렌드-매출 상관 분석 (Pearson/Spearman + 선행 지표 + 성수기)")
+    parser.add_argument(
+        "--peak-rebuild", action="store_true",
+        help="--trend의 누적 성수기 상태(output/peak_state.json)를 search_trends 전체 이력으로 재구축",
+    )
     parser.add_argument("--dashboard", action="store_true", help="KPI 통합 대시보드 HTML 생성 (output/dashboard.html)")
+    parser.add_argument(
+        "--dashboard-charts", choices=["png", "svg"], default="png",
+        help="대시보드 차트 형식: png (matplotlib 이미지, 기본) | svg (인라인 벡터, 빠르고 파일 작음)",
+    )
     parser.add_argument("--ad-perf", action="store_true", help="광고 퍼포먼스 분석 (ROAS 효율 + 예산 재배분 + 기회 탐지)")
 
     args = parser.parse_args()
@@ -235,12 +295,29 @@ Examples:
     load_dotenv()
     logger.info("환경 변수 로드 완료")
 
+    if args.no_cache:
+        from .chart_renderer import use_chart_cache
+
+        use_chart_cache(False)
+
     # 크롤링
     if args.all or args.crawl:
-        records = crawl(source=args.source)
+        records = crawl(
+            source=args.source, concurrent=args.concurrent, depth=args.depth, use_cache=not args.no_cache
+        )
         stats = load_to_supabase(records)
         print(f"\n[적재] 적재 결과: 성공 {stats['success']}건 / 실패 {stats['failed']}건 / 전체 {stats['total']}건")
 
+    # 로컬 스냅샷 동기화 → 이후 분석은 스냅샷에서 조회
+    if args.snapshot:
+        snapshot(args.snapshot)
+
+    # 매출 데이터를 쓰는 분석이 여럿이면 가장 넓은 기간(예측 60일)으로 한 번만 조회 → 나머지는 캐시에서 잘라 사용
+    if args.forecast and any((args.insight, args.trend, args.dashboard, args.ad_perf)):
+        from .demand_forecaster import FORECAST_DAYS
+
+        SupabaseLoader().load_frame("brand_daily_sales", days=FORECAST_DAYS)
+
     # 분석
     if args.all or args.analyze:
         analyze()
@@ -259,19 +336,19 @@ Examples:
 
     # ML 매출 예측
     if args.forecast:
-        forecast()
+        forecast(retrain=args.retrain, use_cache=not args.no_cache)
 
     # 검색 트렌드 수집
     if args.trend_collect:
-        trend_collect()
+        trend_collect(full=args.trend_full)
 
     # 트렌드-매출 상관 분석
     if args.trend:
-        trend()
+        trend(rebuild_peaks=args.peak_rebuild)
 
     # KPI 통합 대시보드
     if args.dashboard:
-        dashboard()
+        dashboard(incremental=not args.no_cache, chart_format=args.dashboard_charts)
 
     # 광고 퍼포먼스 분석
     if args.ad_perf:
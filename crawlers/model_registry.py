@@ -0,0 +1,53 @@
+"""
+학습 모델 레지스트리 - 모델별 디렉토리에 joblib 모델 + 메타데이터(JSON) 보관
+메타데이터에 feature 구성/학습 데이터 해시와 학습 구간을 남겨, 다음 실행에서
+재사용 / warm start 추가 학습 / 전체 재학습 중 무엇을 할지 판단할 수 있게 한다.
+"""
+
+import json
+import logging
+import os
+import pickle
+from pathlib import Path
+
+import joblib
+
+from .config import MODEL_REGISTRY_DIR
+
+logger = logging.getLogger(__name__)
+
+
+class ModelRegistry:
+    """<root>/<name>/model.joblib + meta.json"""
+
+    def __init__(self, root: Path | str = MODEL_REGISTRY_DIR):
+        self.root = Path(root)
+
+    def _dir(self, name: str) -> Path:
+        return self.root / name
+
+    def load(self, name: str) -> tuple[object | None, dict]:
+        """저장된 (모델, 메타데이터). 없거나 읽기 실패 시 (None, {})"""
+        directory = self._dir(name)
+        try:
+            meta = json.loads((directory / "meta.json").read_text(encoding="utf-8"))
+            model = joblib.load(directory / "model.joblib")
+        except FileNotFoundError:
+            return None, {}
+        except (OSError, ValueError, EOFError, pickle.UnpicklingError, AttributeError, ImportError) as e:
+            # 손상 파일 / 라이브러리 버전 불일치 → 새로 학습
+            logger.warning(f"[모델] {name} 로드 실패 → 새로 학습: {e}")
+            return None, {}
+        return model, meta
+
+    def save(self, name: str, model, meta: dict) -> None:
+        directory = self._dir(name)
+        directory.mkdir(parents=True, exist_ok=True)
+
+        tmp_model = directory / "model.joblib.tmp"
+        joblib.dump(model, tmp_model, compress=3)
+        os.replace(tmp_model, directory / "model.joblib")
+
+        tmp_meta = directory / "meta.json.tmp"
+        tmp_meta.write_text(json.dumps(meta, ensure_ascii=False, indent=2), encoding="utf-8")
+        os.replace(tmp_meta, directory / "meta.json")
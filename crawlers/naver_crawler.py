@@ -5,28 +5,39 @@
 
 import logging
 import os
-import time
 from datetime import date
 
 import requests
-
-from .config import BRAND_MAPPING, MAX_RESULTS_PER_KEYWORD, REQUEST_DELAY_MAX, REQUEST_DELAY_MIN
+from requests.adapters import HTTPAdapter
+
+from .brand_matcher import UNKNOWN_BRAND, get_brand_matcher
+from .config import (
+    DEEP_RANK_PAGE_WORKERS,
+    MAX_RESULTS_PER_KEYWORD,
+    NAVER_MAX_START,
+    NAVER_PAGE_SIZE,
+)
+from .deep_rank import fetch_pages, page_offsets, stitch_ranked
+from .http_cache import HttpCache, cached_get
+from .rate_limiter import get_rate_limiter
 
 logger = logging.getLogger(__name__)
 
-import random
-
 MAX_RETRIES = 3
 
 
 class NaverShoppingCrawler:
     """네이버 쇼핑 검색 API 크롤러"""
 
-    def __init__(self):
+    def __init__(self, use_cache: bool = True):
         self.client_id = os.getenv("NAVER_CLIENT_ID", "")
         self.client_secret = os.getenv("NAVER_CLIENT_SECRET", "")
         self.api_url = "https://openapi.naver.com/v1/search/shop.json"
         self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(pool_maxsize=DEEP_RANK_PAGE_WORKERS))
+        self.rate_limiter = get_rate_limiter("naver")
+        self.brand_matcher = get_brand_matcher()
+        self.cache = HttpCache() if use_cache else None
 
         if not self.client_id or not self.client_secret:
             logger.warning("[네이버] NAVER_CLIENT_ID / NAVER_CLIENT_SECRET 미설정")
@@ -38,66 +49,91 @@ class NaverShoppingCrawler:
         }
 
     def _identify_brand(self, product_name: str) -> str:
-        for keyword, brand in BRAND_MAPPING.items():
-            if keyword in product_name:
-                return brand
-        return "기타"
-
-    def search(self, keyword: str, category: str) -> list[dict]:
-        """네이버 쇼핑 API로 검색 후 상품 정보 반환"""
-        logger.info(f"[네이버] 검색: '{keyword}' (카테고리: {category})")
-
-        params = {
-            "query": keyword,
-            "display": MAX_RESULTS_PER_KEYWORD,
-            "sort": "sim",
-        }
+        return self.brand_matcher.match(product_name)
 
+    def _request(self, params: dict, keyword: str) -> dict | None:
         for attempt in range(1, MAX_RETRIES + 1):
             try:
-                delay = random.uniform(REQUEST_DELAY_MIN, REQUEST_DELAY_MAX)
-                time.sleep(delay)
-
-                response = self.session.get(
+                response = cached_get(
+                    self.session,
                     self.api_url,
-                    headers=self._get_headers(),
                     params=params,
+                    headers=self._get_headers(),
                     timeout=10,
+                    rate_limiter=self.rate_limiter,
+                    cache=self.cache,
                 )
                 response.raise_for_status()
-                data = response.json()
-                break
+                return response.json()
             except requests.RequestException as e:
                 logger.warning(f"[네이버] API 요청 실패 (시도 {attempt}/{MAX_RETRIES}): {e}")
                 if attempt == MAX_RETRIES:
                     logger.error(f"[네이버] 최대 재시도 초과: '{keyword}'")
-                    return []
+                    return None
+        return None
 
-        items = data.get("items", [])
+    def _parse_items(self, items: list[dict], category: str, offset: int = 0) -> list[dict]:
         today = date.today().isoformat()
         results = []
 
-        for rank, item in enumerate(items, start=1):
+        for rank, item in enumerate(items, start=offset + 1):
             title = item.get("title", "").replace("<b>", "").replace("</b>", "")
             price = int(item.get("lprice", 0))
             mall_name = item.get("mallName", "")
+            brand = self._identify_brand(title)
 
             results.append({
                 "crawl_date": today,
                 "source": "naver",
                 "category": category,
                 "product_name": title[:200],
-                "brand": self._identify_brand(title) if self._identify_brand(title) != "기타" else mall_name,
+                "brand": brand if brand != UNKNOWN_BRAND else mall_name,
                 "price": price,
                 "ranking": rank,
                 "review_count": 0,  # 네이버 검색 API에서 리뷰 수 미제공
                 "avg_rating": None,
             })
 
+        return results
+
+    def search(self, keyword: str, category: str, depth: int | None = None) -> list[dict]:
+        """네이버 쇼핑 API로 검색 후 상품 정보 반환
+
+        depth가 MAX_RESULTS_PER_KEYWORD보다 크면 start/display=100 페이지를 병렬 조회해
+        depth위까지 순위를 이어붙인다 (딥 랭킹 모드, API 제한상 start 최대 1000).
+        """
+        logger.info(f"[네이버] 검색: '{keyword}' (카테고리: {category})")
+
+        if depth is None or depth <= MAX_RESULTS_PER_KEYWORD:
+            params = {
+                "query": keyword,
+                "display": MAX_RESULTS_PER_KEYWORD,
+                "sort": "sim",
+            }
+            data = self._request(params, keyword)
+            if data is None:
+                return []
+            results = self._parse_items(data.get("items", []), category)
+        else:
+            def fetch_page(offset: int) -> list[dict]:
+                params = {
+                    "query": keyword,
+                    "display": min(NAVER_PAGE_SIZE, depth - offset),
+                    "start": offset + 1,
+                    "sort": "sim",
+                }
+                data = self._request(params, keyword)
+                if data is None:
+                    return []
+                return self._parse_items(data.get("items", []), category, offset=offset)
+
+            offsets = page_offsets(depth, NAVER_PAGE_SIZE, max_offset=NAVER_MAX_START - 1)
+            results = stitch_ranked(fetch_pages(fetch_page, offsets), depth)
+
         logger.info(f"[네이버] '{keyword}' → {len(results)}개 상품 수집")
         return results
 
-    def crawl_all(self, targets: list[dict]) -> list[dict]:
+    def crawl_all(self, targets: list[dict], depth: int | None = None) -> list[dict]:
         """설정된 모든 타겟에 대해 크롤링 실행"""
         if not self.client_id or not self.client_secret:
             logger.error("[네이버] API 키가 설정되지 않았습니다. .env 파일을 확인하세요.")
@@ -105,7 +141,7 @@ class NaverShoppingCrawler:
 
         all_results = []
         for target in targets:
-            results = self.search(target["keyword"], target["category"])
+            results = self.search(target["keyword"], target["category"], depth=depth)
             all_results.extend(results)
 
         logger.info(f"[네이버] 전체 수집 완료: {len(all_results)}개 상품")
@@ -0,0 +1,275 @@
+"""
+성수기 탐지 - 분석 기간 일괄 탐지 + 누적 이력 스트리밍 탐지
+- peak_periods: 일별 평균 트렌드에서 기준선 초과일을 갭 허용 연속 기간으로 묶는다 (벡터화, 분석기/대시보드 공용)
+- PeakDetector: 브랜드별 P² 분위수 스케치 + 진행 중 성수기 구간을 JSON 상태로 보관하고
+  마지막 처리일 이후의 새 행만 반영한다 (실행당 O(새 행), 다년 이력도 전체 재조회 없이 추적).
+"""
+
+import json
+import logging
+import os
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from .config import PEAK_GAP_DAYS, PEAK_QUANTILE, PEAK_STATE_PATH
+
+logger = logging.getLogger(__name__)
+
+STATE_VERSION = 1
+
+
+def daily_trend_avg(df_trend: pd.DataFrame) -> pd.DataFrame:
+    """search_trends 행 → (일자 x 브랜드) 일별 평균 트렌드. 관측 없는 날짜/브랜드는 NaN"""
+    if df_trend.empty:
+        return pd.DataFrame()
+    return df_trend.pivot_table(index="trend_date", columns="brand", values="trend_value", aggfunc="mean").sort_index()
+
+
+def peak_periods(daily_avg: pd.Series, threshold: float, gap_days: int = PEAK_GAP_DAYS) -> list[dict]:
+    """기준선 초과일을 gap_days일 간격까지 이어 붙인 성수기 기간 목록
+
+    avg_val은 기간(start~end) 안 관측일 전체(기준선 이하 갭 포함)의 평균.
+    반환: [{"start", "end", "avg_val", "days"}] 날짜 순
+    """
+    daily_avg = daily_avg.dropna()
+    is_peak = (daily_avg > threshold).to_numpy()
+    if not is_peak.any():
+        return []
+
+    dates = daily_avg.index[is_peak]
+    gaps = np.diff(dates.to_numpy()) / np.timedelta64(1, "D")
+    breaks = np.flatnonzero(gaps > gap_days)
+    starts = dates[np.r_[0, breaks + 1]]
+    ends = dates[np.r_[breaks, len(dates) - 1]]
+
+    # 기간 평균 = 누적합 차 / 관측일 수
+    csum = np.r_[0.0, np.cumsum(daily_avg.to_numpy(dtype=float))]
+    i0 = daily_avg.index.get_indexer(starts)
+    i1 = daily_avg.index.get_indexer(ends) + 1
+    avg_vals = (csum[i1] - csum[i0]) / (i1 - i0)
+
+    return [
+        {"start": start, "end": end, "avg_val": float(avg), "days": (end - start).days + 1}
+        for start, end, avg in zip(starts, ends, avg_vals)
+    ]
+
+
+class P2Quantile:
+    """P² 알고리즘 스트리밍 분위수 추정 (Jain & Chlamtac, 1985) - 마커 5개, 관측당 O(1)
+
+    관측 5개 이하일 때는 (마커가 아직 움직이지 않았으므로) 보관한 값으로 정확한 분위수(선형 보간)를 낸다.
+    """
+
+    def __init__(self, p: float = PEAK_QUANTILE):
+        self.p = p
+        self.count = 0
+        self.heights: list[float] = []
+        self.positions = [1, 2, 3, 4, 5]
+        self.desired = [1, 1 + 2 * p, 1 + 4 * p, 3 + 2 * p, 5]
+        self.increments = [0, p / 2, p, (1 + p) / 2, 1]
+
+    def add(self, x: float) -> None:
+        self.count += 1
+        q = self.heights
+        if self.count <= 5:
+            q.append(x)
+            q.sort()
+            return
+
+        if x < q[0]:
+            q[0] = x
+            k = 0
+        elif x >= q[4]:
+            q[4] = x
+            k = 3
+        else:
+            k = next(i for i in range(4) if q[i] <= x < q[i + 1])
+
+        n = self.positions
+        for i in range(k + 1, 5):
+            n[i] += 1
+        for i in range(5):
+            self.desired[i] += self.increments[i]
+
+        for i in range(1, 4):
+            d = self.desired[i] - n[i]
+            if (d >= 1 and n[i + 1] - n[i] > 1) or (d <= -1 and n[i - 1] - n[i] < -1):
+                d = 1 if d > 0 else -1
+                candidate = self._parabolic(i, d)
+                if not q[i - 1] < candidate < q[i + 1]:
+                    candidate = q[i] + d * (q[i + d] - q[i]) / (n[i + d] - n[i])
+                q[i] = candidate
+                n[i] += d
+
+    def _parabolic(self, i: int, d: int) -> float:
+        q, n = self.heights, self.positions
+        return q[i] + d / (n[i + 1] - n[i - 1]) * (
+            (n[i] - n[i - 1] + d) * (q[i + 1] - q[i]) / (n[i + 1] - n[i])
+            + (n[i + 1] - n[i] - d) * (q[i] - q[i - 1]) / (n[i] - n[i - 1])
+        )
+
+    def value(self) -> float:
+        if self.count == 0:
+            return float("nan")
+        if self.count <= 5:
+            return float(np.quantile(self.heights, self.p))
+        return self.heights[2]
+
+    def to_dict(self) -> dict:
+        return {"count": self.count, "heights": self.heights, "positions": self.positions, "desired": self.desired}
+
+    @classmethod
+    def from_dict(cls, p: float, state: dict) -> "P2Quantile":
+        sketch = cls(p)
+        sketch.count = state["count"]
+        sketch.heights = list(state["heights"])
+        sketch.positions = list(state["positions"])
+        sketch.desired = list(state["desired"])
+        return sketch
+
+
+class PeakDetector:
+    """브랜드별 누적 이력 성수기 스트리밍 탐지기
+
+    하루 = 해당 일 search_trends 행의 평균. 각 날은 그 시점까지의 분위수 추정치로 판정한다
+    (사후에 전체 기간 분위수로 다시 판정하지 않음 - 분석 기간 리포트의 peak_periods와 다를 수 있다).
+    배치 내 가장 최근 날짜는 소스별 수집이 덜 끝났을 수 있어 확정하지 않고 다음 실행에서 다시 받는다.
+    마지막 처리일 이전 날짜의 행(과거 값 재수집/보정)은 반영하지 않는다 → 필요 시 rebuild.
+    """
+
+    def __init__(
+        self,
+        state_path: Path | str = PEAK_STATE_PATH,
+        quantile: float = PEAK_QUANTILE,
+        gap_days: int = PEAK_GAP_DAYS,
+    ):
+        self.state_path = Path(state_path)
+        self.quantile = quantile
+        self.gap_days = gap_days
+        self.brands: dict[str, dict] = {}
+        self.sketches: dict[str, P2Quantile] = {}
+        self._load()
+
+    # ---------- 상태 저장 ----------
+
+    def _load(self) -> None:
+        try:
+            state = json.loads(self.state_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if (state.get("version"), state.get("quantile"), state.get("gap_days")) != (
+            STATE_VERSION, self.quantile, self.gap_days,
+        ):
+            logger.info("[성수기] 누적 상태의 설정(분위수/갭)이 달라 새로 시작합니다")
+            return
+        for brand, entry in state["brands"].items():
+            self.sketches[brand] = P2Quantile.from_dict(self.quantile, entry.pop("sketch"))
+            self.brands[brand] = entry
+
+    def save(self) -> None:
+        state = {
+            "version": STATE_VERSION,
+            "quantile": self.quantile,
+            "gap_days": self.gap_days,
+            "brands": {
+                brand: {"sketch": self.sketches[brand].to_dict(), **entry} for brand, entry in self.brands.items()
+            },
+        }
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.state_path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(state, ensure_ascii=False, indent=2), encoding="utf-8")
+        os.replace(tmp, self.state_path)
+
+    def reset(self) -> None:
+        self.brands.clear()
+        self.sketches.clear()
+
+    # ---------- 갱신 ----------
+
+    def last_date(self, brand: str) -> pd.Timestamp | None:
+        entry = self.brands.get(brand)
+        return pd.Timestamp(entry["last_date"]) if entry else None
+
+    def update(self, df_trend: pd.DataFrame) -> dict[str, int]:
+        """새 search_trends 행 반영. 반환: {brand: 새로 확정한 일수}"""
+        if df_trend.empty:
+            return {}
+        # 마지막 처리일 이후 행만 집계 (브랜드별 워터마크)
+        watermark = pd.to_datetime(df_trend["brand"].map({brand: entry["last_date"] for brand, entry in self.brands.items()}))
+        fresh = df_trend[watermark.isna() | (df_trend["trend_date"] > watermark)]
+        daily = daily_trend_avg(fresh)
+        if daily.empty:
+            return {}
+
+        # 가장 최근 날짜는 미확정 (다음 배치에서 다시 받음)
+        daily = daily.iloc[:-1]
+        processed = {}
+        for brand in daily.columns:
+            values = daily[brand].dropna()
+            if values.empty:
+                continue
+            entry = self.brands.setdefault(
+                brand, {"first_date": None, "last_date": None, "days": 0, "open": None, "periods": []}
+            )
+            sketch = self.sketches.setdefault(brand, P2Quantile(self.quantile))
+            for date, value in values.items():
+                self._observe(entry, sketch, date, float(value))
+            processed[brand] = len(values)
+        return processed
+
+    def _observe(self, entry: dict, sketch: P2Quantile, date: pd.Timestamp, value: float) -> None:
+        """하루치 값 반영: 분위수 갱신 → 기준선 초과 판정 → 진행 중 구간 연장/종료"""
+        sketch.add(value)
+        is_peak = value > sketch.value()
+        entry["last_date"] = date.date().isoformat()
+        entry["first_date"] = entry["first_date"] or entry["last_date"]
+        entry["days"] += 1
+
+        current = entry["open"]
+        if current and (date - pd.Timestamp(current["end"])).days > self.gap_days:
+            entry["periods"].append(self._close(current))
+            current = entry["open"] = None
+
+        if is_peak and current:
+            # 갭 동안의 기준선 이하 날도 기간 평균에 포함
+            current["sum"] += current.pop("gap_sum") + value
+            current["count"] += current.pop("gap_count") + 1
+            current.update({"end": entry["last_date"], "gap_sum": 0.0, "gap_count": 0})
+        elif is_peak:
+            entry["open"] = {
+                "start": entry["last_date"], "end": entry["last_date"],
+                "sum": value, "count": 1, "gap_sum": 0.0, "gap_count": 0,
+            }
+        elif current:
+            current["gap_sum"] += value
+            current["gap_count"] += 1
+
+    @staticmethod
+    def _close(current: dict) -> dict:
+        start, end = pd.Timestamp(current["start"]), pd.Timestamp(current["end"])
+        return {
+            "start": current["start"],
+            "end": current["end"],
+            "avg_val": current["sum"] / current["count"],
+            "days": (end - start).days + 1,
+        }
+
+    # ---------- 조회 ----------
+
+    def summary(self, brand: str) -> dict | None:
+        """{"since", "last_date", "days", "threshold", "periods": 종료된 기간, "open": 진행 중 기간 | None}"""
+        entry = self.brands.get(brand)
+        if not entry:
+            return None
+        current = entry["open"]
+        return {
+            "since": entry["first_date"],
+            "last_date": entry["last_date"],
+            "days": entry["days"],
+            "threshold": self.sketches[brand].value(),
+            "periods": entry["periods"],
+            "open": self._close(current) if current else None,
+        }
+
@@ -0,0 +1,143 @@
+"""
+호스트별 적응형 요청 속도 제어 (AIMD)
+응답 코드 / Retry-After 헤더 / 응답 지연을 보고 초당 요청 수를 자동 조절.
+쿠팡 크롤러, 네이버 쇼핑 API, 트렌드 수집기가 같은 호스트에 대해 하나의 리미터를 공유한다.
+"""
+
+import logging
+import threading
+import time
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+
+from .config import RATE_LIMIT_DEFAULTS, RATE_LIMITS
+
+logger = logging.getLogger(__name__)
+
+THROTTLE_STATUS = {429, 503}
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Retry-After 헤더(초 또는 HTTP-date) → 대기 초"""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=UTC)
+    return max(0.0, (retry_at - datetime.now(UTC)).total_seconds())
+
+
+class AdaptiveRateLimiter:
+    """토큰 버킷 + AIMD 속도 조절 (스레드 안전)
+
+    - 정상 응답 + 목표 지연 이내: 속도 가산 증가 (additive increase)
+    - 정상 응답이지만 느림: 속도 소폭 감소
+    - 429/503: 속도 절반 (multiplicative decrease) + Retry-After 동안 전체 대기
+    - 5xx / 연결 오류: 속도 절반
+    """
+
+    def __init__(
+        self,
+        name: str,
+        initial: float,
+        min_rate: float,
+        max_rate: float,
+        burst: int = 1,
+        latency_target: float = 2.0,
+        increase_step: float = 0.05,
+        decrease_factor: float = 0.5,
+        slow_factor: float = 0.9,
+    ):
+        self.name = name
+        self.rate = initial
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.burst = burst
+        self.latency_target = latency_target
+        self.increase_step = increase_step
+        self.decrease_factor = decrease_factor
+        self.slow_factor = slow_factor
+
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self.lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def acquire(self) -> float:
+        """요청 1건 허가를 받을 때까지 블로킹. 대기한 시간(초) 반환"""
+        waited = 0.0
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                if now < self.blocked_until:
+                    wait = self.blocked_until - now
+                else:
+                    self._refill(now)
+                    if self.tokens >= 1:
+                        self.tokens -= 1
+                        return waited
+                    wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+            waited += wait
+
+    def _set_rate(self, rate: float) -> None:
+        self._refill(time.monotonic())
+        self.rate = min(self.max_rate, max(self.min_rate, rate))
+
+    def record(self, status_code: int, latency: float, retry_after: str | None = None) -> None:
+        """응답 결과를 반영해 속도 조절"""
+        with self.lock:
+            if status_code in THROTTLE_STATUS:
+                self._set_rate(self.rate * self.decrease_factor)
+                cooldown = parse_retry_after(retry_after)
+                if cooldown is None:
+                    cooldown = 1 / self.rate
+                self.blocked_until = max(self.blocked_until, time.monotonic() + cooldown)
+                self.tokens = 0.0
+                logger.warning(
+                    f"[속도 제어] {self.name}: HTTP {status_code} → {self.rate:.2f} req/s, {cooldown:.1f}초 대기"
+                )
+            elif status_code >= 500:
+                self._set_rate(self.rate * self.decrease_factor)
+            elif latency > self.latency_target:
+                self._set_rate(self.rate * self.slow_factor)
+            elif status_code < 400:
+                self._set_rate(self.rate + self.increase_step)
+
+    def record_response(self, response) -> None:
+        """requests.Response 기반 기록 (status / elapsed / Retry-After)"""
+        self.record(
+            response.status_code,
+            response.elapsed.total_seconds(),
+            response.headers.get("Retry-After"),
+        )
+
+    def record_error(self) -> None:
+        """연결 오류 / 타임아웃 등 응답 없는 실패"""
+        with self.lock:
+            self._set_rate(self.rate * self.decrease_factor)
+
+
+_limiters: dict[str, AdaptiveRateLimiter] = {}
+_registry_lock = threading.Lock()
+
+
+def get_rate_limiter(name: str) -> AdaptiveRateLimiter:
+    """호스트 이름별 공유 리미터 반환 (config.RATE_LIMITS 설정 사용)"""
+    with _registry_lock:
+        limiter = _limiters.get(name)
+        if limiter is None:
+            settings = {**RATE_LIMIT_DEFAULTS, **RATE_LIMITS.get(name, {})}
+            limiter = AdaptiveRateLimiter(name, **settings)
+            _limiters[name] = limiter
+        return limiter
@@ -13,6 +13,7 @@ import matplotlib.pyplot as plt
 import matplotlib.font_manager as fm
 import pandas as pd
 
+from .chart_renderer import ChartJob, render_charts
 from .supabase_loader import SupabaseLoader
 
 logger = logging.getLogger(__name__)
@@ -163,16 +164,16 @@ class MonthlyReportGenerator:
             lines.append("")
 
         # 차트 생성
-        chart_path = self._plot_monthly_bar(df, year, month)
+        job = ChartJob("monthly_report.png", self._plot_monthly_bar, {"df": df, "year": year, "month": month}, "월간 차트")
+        chart_path = render_charts([job], label="리포트", output_dir=OUTPUT_DIR)[0].path
         if chart_path:
             lines.append(f"[차트] {chart_path}")
 
         return "\n".join(lines)
 
-    def _plot_monthly_bar(self, df: pd.DataFrame, year: int, month: int) -> str | None:
+    @staticmethod
+    def _plot_monthly_bar(df: pd.DataFrame, year: int, month: int) -> plt.Figure | None:
         """브랜드별 월간 매출 bar chart"""
-        OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-
         fig, ax = plt.subplots(figsize=(10, 6))
 
         brands = df["brand"].tolist()
@@ -199,8 +200,4 @@ class MonthlyReportGenerator:
         ax.grid(True, axis="y", alpha=0.3)
         plt.tight_layout()
 
-        path = OUTPUT_DIR / "monthly_report.png"
-        fig.savefig(path, dpi=150, bbox_inches="tight")
-        plt.close(fig)
-        logger.info(f"[리포트] 월간 차트 저장: {path}")
-        return str(path)
+        return fig
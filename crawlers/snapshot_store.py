@@ -0,0 +1,151 @@
+"""
+로컬 스냅샷 저장소 - Supabase 테이블을 월별 파티션 Parquet으로 보관
+증분 동기화(updated_at / 날짜 워터마크)로 매 실행마다 변경분만 내려받고,
+분석기는 컬럼/기간 조건을 Parquet 읽기에 넘겨 필요한 파티션·컬럼만 읽는다 (오프라인 분석 가능).
+"""
+
+import json
+import logging
+import os
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+import pandas as pd
+import requests
+
+try:
+    import pyarrow  # pandas Parquet 엔진
+except ImportError:  # pragma: no cover - pyarrow 미설치 환경
+    pyarrow = None
+
+from .config import SNAPSHOT_DIR, SNAPSHOT_OVERLAP_DAYS
+from .supabase_loader import FRAME_TABLES, build_frame
+
+logger = logging.getLogger(__name__)
+
+PARTITION_COLUMN = "month"
+
+
+class SnapshotStore:
+    """테이블별 디렉토리 / month=YYYY-MM 파티션 Parquet 스냅샷
+
+    증분 기준:
+    - updated_column이 있는 테이블(brand_daily_sales): updated_at >= 마지막 워터마크
+    - 나머지: 날짜 >= 마지막 날짜 - SNAPSHOT_OVERLAP_DAYS (upsert로 갱신된 최근 행 재조회)
+    같은 id는 나중에 받은 행으로 교체한다. 원격에서 삭제된 행은 반영하지 않는다.
+    """
+
+    def __init__(self, root: Path | str = SNAPSHOT_DIR):
+        if pyarrow is None:
+            raise ImportError("스냅샷 저장소에는 pyarrow가 필요합니다. pip install pyarrow")
+        self.root = Path(root)
+
+    def _table_dir(self, table: str) -> Path:
+        return self.root / table
+
+    def _read_meta(self, table: str) -> dict:
+        try:
+            return json.loads((self._table_dir(table) / "_meta.json").read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+
+    def _write_meta(self, table: str, meta: dict) -> None:
+        path = self._table_dir(table) / "_meta.json"
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(meta, ensure_ascii=False, indent=2), encoding="utf-8")
+        os.replace(tmp, path)
+
+    def has_table(self, table: str) -> bool:
+        return any(self._table_dir(table).glob(f"{PARTITION_COLUMN}=*/*.parquet"))
+
+    # ── 동기화 ──────────────────────────────────────────────
+
+    def sync(self, loader, tables: list[str] | None = None) -> dict[str, int]:
+        """Supabase → 로컬 증분 동기화. 테이블별 내려받은 행 수 반환
+
+        조회 실패 테이블은 경고 후 기존 스냅샷을 유지한다 (오프라인 실행 대응).
+        """
+        synced = {}
+        for table in tables or list(FRAME_TABLES):
+            try:
+                synced[table] = self._sync_table(loader, table)
+            except requests.RequestException as e:
+                logger.warning(f"[스냅샷] {table} 동기화 실패 → 로컬 스냅샷 사용: {e}")
+                synced[table] = 0
+        return synced
+
+    def _sync_table(self, loader, table: str) -> int:
+        spec = FRAME_TABLES[table]
+        meta = self._read_meta(table)
+        updated_column = spec.get("updated_column")
+
+        filter_column, since = None, None
+        if meta.get("watermark") and self.has_table(table):
+            if updated_column:
+                filter_column, since = updated_column, meta["watermark"]
+            else:
+                overlap_start = date.fromisoformat(meta["watermark"]) - timedelta(days=SNAPSHOT_OVERLAP_DAYS)
+                filter_column, since = spec["date_column"], overlap_start.isoformat()
+
+        rows = [row for chunk in loader.iter_table(table, date_column=filter_column, since=since) for row in chunk]
+        if not rows:
+            logger.info(f"[스냅샷] {table}: 변경 없음")
+            return 0
+
+        delta = build_frame(table, rows)
+        self._merge(table, delta)
+
+        if updated_column:
+            watermark = max(row[updated_column] for row in rows if row.get(updated_column))
+        else:
+            watermark = delta[spec["date_column"]].max().date().isoformat()
+            if meta.get("watermark"):
+                watermark = max(watermark, meta["watermark"])
+        self._write_meta(table, {"watermark": watermark, "synced_at": datetime.now().isoformat(timespec="seconds")})
+
+        mode = "증분" if since else "전체"
+        logger.info(f"[스냅샷] {table}: {mode} 동기화 {len(rows)}건 (워터마크 {watermark})")
+        return len(rows)
+
+    def _merge(self, table: str, delta: pd.DataFrame) -> None:
+        """변경분을 월 파티션별로 기존 파일과 병합 (id 기준 최신 행 유지)"""
+        date_column = FRAME_TABLES[table]["date_column"]
+        months = delta[date_column].dt.strftime("%Y-%m")
+
+        for month, part in delta.groupby(months, sort=False):
+            part_dir = self._table_dir(table) / f"{PARTITION_COLUMN}={month}"
+            part_dir.mkdir(parents=True, exist_ok=True)
+            path = part_dir / "part.parquet"
+            if path.exists():
+                part = pd.concat([pd.read_parquet(path), part], ignore_index=True)
+                part = part.drop_duplicates("id", keep="last")
+            part = part.sort_values("id", ignore_index=True)
+
+            tmp = path.with_suffix(".tmp")
+            part.to_parquet(tmp, index=False)
+            os.replace(tmp, path)
+
+    # ── 조회 ────────────────────────────────────────────────
+
+    def latest_date(self, table: str) -> date | None:
+        """스냅샷의 가장 최근 날짜 (날짜 컬럼만 읽음)"""
+        if not self.has_table(table):
+            return None
+        date_column = FRAME_TABLES[table]["date_column"]
+        dates = pd.read_parquet(self._table_dir(table), columns=[date_column])[date_column]
+        return dates.max().date() if not dates.empty else None
+
+    def read(self, table: str, columns: list[str] | None = None, since: date | None = None) -> pd.DataFrame:
+        """스냅샷 조회 - 기간 조건은 파티션 선택 + Parquet 행 그룹 필터로, 컬럼은 필요한 것만 읽음"""
+        if not self.has_table(table):
+            return pd.DataFrame()
+
+        filters = None
+        if since is not None:
+            date_column = FRAME_TABLES[table]["date_column"]
+            filters = [
+                (PARTITION_COLUMN, ">=", since.strftime("%Y-%m")),
+                (date_column, ">=", pd.Timestamp(since)),
+            ]
+        df = pd.read_parquet(self._table_dir(table), columns=columns, filters=filters)
+        return df.drop(columns=PARTITION_COLUMN, errors="ignore")
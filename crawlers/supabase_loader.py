@@ -3,14 +3,33 @@ Supabase REST API 데이터 적재 모듈
 market_competitors 테이블에 크롤링 결과를 upsert
 """
 
+import json
 import logging
 import os
+import threading
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
 
+import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
 
 logger = logging.getLogger(__name__)
 
-BATCH_SIZE = 10
+# 벌크 upsert 배치 크기 (행 수가 아닌 JSON 페이로드 바이트 기준으로 채움)
+BATCH_MAX_BYTES = 256 * 1024
+BATCH_MAX_ROWS = 1000
+UPSERT_WORKERS = 4
+
+# upsert 충돌 키 (테이블 UNIQUE 제약) - 같은 키 행이 한 요청/병렬 배치에 겹치지 않도록 적재 전 중복 제거
+CONFLICT_KEYS = {
+    "market_competitors": ("crawl_date", "source", "product_name"),
+    "search_trends": ("trend_date", "brand", "product_group", "keyword", "source"),
+}
+
+# 스트리밍 조회 페이지 크기 (PostgREST 기본 max-rows)
+PAGE_SIZE = 1000
 
 ALLOWED_RPC_FUNCTIONS = {
     "get_brand_kpis_yesterday",
@@ -20,6 +39,74 @@ ALLOWED_RPC_FUNCTIONS = {
     "get_trend_sales_correlation",
 }
 
+# load_frame 대상 테이블: 기간 컬럼 / 정렬 / 숫자 변환 컬럼 (변환은 조회 시 1회만 수행)
+FRAME_TABLES = {
+    "brand_daily_sales": {
+        "date_column": "sale_date",
+        "updated_column": "updated_at",
+        "order": "sale_date.desc,brand,channel",
+        "numeric": ["revenue", "orders", "quantity_sold", "visitors", "conversion_rate", "ad_spend", "roas"],
+    },
+    "search_trends": {
+        "date_column": "trend_date",
+        "order": "trend_date.desc,brand,source",
+        "numeric": ["trend_value"],
+    },
+    "market_competitors": {
+        "date_column": "crawl_date",
+        "order": "crawl_date.desc,source,category,ranking",
+        "numeric": ["price", "review_count"],
+    },
+    "ab_test_results": {
+        "date_column": "test_date",
+        "order": "test_date.asc,variant",
+        "numeric": ["visitors", "conversions", "revenue", "avg_order_value", "bounce_rate"],
+    },
+}
+
+# 프로세스 공용 데이터셋 캐시: table → {"latest": date, "since": date | None, "frame": DataFrame}
+# 한 번의 CLI 실행에서 여러 분석기가 같은 테이블을 요청해도 네트워크 조회/타입 변환은 1회
+_frame_cache: dict[str, dict] = {}
+_frame_lock = threading.Lock()
+
+# 설정 시 load_frame이 Supabase REST 대신 로컬 스냅샷(snapshot_store.SnapshotStore)에서 조회
+_snapshot_store = None
+
+
+def use_snapshot_store(store) -> None:
+    """load_frame 조회 경로를 로컬 스냅샷 저장소로 전환 (None이면 Supabase REST)"""
+    global _snapshot_store
+    with _frame_lock:
+        _snapshot_store = store
+        _frame_cache.clear()
+
+
+def _sort_frame(df: pd.DataFrame, order: str) -> pd.DataFrame:
+    """PostgREST order 문자열("col.desc,col2") 순서로 DataFrame 정렬
+
+    키 역순으로 안정 정렬을 겹쳐 적용해 키마다 PostgreSQL 기본 NULL 위치(asc 끝 / desc 앞)를 따른다.
+    """
+    for part in reversed(order.split(",")):
+        column, _, direction = part.partition(".")
+        descending = direction == "desc"
+        df = df.sort_values(
+            column, ascending=not descending, kind="stable", na_position="first" if descending else "last"
+        )
+    return df.reset_index(drop=True)
+
+
+def build_frame(table: str, rows: list[dict]) -> pd.DataFrame:
+    """REST 조회 행 → FRAME_TABLES 기준 타입 변환 + 정렬된 DataFrame"""
+    spec = FRAME_TABLES[table]
+    df = pd.DataFrame(rows)
+    if df.empty:
+        return df
+    df[spec["date_column"]] = pd.to_datetime(df[spec["date_column"]])
+    for col in spec["numeric"]:
+        if col in df.columns:
+            df[col] = pd.to_numeric(df[col], errors="coerce").fillna(0)
+    return _sort_frame(df, spec["order"])
+
 
 class SupabaseLoader:
     """Supabase REST API를 통한 데이터 적재"""
@@ -31,6 +118,11 @@ class SupabaseLoader:
         if not self.url or not self.key:
             logger.warning("[Supabase] SUPABASE_URL / SUPABASE_ANON_KEY 미설정")
 
+        # keep-alive 커넥션 재사용 (배치마다 TLS 핸드셰이크 방지), 병렬 업로드 워커 수만큼 풀 확보
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(pool_maxsize=UPSERT_WORKERS))
+        self.session.mount("http://", HTTPAdapter(pool_maxsize=UPSERT_WORKERS))
+
     def _get_headers(self) -> dict:
         return {
             "apikey": self.key,
@@ -49,58 +141,237 @@ class SupabaseLoader:
             logger.error("[Supabase] API 키가 설정되지 않았습니다.")
             return {"success": 0, "failed": len(records), "total": len(records)}
 
-        endpoint = f"{self.url}/rest/v1/market_competitors"
-        stats = {"success": 0, "failed": 0, "total": len(records)}
-
-        for i in range(0, len(records), BATCH_SIZE):
-            batch = records[i : i + BATCH_SIZE]
-            batch_num = i // BATCH_SIZE + 1
-            try:
-                response = requests.post(
-                    endpoint,
-                    headers=self._get_headers(),
-                    json=batch,
-                    timeout=15,
-                )
-                response.raise_for_status()
-                stats["success"] += len(batch)
-                logger.info(f"[Supabase] 배치 {batch_num}: {len(batch)}건 적재 성공")
-            except requests.RequestException as e:
-                stats["failed"] += len(batch)
-                logger.error(f"[Supabase] 배치 {batch_num} 적재 실패: {e}")
+        return self._bulk_upsert("market_competitors", records)
+
+    @staticmethod
+    def _dedupe(records: list[dict] | pd.DataFrame, key: tuple[str, ...]) -> list[dict] | pd.DataFrame:
+        """충돌 키가 같은 행은 마지막 행만 남김 (순차 적재 시 나중 값이 이기던 것과 같은 결과)"""
+        if isinstance(records, pd.DataFrame):
+            return records.drop_duplicates(subset=list(key), keep="last")
+        latest = {}
+        for record in records:
+            row_key = tuple(record.get(column) for column in key)
+            latest.pop(row_key, None)
+            latest[row_key] = record
+        return list(latest.values())
+
+    @staticmethod
+    def _encode_rows(records: list[dict] | pd.DataFrame) -> list[bytes]:
+        """레코드별 JSON 바이트. DataFrame은 컬럼 단위로 한 번에 인코딩 (행별 json.dumps 없음)"""
+        if isinstance(records, pd.DataFrame):
+            if records.empty:
+                return []
+            encoded = records.to_json(orient="records", lines=True, force_ascii=False)
+            return encoded.encode("utf-8").splitlines()
+        return [json.dumps(record, ensure_ascii=False).encode("utf-8") for record in records]
+
+    @classmethod
+    def _pack_batches(cls, records: list[dict] | pd.DataFrame) -> list[list[bytes]]:
+        """레코드를 JSON 인코딩 후 BATCH_MAX_BYTES / BATCH_MAX_ROWS 이내 배치로 묶음"""
+        batches, current, size = [], [], 0
+        for row in cls._encode_rows(records):
+            if current and (size + len(row) + 1 > BATCH_MAX_BYTES or len(current) >= BATCH_MAX_ROWS):
+                batches.append(current)
+                current, size = [], 0
+            current.append(row)
+            size += len(row) + 1
+        if current:
+            batches.append(current)
+        return batches
+
+    def _post_batch(self, endpoint: str, params: dict | None, rows: list[bytes], label: str) -> tuple[int, int]:
+        """배치 1개 전송. 실패 시 절반으로 나눠 재시도해 문제 행만 실패 처리
+
+        Returns:
+            tuple[int, int]: (성공 건수, 실패 건수)
+        """
+        try:
+            response = self.session.post(
+                endpoint,
+                headers=self._get_headers(),
+                params=params,
+                data=b"[" + b",".join(rows) + b"]",
+                timeout=30,
+            )
+            response.raise_for_status()
+            return len(rows), 0
+        except requests.RequestException as e:
+            # 연결 자체가 안 되면 쪼개 봐야 같은 결과 → 배치 전체 실패
+            splittable = e.response is not None or isinstance(e, requests.Timeout)
+            if len(rows) == 1 or not splittable:
+                logger.error(f"[Supabase] {label} {len(rows)}건 적재 실패: {e}")
+                return 0, len(rows)
+            logger.warning(f"[Supabase] {label} {len(rows)}건 적재 실패 → 분할 재시도: {e}")
+            mid = len(rows) // 2
+            left = self._post_batch(endpoint, params, rows[:mid], label)
+            right = self._post_batch(endpoint, params, rows[mid:], label)
+            return left[0] + right[0], left[1] + right[1]
+
+    def _bulk_upsert(self, table: str, records: list[dict] | pd.DataFrame, label: str = "") -> dict:
+        """충돌 키 중복 제거 + 바이트 기준 배치 + 병렬 전송 upsert
+
+        Returns:
+            dict: {"success": int, "failed": int, "total": int} (total은 중복 제거 후 행 수)
+        """
+        endpoint = f"{self.url}/rest/v1/{table}"
+        key = CONFLICT_KEYS[table]
+        params = {"on_conflict": ",".join(key)}
+        unique = self._dedupe(records, key)
+        if len(unique) < len(records):
+            logger.info(f"[Supabase] {label}충돌 키 중복 {len(records) - len(unique)}건 제외 (마지막 행 유지)")
+        stats = {"success": 0, "failed": 0, "total": len(unique)}
+        batches = self._pack_batches(unique)
+
+        with ThreadPoolExecutor(max_workers=max(1, min(UPSERT_WORKERS, len(batches)))) as pool:
+            futures = [
+                pool.submit(self._post_batch, endpoint, params, rows, f"{label}배치 {num}")
+                for num, rows in enumerate(batches, 1)
+            ]
+            for future in futures:
+                success, failed = future.result()
+                stats["success"] += success
+                stats["failed"] += failed
+
+        # 적재 후에는 해당 테이블 캐시 무효화 (같은 실행에서 최신 데이터 재조회)
+        with _frame_lock:
+            _frame_cache.pop(table, None)
 
         logger.info(
-            f"[Supabase] 적재 완료 - 성공: {stats['success']}, "
+            f"[Supabase] {label}적재 완료 ({len(batches)}개 배치) - 성공: {stats['success']}, "
             f"실패: {stats['failed']}, 전체: {stats['total']}"
         )
         return stats
 
-    def fetch_brand_sales(self, days: int = 30) -> list[dict]:
-        """brand_daily_sales 테이블에서 최근 N일 데이터 조회 (예측 분석용)"""
-        if not self.url or not self.key:
-            logger.error("[Supabase] API 키가 설정되지 않았습니다.")
-            return []
-
-        endpoint = f"{self.url}/rest/v1/brand_daily_sales"
-        headers = {
+    def _read_headers(self) -> dict:
+        return {
             "apikey": self.key,
             "Authorization": f"Bearer {self.key}",
         }
-        params = {
-            "select": "*",
-            "order": "sale_date.desc,brand,channel",
-            "limit": days * 15,  # 3 brands x 5 channels x days
-        }
 
-        try:
-            response = requests.get(endpoint, headers=headers, params=params, timeout=15)
-            response.raise_for_status()
-            data = response.json()
-            logger.info(f"[Supabase] brand_daily_sales {len(data)}건 조회 완료")
-            return data
-        except requests.RequestException as e:
-            logger.error(f"[Supabase] brand_daily_sales 조회 실패: {e}")
-            return []
+    def _get_page(self, endpoint: str, params: list[tuple]) -> list[dict]:
+        response = self.session.get(endpoint, headers=self._read_headers(), params=params, timeout=30)
+        response.raise_for_status()
+        return response.json()
+
+    def iter_table(
+        self,
+        table: str,
+        select: str = "*",
+        date_column: str | None = None,
+        since: str | None = None,
+        until: str | None = None,
+        page_size: int = PAGE_SIZE,
+    ) -> Iterator[list[dict]]:
+        """테이블을 id 기준 keyset 페이지네이션으로 스트리밍 조회
+
+        기간 필터(date_column >= since, <= until)는 쿼리로 전달하고,
+        현재 페이지를 소비하는 동안 다음 페이지를 미리 요청한다.
+        서버 max-rows가 page_size보다 작으면 페이지가 짧게 오므로, 빈 페이지가 올 때까지 계속 조회한다.
+
+        Yields:
+            list[dict]: 최대 page_size건의 행 청크 (id 오름차순)
+
+        Raises:
+            requests.RequestException: 페이지 조회 실패 시
+        """
+        if not self.url or not self.key:
+            logger.error("[Supabase] API 키가 설정되지 않았습니다.")
+            return
+
+        endpoint = f"{self.url}/rest/v1/{table}"
+        if select != "*" and "id" not in select.split(","):
+            select += ",id"
+        base = [("select", select), ("order", "id.asc"), ("limit", page_size)]
+        if date_column and since:
+            base.append((date_column, f"gte.{since}"))
+        if date_column and until:
+            base.append((date_column, f"lte.{until}"))
+
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            future = pool.submit(self._get_page, endpoint, base)
+            while True:
+                rows = future.result()
+                if not rows:
+                    return
+                future = pool.submit(self._get_page, endpoint, base + [("id", f"gt.{rows[-1]['id']}")])
+                yield rows
+
+    def _latest_date(self, table: str, date_column: str) -> date | None:
+        """테이블의 가장 최근 날짜 (기간 조회 기준일)"""
+        params = [("select", date_column), ("order", f"{date_column}.desc"), ("limit", 1)]
+        rows = self._get_page(f"{self.url}/rest/v1/{table}", params)
+        return date.fromisoformat(rows[0][date_column]) if rows else None
+
+    def _load_window(self, table: str, days: int | None) -> dict | None:
+        """최근 N일 조회 → 캐시 항목 {"latest", "since", "frame"} (API 키 미설정 시 None)"""
+        spec = FRAME_TABLES[table]
+        date_column = spec["date_column"]
+
+        if _snapshot_store is not None:
+            latest = _snapshot_store.latest_date(table)
+            since = latest - timedelta(days=days - 1) if latest is not None and days is not None else None
+            frame = _snapshot_store.read(table, since=since) if latest is not None else pd.DataFrame()
+            if not frame.empty:
+                frame = _sort_frame(frame, spec["order"])
+            logger.info(f"[Supabase] {table} 로컬 스냅샷 {len(frame)}건 조회 (캐시 저장)")
+            return {"latest": latest, "since": since, "frame": frame}
+
+        if not self.url or not self.key:
+            logger.error("[Supabase] API 키가 설정되지 않았습니다.")
+            return None
+
+        latest = self._latest_date(table, date_column)
+        since = latest - timedelta(days=days - 1) if latest is not None and days is not None else None
+        rows = []
+        if latest is not None:
+            chunks = self.iter_table(table, date_column=date_column, since=since.isoformat() if since else None)
+            rows = [row for chunk in chunks for row in chunk]
+        logger.info(f"[Supabase] {table} {len(rows)}건 조회 완료 (캐시 저장)")
+        return {"latest": latest, "since": since, "frame": build_frame(table, rows)}
+
+    def load_frame(self, table: str, days: int | None = None, order: str | None = None) -> pd.DataFrame:
+        """최근 N일(테이블 최신 날짜 기준) 데이터를 타입 변환된 DataFrame으로 반환 (캐시 사용)
+
+        캐시에 더 넓은 기간이 있으면 네트워크 조회 없이 잘라서 반환한다.
+        반환값은 캐시 원본과 분리된 독립 사본(기본 index)이므로 호출자가 컬럼을 추가/수정해도
+        캐시는 변하지 않고 SettingWithCopyWarning도 나지 않는다.
+        order: PostgREST order 문자열 (기본: FRAME_TABLES의 테이블 정렬). 조회 실패 시 빈 DataFrame.
+        """
+        date_column = FRAME_TABLES[table]["date_column"]
+
+        with _frame_lock:
+            entry = _frame_cache.get(table)
+            if entry is None or not self._covers(entry, days):
+                try:
+                    entry = self._load_window(table, days)
+                except requests.RequestException as e:
+                    logger.error(f"[Supabase] {table} 조회 실패: {e}")
+                    return pd.DataFrame()
+                if entry is None:
+                    return pd.DataFrame()
+                _frame_cache[table] = entry
+            else:
+                logger.info(f"[Supabase] {table} 캐시 사용 (최근 {days}일)")
+
+        frame = entry["frame"]
+        if not frame.empty and days is not None:
+            since = pd.Timestamp(entry["latest"] - timedelta(days=days - 1))
+            frame = frame.loc[frame[date_column] >= since]
+        if order and not frame.empty and order != FRAME_TABLES[table]["order"]:
+            frame = _sort_frame(frame, order)
+        # 캐시 원본과 분리된 독립 사본 + 기본 index (list[dict] → DataFrame 변환 때와 같은 형태)
+        frame = frame.copy()
+        frame.reset_index(drop=True, inplace=True)
+        return frame
+
+    @staticmethod
+    def _covers(entry: dict, days: int | None) -> bool:
+        """캐시 항목이 요청 기간(최근 days일)을 모두 포함하는지"""
+        if entry["since"] is None:
+            return True
+        if days is None:
+            return False
+        return entry["since"] <= entry["latest"] - timedelta(days=days - 1)
 
     def call_rpc(self, function_name: str, params: dict | None = None) -> list[dict]:
         """Supabase RPC 함수 호출"""
@@ -120,7 +391,7 @@ class SupabaseLoader:
         }
 
         try:
-            response = requests.post(
+            response = self.session.post(
                 endpoint,
                 headers=headers,
                 json=params or {},
@@ -134,115 +405,8 @@ class SupabaseLoader:
             logger.error(f"[Supabase] RPC {function_name} 호출 실패: {e}")
             return []
 
-    def fetch_competitors(self, limit: int = 1000) -> list[dict]:
-        """market_competitors 테이블에서 데이터 조회 (분석용)"""
-        if not self.url or not self.key:
-            logger.error("[Supabase] API 키가 설정되지 않았습니다.")
-            return []
-
-        endpoint = f"{self.url}/rest/v1/market_competitors"
-        headers = {
-            "apikey": self.key,
-            "Authorization": f"Bearer {self.key}",
-        }
-        params = {
-            "select": "*",
-            "order": "crawl_date.desc,source,category,ranking",
-            "limit": limit,
-        }
-
-        try:
-            response = requests.get(endpoint, headers=headers, params=params, timeout=15)
-            response.raise_for_status()
-            data = response.json()
-            logger.info(f"[Supabase] {len(data)}건 조회 완료")
-            return data
-        except requests.RequestException as e:
-            logger.error(f"[Supabase] 데이터 조회 실패: {e}")
-            return []
-
-    def fetch_competitors_extended(self, weeks: int = 8) -> list[dict]:
-        """market_competitors 테이블에서 최근 N주 데이터 조회 (장기 추이 분석용)"""
-        if not self.url or not self.key:
-            logger.error("[Supabase] API 키가 설정되지 않았습니다.")
-            return []
-
-        endpoint = f"{self.url}/rest/v1/market_competitors"
-        headers = {
-            "apikey": self.key,
-            "Authorization": f"Bearer {self.key}",
-        }
-        params = {
-            "select": "*",
-            "order": "crawl_date.asc,source,category,ranking",
-            "limit": weeks * 15,  # ~13 products/week
-        }
-
-        try:
-            response = requests.get(endpoint, headers=headers, params=params, timeout=15)
-            response.raise_for_status()
-            data = response.json()
-            logger.info(f"[Supabase] 경쟁사 {weeks}주 데이터 {len(data)}건 조회 완료")
-            return data
-        except requests.RequestException as e:
-            logger.error(f"[Supabase] 경쟁사 확장 데이터 조회 실패: {e}")
-            return []
-
-    def fetch_ab_test(self) -> list[dict]:
-        """ab_test_results 테이블에서 A/B 테스트 데이터 조회"""
-        if not self.url or not self.key:
-            logger.error("[Supabase] API 키가 설정되지 않았습니다.")
-            return []
-
-        endpoint = f"{self.url}/rest/v1/ab_test_results"
-        headers = {
-            "apikey": self.key,
-            "Authorization": f"Bearer {self.key}",
-        }
-        params = {
-            "select": "*",
-            "order": "test_date.asc,variant",
-        }
-
-        try:
-            response = requests.get(endpoint, headers=headers, params=params, timeout=15)
-            response.raise_for_status()
-            data = response.json()
-            logger.info(f"[Supabase] A/B 테스트 데이터 {len(data)}건 조회 완료")
-            return data
-        except requests.RequestException as e:
-            logger.error(f"[Supabase] A/B 테스트 데이터 조회 실패: {e}")
-            return []
-
-    def fetch_search_trends(self, days: int = 30) -> list[dict]:
-        """search_trends 테이블에서 최근 N일 데이터 조회 (트렌드 분석용)"""
-        if not self.url or not self.key:
-            logger.error("[Supabase] API 키가 설정되지 않았습니다.")
-            return []
-
-        endpoint = f"{self.url}/rest/v1/search_trends"
-        headers = {
-            "apikey": self.key,
-            "Authorization": f"Bearer {self.key}",
-        }
-        params = {
-            "select": "*",
-            "order": "trend_date.desc,brand,source",
-            "limit": days * 16,  # 8 product_groups x 2 sources x days
-        }
-
-        try:
-            response = requests.get(endpoint, headers=headers, params=params, timeout=15)
-            response.raise_for_status()
-            data = response.json()
-            logger.info(f"[Supabase] search_trends {len(data)}건 조회 완료")
-            return data
-        except requests.RequestException as e:
-            logger.error(f"[Supabase] search_trends 조회 실패: {e}")
-            return []
-
-    def upsert_trends(self, records: list[dict]) -> dict:
-        """search_trends 테이블에 upsert (배치 처리)
+    def upsert_trends(self, records: list[dict] | pd.DataFrame) -> dict:
+        """search_trends 테이블에 upsert (배치 처리). records는 레코드 목록 또는 같은 컬럼의 DataFrame
 
         Returns:
             dict: {"success": int, "failed": int, "total": int}
@@ -251,30 +415,4 @@ class SupabaseLoader:
             logger.error("[Supabase] API 키가 설정되지 않았습니다.")
             return {"success": 0, "failed": len(records), "total": len(records)}
 
-        endpoint = f"{self.url}/rest/v1/search_trends"
-        params = {"on_conflict": "trend_date,brand,product_group,keyword,source"}
-        stats = {"success": 0, "failed": 0, "total": len(records)}
-
-        for i in range(0, len(records), BATCH_SIZE):
-            batch = records[i : i + BATCH_SIZE]
-            batch_num = i // BATCH_SIZE + 1
-            try:
-                response = requests.post(
-                    endpoint,
-                    headers=self._get_headers(),
-                    params=params,
-                    json=batch,
-                    timeout=15,
-                )
-                response.raise_for_status()
-                stats["success"] += len(batch)
-                logger.info(f"[Supabase] 트렌드 배치 {batch_num}: {len(batch)}건 적재 성공")
-            except requests.RequestException as e:
-                stats["failed"] += len(batch)
-                logger.error(f"[Supabase] 트렌드 배치 {batch_num} 적재 실패: {e}")
-
-        logger.info(
-            f"[Supabase] 트렌드 적재 완료 - 성공: {stats['success']}, "
-            f"실패: {stats['failed']}, 전체: {stats['total']}"
-        )
-        return stats
+        return self._bulk_upsert("search_trends", records, label="트렌드 ")
@@ -0,0 +1,271 @@
+"""
+경량 인라인 SVG 차트 - 대시보드 벡터 모드용
+matplotlib 렌더링 없이 좌표만 계산해 SVG 문자열을 만든다 (_build_sparkline_svg와 같은 방식).
+viewBox 기준이라 카드 너비에 맞춰 늘어나고, 글꼴은 페이지 CSS를 따른다.
+"""
+
+from html import escape
+
+import matplotlib
+import numpy as np
+import pandas as pd
+from matplotlib.colors import Normalize, to_hex
+
+TEXT = "#334155"
+MUTED = "#94a3b8"
+GRID = "#e2e8f0"
+ALERT = "#f87171"
+EMPTY_CELL = "#f1f5f9"
+
+TITLE_H = 28
+
+
+def _f(v: float) -> str:
+    """좌표 문자열 (소수 1자리, 불필요한 0 제거) - 파일 크기 절감"""
+    return f"{v:.1f}".rstrip("0").rstrip(".")
+
+
+def _scale(v: float, lo: float, hi: float, a: float, b: float) -> float:
+    if hi == lo:
+        return (a + b) / 2
+    return a + (v - lo) / (hi - lo) * (b - a)
+
+
+def _text(x: float, y: float, s: str, size: int = 10, anchor: str = "middle", color: str = TEXT,
+          bold: bool = False, extra: str = "") -> str:
+    weight = ' font-weight="700"' if bold else ""
+    return (
+        f'<text x="{_f(x)}" y="{_f(y)}" font-size="{size}" text-anchor="{anchor}" fill="{color}"{weight}{extra}>'
+        f"{escape(str(s))}</text>"
+    )
+
+
+def _svg(width: float, height: float, body: list[str], label: str) -> str:
+    return (
+        f'<svg viewBox="0 0 {_f(width)} {_f(height)}" class="chart-svg" role="img" aria-label="{escape(label)}">'
+        f'{"".join(body)}</svg>'
+    )
+
+
+def _title(body: list[str], width: float, title: str | None) -> float:
+    """차트 제목을 추가하고 본문 시작 y 반환"""
+    if not title:
+        return 4
+    body.append(_text(width / 2, 18, title, size=13, bold=True))
+    return TITLE_H
+
+
+def _y_grid(body: list[str], left: float, right: float, top: float, bottom: float,
+            ylim: tuple[float, float], ticks: int = 5, fmt: str = "{:g}") -> None:
+    for t in np.linspace(ylim[0], ylim[1], ticks):
+        y = _scale(t, ylim[0], ylim[1], bottom, top)
+        body.append(f'<line x1="{_f(left)}" y1="{_f(y)}" x2="{_f(right)}" y2="{_f(y)}" stroke="{GRID}" stroke-width="0.5"/>')
+        body.append(_text(left - 4, y + 3, fmt.format(t), size=9, anchor="end", color=MUTED))
+
+
+def _date_ticks(body: list[str], dates: pd.DatetimeIndex, lo: int, hi: int, left: float, right: float,
+                y: float, n: int = 5) -> None:
+    if dates.empty:
+        return
+    for i in np.unique(np.linspace(0, len(dates) - 1, min(n, len(dates))).round().astype(int)):
+        x = _scale(dates[i].value, lo, hi, left, right)
+        body.append(_text(x, y, dates[i].strftime("%m/%d"), size=9, color=MUTED))
+
+
+def _ylabel(body: list[str], x: float, top: float, bottom: float, label: str) -> None:
+    y = (top + bottom) / 2
+    body.append(_text(x, y, label, size=9, color=MUTED, extra=f' transform="rotate(-90 {_f(x)} {_f(y)})"'))
+
+
+def heatmap(
+    data: np.ndarray,
+    row_labels: list[str],
+    col_labels: list[str],
+    cmap: str,
+    fmt: str,
+    light: np.ndarray,
+    title: str | None = None,
+    vmin: float | None = None,
+    vmax: float | None = None,
+    width: float = 640,
+    cell_h: float = 40,
+    label_w: float = 90,
+) -> str:
+    """값이 적힌 히트맵. light가 True인 칸은 흰 글씨, NaN 칸은 비워둔다"""
+    data = np.asarray(data, dtype=float)
+    n_rows, n_cols = data.shape
+    finite = data[~np.isnan(data)]
+    norm = Normalize(
+        vmin if vmin is not None else (finite.min() if finite.size else 0),
+        vmax if vmax is not None else (finite.max() if finite.size else 1),
+    )
+    colormap = matplotlib.colormaps[cmap]
+
+    body = []
+    top = _title(body, width, title)
+    cell_w = (width - label_w) / n_cols
+    for i in range(n_rows):
+        y = top + i * cell_h
+        body.append(_text(label_w - 8, y + cell_h / 2 + 4, row_labels[i], size=11, anchor="end"))
+        for j in range(n_cols):
+            x = label_w + j * cell_w
+            val = data[i, j]
+            fill = EMPTY_CELL if np.isnan(val) else to_hex(colormap(norm(val)))
+            body.append(
+                f'<rect x="{_f(x)}" y="{_f(y)}" width="{_f(cell_w)}" height="{_f(cell_h)}" fill="{fill}" '
+                f'stroke="#ffffff" stroke-width="2"/>'
+            )
+            if not np.isnan(val):
+                color = "#ffffff" if light[i, j] else TEXT
+                body.append(_text(x + cell_w / 2, y + cell_h / 2 + 4, fmt.format(val), size=11, color=color, bold=True))
+    bottom = top + n_rows * cell_h
+    for j, label in enumerate(col_labels):
+        body.append(_text(label_w + (j + 0.5) * cell_w, bottom + 16, label, size=11))
+    return _svg(width, bottom + 24, body, title or "히트맵")
+
+
+def bar_panels(
+    panels: list[dict],
+    ylim: tuple[float, float],
+    title: str | None = None,
+    xlabel: str = "",
+    ylabel: str = "",
+    marker_x: float | None = None,
+    panel_w: float = 260,
+    panel_h: float = 190,
+) -> str:
+    """가로로 나란한 막대 차트 패널. panel = {"title", "x", "y", "colors"}"""
+    width = panel_w * max(len(panels), 1)
+    body = []
+    top0 = _title(body, width, title)
+
+    for k, panel in enumerate(panels):
+        x0 = k * panel_w
+        left, right = x0 + 44, x0 + panel_w - 10
+        top, bottom = top0 + 22, top0 + panel_h - 34
+        body.append(_text((left + right) / 2, top0 + 12, panel["title"], size=11, bold=True))
+        _y_grid(body, left, right, top, bottom, ylim)
+        _ylabel(body, x0 + 10, top, bottom, ylabel)
+
+        xs = list(panel["x"])
+        lo, hi = min(xs) - 0.5, max(xs) + 0.5
+        band = (right - left) / (hi - lo)
+        y0 = _scale(0, ylim[0], ylim[1], bottom, top)
+        for x, v, color in zip(xs, panel["y"], panel["colors"]):
+            cx = _scale(x, lo, hi, left, right)
+            yv = _scale(float(v), ylim[0], ylim[1], bottom, top)
+            body.append(
+                f'<rect x="{_f(cx - band * 0.35)}" y="{_f(min(y0, yv))}" width="{_f(band * 0.7)}" '
+                f'height="{_f(abs(y0 - yv))}" fill="{color}"/>'
+            )
+        step = max(1, len(xs) // 8)
+        for x in xs[::step]:
+            body.append(_text(_scale(x, lo, hi, left, right), bottom + 12, f"{x:g}", size=9, color=MUTED))
+        body.append(f'<line x1="{_f(left)}" y1="{_f(y0)}" x2="{_f(right)}" y2="{_f(y0)}" stroke="{GRID}"/>')
+        if marker_x is not None and lo <= marker_x <= hi:
+            mx = _scale(marker_x, lo, hi, left, right)
+            body.append(
+                f'<line x1="{_f(mx)}" y1="{_f(top)}" x2="{_f(mx)}" y2="{_f(bottom)}" stroke="{ALERT}" '
+                f'stroke-dasharray="4 3" opacity="0.5"/>'
+            )
+        if xlabel:
+            body.append(_text((left + right) / 2, bottom + 26, xlabel, size=9, color=MUTED))
+    return _svg(width, top0 + panel_h, body, title or "막대 차트")
+
+
+def line_panels(
+    panels: list[dict],
+    ylim: tuple[float, float],
+    title: str | None = None,
+    ylabel: str = "",
+    width: float = 760,
+    panel_h: float = 150,
+) -> str:
+    """세로로 쌓은 시계열 패널 (x축 공유). panel = {"title", "x", "y", "color", "threshold", "spans"}"""
+    dates = [pd.DatetimeIndex(panel["x"]) for panel in panels]
+    all_dates = dates[0].append(dates[1:]).unique().sort_values() if dates else pd.DatetimeIndex([])
+    lo, hi = (all_dates[0].value, all_dates[-1].value) if len(all_dates) else (0, 1)
+
+    body = []
+    top0 = _title(body, width, title)
+    left, right = 48, width - 12
+    for k, (panel, x) in enumerate(zip(panels, dates)):
+        top = top0 + k * panel_h + 20
+        bottom = top0 + (k + 1) * panel_h - 8
+        body.append(_text((left + right) / 2, top - 6, panel["title"], size=11, bold=True))
+        _y_grid(body, left, right, top, bottom, ylim, ticks=3)
+        _ylabel(body, 12, top, bottom, ylabel)
+
+        for start, end in panel.get("spans", []):
+            sx = _scale(pd.Timestamp(start).value, lo, hi, left, right)
+            ex = _scale(pd.Timestamp(end).value, lo, hi, left, right)
+            body.append(
+                f'<rect x="{_f(sx)}" y="{_f(top)}" width="{_f(max(ex - sx, 2))}" height="{_f(bottom - top)}" '
+                f'fill="{ALERT}" opacity="0.08"/>'
+            )
+        points = [
+            (_scale(d.value, lo, hi, left, right), _scale(float(v), ylim[0], ylim[1], bottom, top))
+            for d, v in zip(x, panel["y"])
+        ]
+        line = " ".join(f"{_f(px)},{_f(py)}" for px, py in points)
+        if points:
+            base = _scale(ylim[0], ylim[0], ylim[1], bottom, top)
+            area = f"{_f(points[0][0])},{_f(base)} {line} {_f(points[-1][0])},{_f(base)}"
+            body.append(f'<polygon points="{area}" fill="{panel["color"]}" opacity="0.15"/>')
+            body.append(f'<polyline points="{line}" fill="none" stroke="{panel["color"]}" stroke-width="2"/>')
+        if panel.get("threshold") is not None:
+            ty = _scale(float(panel["threshold"]), ylim[0], ylim[1], bottom, top)
+            body.append(
+                f'<line x1="{_f(left)}" y1="{_f(ty)}" x2="{_f(right)}" y2="{_f(ty)}" stroke="{ALERT}" '
+                f'stroke-dasharray="4 3" opacity="0.5"/>'
+            )
+
+    bottom = top0 + len(panels) * panel_h
+    _date_ticks(body, all_dates, lo, hi, left, right, bottom + 6)
+    return _svg(width, bottom + 14, body, title or "시계열 차트")
+
+
+def stacked_area_panels(
+    panels: list[dict],
+    ylim: tuple[float, float],
+    title: str | None = None,
+    ylabel: str = "",
+    panel_w: float = 320,
+    panel_h: float = 240,
+) -> str:
+    """가로로 나란한 누적 영역 패널. panel = {"title", "x", "series": [(label, color, values), ...]}"""
+    width = panel_w * max(len(panels), 1)
+    body = []
+    top0 = _title(body, width, title)
+
+    for k, panel in enumerate(panels):
+        x0 = k * panel_w
+        left, right = x0 + 44, x0 + panel_w - 10
+        top, bottom = top0 + 40, top0 + panel_h - 20
+        body.append(_text((left + right) / 2, top0 + 12, panel["title"], size=11, bold=True))
+
+        lx = left
+        for label, color, _ in panel["series"]:
+            body.append(f'<rect x="{_f(lx)}" y="{_f(top0 + 22)}" width="8" height="8" rx="2" fill="{color}"/>')
+            body.append(_text(lx + 11, top0 + 30, label, size=9, anchor="start"))
+            lx += 14 + 9 * len(label)
+
+        _y_grid(body, left, right, top, bottom, ylim, ticks=5)
+        _ylabel(body, x0 + 10, top, bottom, ylabel)
+
+        dates = pd.DatetimeIndex(panel["x"])
+        if dates.empty:
+            continue
+        lo, hi = dates.min().value, dates.max().value
+        xs = [_scale(d.value, lo, hi, left, right) for d in dates]
+        lower = np.zeros(len(dates))
+        for _, color, values in panel["series"]:
+            upper = lower + np.asarray(values, dtype=float)
+            ys_upper = [_scale(v, ylim[0], ylim[1], bottom, top) for v in upper]
+            ys_lower = [_scale(v, ylim[0], ylim[1], bottom, top) for v in lower]
+            points = [f"{_f(x)},{_f(y)}" for x, y in zip(xs, ys_upper)]
+            points += [f"{_f(x)},{_f(y)}" for x, y in zip(reversed(xs), reversed(ys_lower))]
+            body.append(f'<polygon points="{" ".join(points)}" fill="{color}" opacity="0.8"/>')
+            lower = upper
+        _date_ticks(body, dates, lo, hi, left, right, bottom + 12, n=4)
+    return _svg(width, top0 + panel_h, body, title or "누적 영역 차트")
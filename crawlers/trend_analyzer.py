@@ -14,9 +14,12 @@ import matplotlib.pyplot as plt
 import matplotlib.font_manager as fm
 import numpy as np
 import pandas as pd
-from scipy import stats
 
+from .chart_renderer import ChartJob, render_charts
+from .config import LEAD_LAG_MAX_DAYS, PEAK_QUANTILE
+from .peak_detector import PeakDetector, daily_trend_avg, peak_periods
 from .supabase_loader import SupabaseLoader
+from .trend_stats import lead_lag_by_brand, trend_sales_correlation
 
 logger = logging.getLogger(__name__)
 
@@ -59,25 +62,22 @@ class TrendAnalyzer:
     def __init__(self):
         self.loader = SupabaseLoader()
 
-    def run(self, days: int = 30) -> str:
-        """전체 트렌드 분석 파이프라인"""
+    def run(self, days: int = 30, rebuild_peaks: bool = False) -> str:
+        """전체 트렌드 분석 파이프라인
+
+        Args:
+            days: 분석 기간 (최근 N일)
+            rebuild_peaks: 누적 성수기 상태를 search_trends 전체 이력으로 다시 계산
+        """
         # 1. 데이터 조회
-        trend_data = self.loader.fetch_search_trends(days=days)
-        sales_data = self.loader.fetch_brand_sales(days=days)
+        df_trend = self.loader.load_frame("search_trends", days=days)
+        df_sales = self.loader.load_frame("brand_daily_sales", days=days)
 
-        if not trend_data:
+        if df_trend.empty:
             return "[트렌드] 트렌드 데이터가 없습니다. Supabase 연결 또는 schema/search_trends.sql 적용을 확인해주세요."
 
-        df_trend = pd.DataFrame(trend_data)
-        df_trend["trend_date"] = pd.to_datetime(df_trend["trend_date"])
-        df_trend["trend_value"] = pd.to_numeric(df_trend["trend_value"], errors="coerce").fillna(0)
-
-        df_sales = None
-        if sales_data:
-            df_sales = pd.DataFrame(sales_data)
-            df_sales["sale_date"] = pd.to_datetime(df_sales["sale_date"])
-            df_sales["revenue"] = pd.to_numeric(df_sales["revenue"], errors="coerce").fillna(0)
-            df_sales["orders"] = pd.to_numeric(df_sales["orders"], errors="coerce").fillna(0)
+        if df_sales.empty:
+            df_sales = None
 
         lines = [
             "📈 검색 트렌드-매출 상관 분석",
@@ -96,16 +96,38 @@ class TrendAnalyzer:
         # 4. 성수기 탐지
         peak_results = self._peak_season_detection(df_trend)
         lines.extend(peak_results["lines"])
+        lines.extend(self._peak_history(df_trend, rebuild_peaks))
 
         # 5. 비즈니스 추천
         recommendations = self._generate_recommendations(corr_results, lead_results, peak_results)
         lines.extend(recommendations)
 
         # 6. 시각화
-        self._plot_trend_sales_overlay(df_trend, df_sales)
-        self._plot_correlation_heatmap(corr_results)
-        self._plot_lead_lag(lead_results)
-        self._plot_peak_season(df_trend, peak_results)
+        render_charts(
+            [
+                ChartJob(
+                    "trend_sales_overlay.png",
+                    self._plot_trend_sales_overlay,
+                    {"df_trend": df_trend, "df_sales": df_sales},
+                    "오버레이 차트",
+                ),
+                ChartJob(
+                    "trend_correlation_heatmap.png",
+                    self._plot_correlation_heatmap,
+                    {"corr_results": corr_results},
+                    "상관 히트맵",
+                ),
+                ChartJob("trend_lead_lag.png", self._plot_lead_lag, {"lead_results": lead_results}, "선행 지표 차트"),
+                ChartJob(
+                    "trend_peak_season.png",
+                    self._plot_peak_season,
+                    {"df_trend": df_trend, "peak_results": peak_results},
+                    "성수기 차트",
+                ),
+            ],
+            label="트렌드",
+            output_dir=OUTPUT_DIR,
+        )
 
         lines.append("[차트] output/trend_sales_overlay.png - 트렌드 vs 매출 듀얼축")
         lines.append("[차트] output/trend_correlation_heatmap.png - 상관관계 히트맵")
@@ -128,48 +150,28 @@ class TrendAnalyzer:
             lines.append("")
             return {"lines": lines, "results": results}
 
-        # 브랜드별 일별 매출 집계
-        daily_sales = df_sales.groupby(["sale_date", "brand"])["revenue"].sum().reset_index()
-
-        # 브랜드별 일별 트렌드 평균
-        daily_trend = df_trend.groupby(["trend_date", "brand", "source"])["trend_value"].mean().reset_index()
+        # 브랜드 x 소스 전체 쌍을 한 번에 계산 (날짜 inner join은 결측 마스크로 처리)
+        corr = trend_sales_correlation(df_trend, df_sales)
 
-        for brand in sorted(df_trend["brand"].unique()):
+        for (brand, source), row in corr.iterrows():
             label = BRAND_LABELS.get(brand, brand)
-            brand_sales = daily_sales[daily_sales["brand"] == brand].set_index("sale_date")["revenue"]
-
-            for source in sorted(df_trend["source"].unique()):
-                source_label = SOURCE_LABELS.get(source, source)
-                brand_trend = daily_trend[
-                    (daily_trend["brand"] == brand) & (daily_trend["source"] == source)
-                ].set_index("trend_date")["trend_value"]
-
-                # 날짜 기준 inner join
-                common_dates = brand_sales.index.intersection(brand_trend.index)
-
-                if len(common_dates) < 3:
-                    continue
-
-                s_vals = brand_sales.loc[common_dates].values
-                t_vals = brand_trend.loc[common_dates].values
-
-                pearson_r, pearson_p = stats.pearsonr(t_vals, s_vals)
-                spearman_r, spearman_p = stats.spearmanr(t_vals, s_vals)
-
-                results[(brand, source)] = {
-                    "pearson_r": pearson_r,
-                    "pearson_p": pearson_p,
-                    "spearman_r": spearman_r,
-                    "spearman_p": spearman_p,
-                    "n": len(common_dates),
-                }
+            source_label = SOURCE_LABELS.get(source, source)
+            n = int(row["n"])
+
+            results[(brand, source)] = {
+                "pearson_r": row["pearson_r"],
+                "pearson_p": row["pearson_p"],
+                "spearman_r": row["spearman_r"],
+                "spearman_p": row["spearman_p"],
+                "n": n,
+            }
 
-                sig = "**" if pearson_p < 0.01 else ("*" if pearson_p < 0.05 else "")
-                lines.append(
-                    f"  [{label} x {source_label}] "
-                    f"Pearson r={pearson_r:.3f}{sig}, "
-                    f"Spearman r={spearman_r:.3f} (n={len(common_dates)})"
-                )
+            sig = "**" if row["pearson_p"] < 0.01 else ("*" if row["pearson_p"] < 0.05 else "")
+            lines.append(
+                f"  [{label} x {source_label}] "
+                f"Pearson r={row['pearson_r']:.3f}{sig}, "
+                f"Spearman r={row['spearman_r']:.3f} (n={n})"
+            )
 
         if not results:
             lines.append("  매출/트렌드 날짜 겹침 부족으로 상관 분석 불가 (최소 3일 필요)")
@@ -178,67 +180,33 @@ class TrendAnalyzer:
         return {"lines": lines, "results": results}
 
     def _lead_lag_analysis(self, df_trend: pd.DataFrame, df_sales: pd.DataFrame | None) -> dict:
-        """선행 지표 분석: lag -7~+7일 cross-correlation"""
+        """선행 지표 분석: lag ±LEAD_LAG_MAX_DAYS일 cross-correlation"""
         lines = [
             "⏱️ 선행 지표 분석 (검색이 매출보다 N일 선행?)",
             "━" * 45,
         ]
 
-        results = {}  # {brand: {"best_lag": int, "best_corr": float, "lags": dict}}
+        results = {}  # {brand: {"best_lag": int, "best_corr": float, "best_p": float, "lags": dict, "p_values": dict}}
 
         if df_sales is None or df_sales.empty:
             lines.append("  매출 데이터가 없어 선행 분석을 건너뜁니다.")
             lines.append("")
             return {"lines": lines, "results": results}
 
-        daily_sales = df_sales.groupby(["sale_date", "brand"])["revenue"].sum().reset_index()
-        daily_trend = df_trend.groupby(["trend_date", "brand"])["trend_value"].mean().reset_index()
+        # 전 브랜드·전 lag를 한 번에 계산 (trend_stats 공용 엔진)
+        results = lead_lag_by_brand(df_trend, df_sales, LEAD_LAG_MAX_DAYS)
 
-        for brand in sorted(df_trend["brand"].unique()):
+        for brand, vals in results.items():
             label = BRAND_LABELS.get(brand, brand)
-
-            brand_sales = daily_sales[daily_sales["brand"] == brand].sort_values("sale_date")
-            brand_trend = daily_trend[daily_trend["brand"] == brand].sort_values("trend_date")
-
-            if len(brand_sales) < 5 or len(brand_trend) < 5:
-                continue
-
-            # 시계열 정렬 (trend_date를 기준)
-            sales_ts = brand_sales.set_index("sale_date")["revenue"]
-            trend_ts = brand_trend.set_index("trend_date")["trend_value"]
-
-            lag_corrs = {}
-            best_lag = 0
-            best_corr = -1
-
-            for lag in range(-7, 8):
-                # lag > 0: 트렌드가 매출보다 lag일 선행
-                shifted_trend = trend_ts.copy()
-                shifted_trend.index = shifted_trend.index + pd.Timedelta(days=lag)
-
-                common = sales_ts.index.intersection(shifted_trend.index)
-                if len(common) < 3:
-                    continue
-
-                r, _ = stats.pearsonr(shifted_trend.loc[common].values, sales_ts.loc[common].values)
-                lag_corrs[lag] = r
-
-                if abs(r) > abs(best_corr):
-                    best_corr = r
-                    best_lag = lag
-
-            results[brand] = {
-                "best_lag": best_lag,
-                "best_corr": best_corr,
-                "lags": lag_corrs,
-            }
+            best_lag, best_corr = vals["best_lag"], vals["best_corr"]
+            sig = "**" if vals["best_p"] < 0.01 else ("*" if vals["best_p"] < 0.05 else "")
 
             if best_lag > 0:
-                lines.append(f"  [{label}] 검색이 매출보다 {best_lag}일 선행 (r={best_corr:.3f})")
+                lines.append(f"  [{label}] 검색이 매출보다 {best_lag}일 선행 (r={best_corr:.3f}{sig})")
             elif best_lag < 0:
-                lines.append(f"  [{label}] 매출이 검색보다 {abs(best_lag)}일 선행 (r={best_corr:.3f})")
+                lines.append(f"  [{label}] 매출이 검색보다 {abs(best_lag)}일 선행 (r={best_corr:.3f}{sig})")
             else:
-                lines.append(f"  [{label}] 동시 상관 최대 (lag=0, r={best_corr:.3f})")
+                lines.append(f"  [{label}] 동시 상관 최대 (lag=0, r={best_corr:.3f}{sig})")
 
         if not results:
             lines.append("  데이터 부족으로 선행 분석 불가")
@@ -253,55 +221,26 @@ class TrendAnalyzer:
             "━" * 45,
         ]
 
-        results = {}  # {brand: [{"start": date, "end": date, "avg_val": float}]}
+        results = {}  # {brand: [{"start": date, "end": date, "avg_val": float, "days": int}]}
+        daily = daily_trend_avg(df_trend)
 
         for brand in sorted(df_trend["brand"].unique()):
             label = BRAND_LABELS.get(brand, brand)
-            brand_data = df_trend[df_trend["brand"] == brand]
 
             # 일별 평균 트렌드
-            daily_avg = brand_data.groupby("trend_date")["trend_value"].mean().sort_index()
+            daily_avg = daily[brand].dropna()
 
             if daily_avg.empty:
                 continue
 
-            threshold = daily_avg.quantile(0.75)
-            peak_dates = daily_avg[daily_avg > threshold].index.tolist()
-
-            # 연속 기간 그룹핑
-            peak_periods = []
-            if peak_dates:
-                current_start = peak_dates[0]
-                current_end = peak_dates[0]
-
-                for date in peak_dates[1:]:
-                    if (date - current_end).days <= 2:  # 2일 갭까지 허용
-                        current_end = date
-                    else:
-                        period_data = daily_avg.loc[current_start:current_end]
-                        peak_periods.append({
-                            "start": current_start,
-                            "end": current_end,
-                            "avg_val": period_data.mean(),
-                            "days": (current_end - current_start).days + 1,
-                        })
-                        current_start = date
-                        current_end = date
-
-                # 마지막 기간
-                period_data = daily_avg.loc[current_start:current_end]
-                peak_periods.append({
-                    "start": current_start,
-                    "end": current_end,
-                    "avg_val": period_data.mean(),
-                    "days": (current_end - current_start).days + 1,
-                })
-
-            results[brand] = peak_periods
-
-            if peak_periods:
+            threshold = daily_avg.quantile(PEAK_QUANTILE)
+            # 연속 기간 그룹핑 (PEAK_GAP_DAYS일 갭까지 허용)
+            periods = peak_periods(daily_avg, threshold)
+            results[brand] = periods
+
+            if periods:
                 lines.append(f"\n  [{label}] 기준선: {threshold:.1f}")
-                for p in peak_periods:
+                for p in periods:
                     start_str = p["start"].strftime("%m/%d")
                     end_str = p["end"].strftime("%m/%d")
                     lines.append(
@@ -314,6 +253,50 @@ class TrendAnalyzer:
         lines.append("")
         return {"lines": lines, "results": results}
 
+    def _peak_history(self, df_trend: pd.DataFrame, rebuild: bool) -> list[str]:
+        """누적 이력 성수기: 저장된 스트리밍 상태에 마지막 처리일 이후 행만 반영"""
+        detector = PeakDetector()
+        if rebuild:
+            detector.reset()
+            df_trend = self.loader.load_frame("search_trends")
+        else:
+            window_start = df_trend["trend_date"].min()
+            stale = [
+                brand for brand in detector.brands
+                if detector.last_date(brand) < window_start - pd.Timedelta(days=1)
+            ]
+            if stale:
+                logger.warning(
+                    f"[성수기] 누적 상태 이후 분석 기간 밖 누락 구간 있음 ({', '.join(stale)}) "
+                    "- --peak-rebuild로 재구축 권장"
+                )
+
+        processed = detector.update(df_trend)
+        if processed:
+            detector.save()
+            logger.info(f"[성수기] 누적 상태 갱신: {sum(processed.values())}일 반영")
+
+        lines = ["📚 누적 성수기 (전체 이력 스트리밍 탐지)", "━" * 45]
+        for brand in sorted(detector.brands):
+            label = BRAND_LABELS.get(brand, brand)
+            info = detector.summary(brand)
+            lines.append(
+                f"  [{label}] {info['since']}~{info['last_date']} ({info['days']}일) "
+                f"기준선(추정) {info['threshold']:.1f} | 성수기 {len(info['periods'])}회"
+            )
+            if info["open"]:
+                p = info["open"]
+                lines.append(f"    진행 중: {p['start']}~ ({p['days']}일) 평균 트렌드 {p['avg_val']:.1f}")
+            elif info["periods"]:
+                p = info["periods"][-1]
+                lines.append(f"    최근: {p['start']}~{p['end']} ({p['days']}일) 평균 트렌드 {p['avg_val']:.1f}")
+
+        if not detector.brands:
+            lines.append("  누적 데이터 부족 (다음 실행부터 반영)")
+
+        lines.append("")
+        return lines
+
     def _generate_recommendations(self, corr: dict, lead: dict, peak: dict) -> list[str]:
         """분석 결과 기반 비즈니스 추천"""
         lines = [
@@ -368,10 +351,9 @@ class TrendAnalyzer:
 
     # ==================== 차트 4종 ====================
 
-    def _plot_trend_sales_overlay(self, df_trend: pd.DataFrame, df_sales: pd.DataFrame | None) -> None:
+    @staticmethod
+    def _plot_trend_sales_overlay(df_trend: pd.DataFrame, df_sales: pd.DataFrame | None) -> plt.Figure | None:
         """트렌드 vs 매출 듀얼축 라인차트 (1x3 브랜드별)"""
-        OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-
         brands = sorted(df_trend["brand"].unique())
         fig, axes = plt.subplots(1, len(brands), figsize=(6 * len(brands), 5))
         if len(brands) == 1:
@@ -407,19 +389,15 @@ class TrendAnalyzer:
 
         fig.suptitle("검색 트렌드 vs 매출 추이", fontsize=14, fontweight="bold", y=1.02)
         plt.tight_layout()
-        path = OUTPUT_DIR / "trend_sales_overlay.png"
-        fig.savefig(path, dpi=150, bbox_inches="tight")
-        plt.close(fig)
-        logger.info(f"[트렌드] 오버레이 차트 저장: {path}")
+        return fig
 
-    def _plot_correlation_heatmap(self, corr_results: dict) -> None:
+    @staticmethod
+    def _plot_correlation_heatmap(corr_results: dict) -> plt.Figure | None:
         """상관관계 히트맵: 브랜드 x 소스 Pearson r"""
-        OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-
         results = corr_results.get("results", {})
         if not results:
             logger.warning("[트렌드] 상관 데이터 없음 — 히트맵 건너뜀")
-            return
+            return None
 
         brands = sorted(set(b for b, _ in results.keys()))
         sources = sorted(set(s for _, s in results.keys()))
@@ -449,19 +427,15 @@ class TrendAnalyzer:
         fig.colorbar(im, ax=ax, label="Pearson r", shrink=0.8)
 
         plt.tight_layout()
-        path = OUTPUT_DIR / "trend_correlation_heatmap.png"
-        fig.savefig(path, dpi=150, bbox_inches="tight")
-        plt.close(fig)
-        logger.info(f"[트렌드] 상관 히트맵 저장: {path}")
+        return fig
 
-    def _plot_lead_lag(self, lead_results: dict) -> None:
+    @staticmethod
+    def _plot_lead_lag(lead_results: dict) -> plt.Figure | None:
         """선행 지표 바차트: lag별 상관계수"""
-        OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-
         results = lead_results.get("results", {})
         if not results:
             logger.warning("[트렌드] 선행 분석 데이터 없음 — 바차트 건너뜀")
-            return
+            return None
 
         brands = sorted(results.keys())
         fig, axes = plt.subplots(1, len(brands), figsize=(5 * len(brands), 4))
@@ -504,15 +478,11 @@ class TrendAnalyzer:
 
         fig.suptitle("선행 지표 분석 (Cross-Correlation)", fontsize=13, fontweight="bold", y=1.02)
         plt.tight_layout()
-        path = OUTPUT_DIR / "trend_lead_lag.png"
-        fig.savefig(path, dpi=150, bbox_inches="tight")
-        plt.close(fig)
-        logger.info(f"[트렌드] 선행 지표 차트 저장: {path}")
+        return fig
 
-    def _plot_peak_season(self, df_trend: pd.DataFrame, peak_results: dict) -> None:
+    @staticmethod
+    def _plot_peak_season(df_trend: pd.DataFrame, peak_results: dict) -> plt.Figure | None:
         """성수기 area chart + 피크 구간 강조"""
-        OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-
         brands = sorted(df_trend["brand"].unique())
         fig, axes = plt.subplots(len(brands), 1, figsize=(12, 4 * len(brands)), sharex=True)
         if len(brands) == 1:
@@ -551,7 +521,4 @@ class TrendAnalyzer:
 
         fig.suptitle("성수기 탐지 (트렌드 75th percentile 초과 구간)", fontsize=13, fontweight="bold", y=1.01)
         plt.tight_layout()
-        path = OUTPUT_DIR / "trend_peak_season.png"
-        fig.savefig(path, dpi=150, bbox_inches="tight")
-        plt.close(fig)
-        logger.info(f"[트렌드] 성수기 차트 저장: {path}")
+        return fig
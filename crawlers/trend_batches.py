@@ -0,0 +1,99 @@
+"""
+검색 트렌드 요청 묶음 계획 - 키워드 그룹을 API별 실제 한도까지 채워 요청 수를 줄인다
+- Naver DataLab: 요청당 키워드 그룹 5개, 그룹당 검색어 20개 (TREND_KEYWORDS의 동의어 목록을 한 그룹으로)
+- Google Trends: 요청당 검색어 5개 = 공통 앵커 1개 + 키워드 4개, 일별 해상도 최대 기간 단위로 분할
+요청 시작일이 비슷한 그룹끼리 묶어(시작일 정렬) 배치마다 불필요하게 긴 기간을 받지 않고,
+배치는 API 자격 증명에 순서대로 나눠 배정한다 (자격 증명별 일일 호출 한도 분산).
+"""
+
+from dataclasses import dataclass
+from datetime import date, timedelta
+
+from .config import TREND_ANCHOR_DAYS
+
+
+@dataclass(frozen=True)
+class KeywordGroup:
+    """수집 단위 - records/워터마크 키는 대표 검색어(keyword), DataLab 요청에는 검색어 목록 전체(terms)"""
+
+    brand: str
+    product_group: str
+    keyword: str
+    terms: tuple[str, ...]
+    start: date
+
+
+@dataclass
+class TrendBatch:
+    start: date
+    end: date
+    groups: list[KeywordGroup]
+    anchor: str | None = None
+    credential: int = 0
+    number: int = 0
+
+    @property
+    def keywords(self) -> list[str]:
+        """Trends 요청 검색어 (앵커 먼저, 중복 제외)"""
+        keywords = [self.anchor] if self.anchor else []
+        return keywords + [g.keyword for g in self.groups if g.keyword != self.anchor]
+
+
+def keyword_terms(value: str | list[str] | tuple[str, ...]) -> tuple[str, ...]:
+    """TREND_KEYWORDS 값(검색어 또는 [대표 검색어, 동의어...]) → 검색어 튜플 (대표 검색어 먼저)"""
+    return (value,) if isinstance(value, str) else tuple(value)
+
+
+def _windows(start: date, end: date, max_days: int | None) -> list[tuple[date, date]]:
+    """[start, end]를 max_days일 이하 구간으로 분할. 이어지는 구간은 앵커 일수만큼 겹쳐 척도를 맞출 수 있게 한다"""
+    if max_days is None or (end - start).days + 1 <= max_days:
+        return [(start, end)]
+    windows = []
+    window_start = start
+    while True:
+        window_end = min(end, window_start + timedelta(days=max_days - 1))
+        windows.append((window_start, window_end))
+        if window_end >= end:
+            return windows
+        window_start = window_end - timedelta(days=TREND_ANCHOR_DAYS)
+
+
+def plan_batches(
+    groups: list[KeywordGroup],
+    end: date,
+    per_request: int,
+    max_days: int | None = None,
+    credentials: int = 1,
+    anchor: str | None = None,
+) -> list[TrendBatch]:
+    """키워드 그룹 → 요청 배치 목록
+
+    Args:
+        per_request: 요청당 슬롯 수 (DataLab: 그룹 수, Trends: 검색어 수 - 앵커 포함)
+        max_days: 요청당 최대 기간(일). 넘으면 앵커 일수만큼 겹치는 구간으로 나눠 같은 묶음을 구간별로 요청
+        credentials: 자격 증명 수 (배치 순서대로 돌아가며 배정)
+        anchor: 모든 배치에 넣을 공통 검색어 (슬롯 1개 차지). 수집 대상이면 첫 배치에서 함께 수집
+    """
+    groups = sorted(groups, key=lambda g: g.start)
+    anchor_group = next((g for g in groups if anchor and g.keyword == anchor), None)
+    if anchor_group:
+        groups.remove(anchor_group)
+    slots = per_request - 1 if anchor else per_request
+    if slots < 1:
+        raise ValueError(f"요청당 슬롯({per_request})이 앵커를 넣기에 부족합니다")
+
+    chunks = [groups[i : i + slots] for i in range(0, len(groups), slots)]
+    if anchor_group:
+        if chunks:
+            chunks[0].insert(0, anchor_group)
+        else:
+            chunks = [[anchor_group]]
+
+    batches = []
+    for chunk in chunks:
+        for window_start, window_end in _windows(min(g.start for g in chunk), end, max_days):
+            batches.append(TrendBatch(window_start, window_end, chunk, anchor))
+    for number, batch in enumerate(batches, 1):
+        batch.number = number
+        batch.credential = (number - 1) % max(1, credentials)
+    return batches
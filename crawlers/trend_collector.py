@@ -1,29 +1,128 @@
 """
 검색 트렌드 수집 모듈 (Google Trends + Naver DataLab)
 외부 검색 트렌드 데이터를 수집하여 Supabase에 적재.
+두 소스는 서로 독립이라 각자의 속도 제한기로 동시에 수집하고, 배치 응답이 오는 대로 바로 적재한다.
 두 API 모두 실패해도 기존 샘플 데이터로 분석은 계속 가능.
 """
 
 import logging
 import os
+import statistics
+import threading
 import time
-from datetime import datetime, timedelta
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 
+import pandas as pd
 import requests
-
-from .config import TREND_KEYWORDS
+from requests.adapters import HTTPAdapter
+
+from .config import (
+    DATALAB_GROUPS_PER_REQUEST,
+    DATALAB_KEYWORDS_PER_GROUP,
+    TREND_KEYWORDS,
+    TRENDS_ANCHOR_KEYWORD,
+    TRENDS_KEYWORDS_PER_REQUEST,
+    TRENDS_MAX_DAYS,
+)
+from .rate_limiter import get_rate_limiter
 from .supabase_loader import SupabaseLoader
+from .trend_batches import KeywordGroup, TrendBatch, keyword_terms, plan_batches
+from .trend_watermarks import TrendWatermarks
 
 logger = logging.getLogger(__name__)
 
+RECORD_COLUMNS = ["trend_date", "brand", "product_group", "keyword", "source", "trend_value"]
+
+
+def interest_to_long(df: pd.DataFrame, keywords: list[str]) -> pd.DataFrame:
+    """interest_over_time() 넓은 프레임(날짜 index x 키워드 컬럼) → (trend_date, keyword, trend_value) 긴 형식
+
+    한 번의 melt + 벡터 날짜 포맷 (키워드/행별 iterrows·strftime 없음). isPartial 등 키워드 외 컬럼은 제외.
+    """
+    columns = [kw for kw in keywords if kw in df.columns]
+    long = (
+        df[columns]
+        .rename_axis("trend_date")
+        .reset_index()
+        .melt(id_vars="trend_date", var_name="keyword", value_name="trend_value")
+    )
+    long["trend_date"] = long["trend_date"].dt.strftime("%Y-%m-%d")
+    long["trend_value"] = long["trend_value"].astype(float)
+    return long
+
+
+def datalab_to_long(results: list[dict], group_keywords: dict[str, str]) -> pd.DataFrame:
+    """DataLab 응답 results → (trend_date, keyword, trend_value) 긴 형식. group_keywords: {groupName: keyword}"""
+    flat = pd.json_normalize(results, record_path="data", meta=["title"])
+    if flat.empty:
+        return pd.DataFrame(columns=["trend_date", "keyword", "trend_value"])
+    long = pd.DataFrame({
+        "trend_date": flat["period"],
+        "keyword": flat["title"].map(group_keywords),
+        "trend_value": flat["ratio"].astype(float),
+    })
+    return long.dropna(subset=["keyword"])
+
+
+def align_to_anchor(
+    long: pd.DataFrame, anchor: str | None, reference: dict[str, float]
+) -> tuple[pd.DataFrame, float]:
+    """Trends 배치 값을 공통 앵커 검색어 기준 척도로 맞춤. 반환: (보정한 값, 곱한 비율 = 보정 후 API 1단계 크기)
+
+    첫 배치의 앵커 값이 기준(reference에 채움)이 되고, 이후 배치는 겹치는 날짜의 앵커 비율(중앙값)을 곱한다.
+    """
+    if not anchor:
+        return long, 1.0
+    series = long.loc[long["keyword"] == anchor].set_index("trend_date")["trend_value"]
+    if not reference:
+        reference.update(series.to_dict())
+        return long, 1.0
+
+    ratios = [reference[d] / v for d, v in series.items() if v > 0 and reference.get(d, 0) > 0]
+    if not ratios:
+        logger.warning(f"[Google Trends] 앵커 '{anchor}' 겹치는 값 없음 → 배치 척도 보정 생략")
+        return long, 1.0
+    factor = statistics.median(ratios)
+    for d, v in series.items():
+        reference.setdefault(d, v * factor)
+    return long.assign(trend_value=(long["trend_value"] * factor).round(2)), factor
+
+
+def datalab_credentials() -> list[tuple[str, str]]:
+    """DataLab 자격 증명 목록 - NAVER_DATALAB_CLIENT_ID/SECRET + NAVER_DATALAB_CREDENTIALS("id:secret,id:secret")"""
+    credentials = [(os.getenv("NAVER_DATALAB_CLIENT_ID", ""), os.getenv("NAVER_DATALAB_CLIENT_SECRET", ""))]
+    for pair in os.getenv("NAVER_DATALAB_CREDENTIALS", "").split(","):
+        client_id, _, secret = pair.strip().partition(":")
+        credentials.append((client_id, secret))
+    return list(dict.fromkeys((i, s) for i, s in credentials if i and s))
+
 
 class TrendCollector:
     """Google Trends + Naver DataLab 검색 트렌드 수집기"""
 
-    def __init__(self):
+    def __init__(self, full: bool = False):
+        """
+        Args:
+            full: 워터마크 무시하고 최근 30일 전체 재수집 (기본: 마지막 수집일 이후 + 앵커 구간만 요청)
+        """
         self.loader = SupabaseLoader()
-        self.naver_client_id = os.getenv("NAVER_DATALAB_CLIENT_ID", "")
-        self.naver_client_secret = os.getenv("NAVER_DATALAB_CLIENT_SECRET", "")
+        self.watermarks = TrendWatermarks(full=full)
+        self.google_limiter = get_rate_limiter("google_trends")
+        self.naver_limiter = get_rate_limiter("naver_datalab")
+
+        # DataLab 자격 증명별 세션 (배치 요청 간 연결 재사용, 배치는 자격 증명에 돌아가며 배정)
+        self.naver_sessions = []
+        for client_id, client_secret in datalab_credentials():
+            session = requests.Session()
+            session.mount("https://", HTTPAdapter(pool_maxsize=1))
+            session.headers.update({
+                "X-Naver-Client-Id": client_id,
+                "X-Naver-Client-Secret": client_secret,
+                "Content-Type": "application/json",
+            })
+            self.naver_sessions.append(session)
 
     def run(self) -> str:
         """전체 트렌드 수집 파이프라인"""
@@ -33,22 +132,40 @@ class TrendCollector:
             "",
         ]
 
-        all_records = []
-
-        # 1. Google Trends 수집
-        google_records = self._collect_google_trends()
-        all_records.extend(google_records)
-        lines.append(f"  Google Trends: {len(google_records)}건 수집")
-
-        # 2. Naver DataLab 수집
-        naver_records = self._collect_naver_datalab()
-        all_records.extend(naver_records)
-        lines.append(f"  Naver DataLab: {len(naver_records)}건 수집")
-
-        # 3. Supabase 적재
-        if all_records:
-            stats = self.loader.upsert_trends(all_records)
+        stats = {"success": 0, "failed": 0}
+        stats_lock = threading.Lock()
+
+        def upsert(records: pd.DataFrame) -> None:
+            result = self.loader.upsert_trends(records)
+            with stats_lock:
+                stats["success"] += result["success"]
+                stats["failed"] += result["failed"]
+
+        # 1. Google Trends + Naver DataLab 동시 수집
+        # 2. 배치 응답마다 Supabase 적재 (적재 스레드 1개 - 수집은 적재를 기다리지 않음)
+        uploads = []
+        with ThreadPoolExecutor(max_workers=1) as upload_pool:
+            def emit(records: pd.DataFrame) -> None:
+                uploads.append(upload_pool.submit(upsert, records))
+
+            with ThreadPoolExecutor(max_workers=2) as source_pool:
+                google = source_pool.submit(self._collect_google_trends, emit)
+                naver = source_pool.submit(self._collect_naver_datalab, emit)
+                google_count, naver_count = google.result(), naver.result()
+        for upload in uploads:
+            upload.result()
+
+        lines.append(f"  Google Trends: {google_count}건 수집")
+        lines.append(f"  Naver DataLab: {naver_count}건 수집")
+
+        # 3. 적재 결과 (전부 성공해야 워터마크 갱신 → 실패분은 다음 실행에서 다시 요청)
+        if google_count or naver_count:
             lines.append(f"\n  적재 결과: 성공 {stats['success']}건 / 실패 {stats['failed']}건")
+            if stats["failed"] == 0:
+                self.watermarks.save()
+        elif self._all_up_to_date():
+            lines.append("\n  모든 키워드가 오늘까지 수집되어 있습니다 (새 데이터 없음).")
+            self.watermarks.save()
         else:
             lines.append("\n  수집된 데이터가 없습니다. API 키를 확인해주세요.")
             lines.append("  (샘플 데이터로 --trend 분석은 가능합니다)")
@@ -56,142 +173,168 @@ class TrendCollector:
         lines.append("")
         return "\n".join(lines)
 
-    def _collect_google_trends(self) -> list[dict]:
-        """Google Trends 데이터 수집 (pytrends)"""
+    def _pending_groups(self, source: str, today) -> list[KeywordGroup]:
+        """수집할 키워드 그룹 (대표 검색어 기준 요청 시작일 포함) - 오늘까지 수집된 키워드는 제외"""
+        pending = []
+        for brand, groups in TREND_KEYWORDS.items():
+            for product_group, value in groups.items():
+                terms = keyword_terms(value)
+                start = self.watermarks.start_date(source, terms[0], today)
+                if start is None:
+                    continue
+                if len(terms) > DATALAB_KEYWORDS_PER_GROUP and source == "naver_datalab":
+                    logger.warning(
+                        f"[Naver DataLab] {product_group}: 검색어 {len(terms)}개 중 "
+                        f"앞 {DATALAB_KEYWORDS_PER_GROUP}개만 요청"
+                    )
+                    terms = terms[:DATALAB_KEYWORDS_PER_GROUP]
+                pending.append(KeywordGroup(brand, product_group, terms[0], terms, start))
+        skipped = sum(len(groups) for groups in TREND_KEYWORDS.values()) - len(pending)
+        if skipped:
+            logger.info(f"[트렌드 수집] {source}: 오늘까지 수집된 키워드 {skipped}개 건너뜀")
+        return pending
+
+    def _changed_records(
+        self, source: str, long: pd.DataFrame, batch: TrendBatch, step: float = 1.0
+    ) -> pd.DataFrame:
+        """긴 형식 응답을 키워드별 워터마크 척도로 맞추고 적재할 행(새 날짜 + 값이 바뀐 날짜)만 레코드 컬럼으로 반환
+
+        step: long 값의 최소 단위 (API 정수 지수 = 1, 앵커 보정한 Trends 배치는 보정 비율)
+        배치 수집 대상(batch.groups)이 아닌 검색어(척도 보정용으로만 넣은 앵커)는 적재하지 않으므로 워터마크도 갱신하지 않는다.
+        """
+        collected = {g.keyword for g in batch.groups}
+        parts = []
+        for keyword, group in long.loc[long["keyword"].isin(collected)].groupby("keyword", sort=False):
+            points = dict(zip(group["trend_date"], group["trend_value"]))
+            changed = self.watermarks.merge(source, keyword, points, step=step)
+            if changed:
+                parts.append(pd.DataFrame({
+                    "keyword": keyword,
+                    "trend_date": list(changed),
+                    "trend_value": list(changed.values()),
+                }))
+        if not parts:
+            return pd.DataFrame(columns=RECORD_COLUMNS)
+
+        meta = pd.DataFrame(
+            [(g.brand, g.product_group, g.keyword) for g in batch.groups], columns=["brand", "product_group", "keyword"]
+        )
+        frame = pd.concat(parts, ignore_index=True).merge(meta, on="keyword").assign(source=source)
+        return frame[RECORD_COLUMNS]
+
+    def _all_up_to_date(self) -> bool:
+        today = datetime.now().date()
+        return not any(self._pending_groups(source, today) for source in ("google_trends", "naver_datalab"))
+
+    def _collect_google_trends(self, emit: Callable[[pd.DataFrame], None]) -> int:
+        """Google Trends 데이터 수집 (pytrends). 배치별 레코드를 emit으로 넘기고 총 건수 반환"""
         try:
             from pytrends.request import TrendReq
         except ImportError:
             logger.warning("[Google Trends] pytrends 미설치. pip install pytrends")
-            return []
+            return 0
 
-        records = []
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=30)
-        timeframe = f"{start_date.strftime('%Y-%m-%d')} {end_date.strftime('%Y-%m-%d')}"
+        total = 0
+        end_date = datetime.now().date()
 
         try:
             pytrends = TrendReq(hl="ko", tz=540)
         except Exception as e:
             logger.error(f"[Google Trends] 초기화 실패: {e}")
-            return []
-
-        # 브랜드별 키워드를 5개씩 배치 처리
-        all_keywords = []
-        for brand, groups in TREND_KEYWORDS.items():
-            for product_group, keyword in groups.items():
-                all_keywords.append((brand, product_group, keyword))
-
-        for i in range(0, len(all_keywords), 5):
-            batch = all_keywords[i : i + 5]
-            keywords = [kw for _, _, kw in batch]
-
+            return 0
+
+        # 공통 앵커 + 키워드 4개씩 묶고, 일별 해상도 기간을 넘으면 구간 분할 (오늘까지 수집된 키워드 제외)
+        batches = plan_batches(
+            self._pending_groups("google_trends", end_date),
+            end_date,
+            per_request=TRENDS_KEYWORDS_PER_REQUEST,
+            max_days=TRENDS_MAX_DAYS,
+            anchor=TRENDS_ANCHOR_KEYWORD,
+        )
+        anchor_reference: dict[str, float] = {}
+
+        for batch in batches:
+            timeframe = f"{batch.start.isoformat()} {batch.end.isoformat()}"
+
+            self.google_limiter.acquire()
+            started = time.monotonic()
             try:
-                pytrends.build_payload(keywords, cat=0, timeframe=timeframe, geo="KR")
+                pytrends.build_payload(batch.keywords, cat=0, timeframe=timeframe, geo="KR")
                 df = pytrends.interest_over_time()
-
-                if df.empty:
-                    logger.warning(f"[Google Trends] 배치 {i // 5 + 1}: 데이터 없음")
-                    continue
-
-                for brand, product_group, keyword in batch:
-                    if keyword not in df.columns:
-                        continue
-
-                    for date_idx, row in df.iterrows():
-                        records.append({
-                            "trend_date": date_idx.strftime("%Y-%m-%d"),
-                            "brand": brand,
-                            "product_group": product_group,
-                            "keyword": keyword,
-                            "source": "google_trends",
-                            "trend_value": float(row[keyword]),
-                        })
-
-                logger.info(f"[Google Trends] 배치 {i // 5 + 1}: {len(batch)}개 키워드 수집 완료")
-
             except Exception as e:
-                logger.warning(f"[Google Trends] 배치 {i // 5 + 1} 실패 (graceful skip): {e}")
-
-            # rate limiting
-            if i + 5 < len(all_keywords):
-                time.sleep(2)
-
-        logger.info(f"[Google Trends] 총 {len(records)}건 수집")
-        return records
-
-    def _collect_naver_datalab(self) -> list[dict]:
-        """Naver DataLab 검색어 트렌드 수집"""
-        if not self.naver_client_id or not self.naver_client_secret:
+                # pytrends ResponseError/TooManyRequestsError는 원본 response를 보존
+                response = getattr(e, "response", None)
+                if response is not None:
+                    self.google_limiter.record_response(response)
+                else:
+                    self.google_limiter.record_error()
+                logger.warning(f"[Google Trends] 배치 {batch.number} 실패 (graceful skip): {e}")
+                continue
+            self.google_limiter.record(200, time.monotonic() - started)
+
+            if df.empty:
+                logger.warning(f"[Google Trends] 배치 {batch.number}: 데이터 없음")
+                continue
+
+            long, step = align_to_anchor(interest_to_long(df, batch.keywords), batch.anchor, anchor_reference)
+            records = self._changed_records("google_trends", long, batch, step=step)
+            if not records.empty:
+                emit(records)
+                total += len(records)
+            logger.info(f"[Google Trends] 배치 {batch.number}/{len(batches)}: {len(batch.groups)}개 키워드 수집 완료")
+
+        logger.info(f"[Google Trends] 총 {total}건 수집")
+        return total
+
+    def _collect_naver_datalab(self, emit: Callable[[pd.DataFrame], None]) -> int:
+        """Naver DataLab 검색어 트렌드 수집. 배치별 레코드를 emit으로 넘기고 총 건수 반환"""
+        if not self.naver_sessions:
             logger.warning("[Naver DataLab] NAVER_DATALAB_CLIENT_ID/SECRET 미설정")
-            return []
+            return 0
 
-        records = []
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=30)
+        total = 0
+        end_date = datetime.now().date()
 
         url = "https://openapi.naver.com/v1/datalab/search"
-        headers = {
-            "X-Naver-Client-Id": self.naver_client_id,
-            "X-Naver-Client-Secret": self.naver_client_secret,
-            "Content-Type": "application/json",
-        }
-
-        # 키워드를 5개씩 배치 (API 제한)
-        all_keywords = []
-        for brand, groups in TREND_KEYWORDS.items():
-            for product_group, keyword in groups.items():
-                all_keywords.append((brand, product_group, keyword))
 
-        for i in range(0, len(all_keywords), 5):
-            batch = all_keywords[i : i + 5]
+        # 요청당 키워드 그룹 5개, 그룹 = 제품군 검색어 목록 (오늘까지 수집된 키워드 제외)
+        batches = plan_batches(
+            self._pending_groups("naver_datalab", end_date),
+            end_date,
+            per_request=DATALAB_GROUPS_PER_REQUEST,
+            credentials=len(self.naver_sessions),
+        )
 
-            keyword_groups = []
-            for _, product_group, keyword in batch:
-                keyword_groups.append({
-                    "groupName": product_group,
-                    "keywords": [keyword],
-                })
+        for batch in batches:
+            keyword_groups = [{"groupName": g.product_group, "keywords": list(g.terms)} for g in batch.groups]
 
             body = {
-                "startDate": start_date.strftime("%Y-%m-%d"),
-                "endDate": end_date.strftime("%Y-%m-%d"),
+                "startDate": batch.start.isoformat(),
+                "endDate": batch.end.isoformat(),
                 "timeUnit": "date",
                 "keywordGroups": keyword_groups,
             }
 
+            self.naver_limiter.acquire()
             try:
-                response = requests.post(url, headers=headers, json=body, timeout=15)
+                response = self.naver_sessions[batch.credential].post(url, json=body, timeout=15)
+                self.naver_limiter.record_response(response)
                 response.raise_for_status()
                 data = response.json()
 
-                for result in data.get("results", []):
-                    group_name = result.get("title", "")
-
-                    # group_name으로 brand 매칭
-                    matched = [(b, pg, kw) for b, pg, kw in batch if pg == group_name]
-                    if not matched:
-                        continue
-
-                    brand, product_group, keyword = matched[0]
-
-                    for point in result.get("data", []):
-                        records.append({
-                            "trend_date": point["period"],
-                            "brand": brand,
-                            "product_group": product_group,
-                            "keyword": keyword,
-                            "source": "naver_datalab",
-                            "trend_value": float(point["ratio"]),
-                        })
-
-                logger.info(f"[Naver DataLab] 배치 {i // 5 + 1}: {len(batch)}개 키워드 수집 완료")
+                # groupName(제품군)으로 키워드 매칭
+                group_keywords = {g.product_group: g.keyword for g in batch.groups}
+                long = datalab_to_long(data.get("results", []), group_keywords)
+                records = self._changed_records("naver_datalab", long, batch)
+                if not records.empty:
+                    emit(records)
+                    total += len(records)
+                logger.info(f"[Naver DataLab] 배치 {batch.number}/{len(batches)}: {len(batch.groups)}개 그룹 수집 완료")
 
             except requests.RequestException as e:
-                logger.warning(f"[Naver DataLab] 배치 {i // 5 + 1} 실패 (graceful skip): {e}")
-
-            # rate limiting
-            if i + 5 < len(all_keywords):
-                time.sleep(1)
+                if e.response is None:
+                    self.naver_limiter.record_error()
+                logger.warning(f"[Naver DataLab] 배치 {batch.number} 실패 (graceful skip): {e}")
 
-        logger.info(f"[Naver DataLab] 총 {len(records)}건 수집")
-        return records
+        logger.info(f"[Naver DataLab] 총 {total}건 수집")
+        return total
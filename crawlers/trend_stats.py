@@ -0,0 +1,195 @@
+"""
+트렌드-매출 통계 엔진 - TrendAnalyzer / DashboardGenerator 공용
+시계열을 (날짜 x 키) 밀집 일별 행렬로 한 번 정렬한 뒤 모든 키의 통계를 배치로 계산한다.
+- 동시 상관: 열별 Pearson/Spearman + p-value (Spearman은 마스킹 후 한 번에 순위 변환)
+- 선행 분석: 모든 키·모든 lag의 Pearson r을 배치 FFT 교차상관으로 한 번에 계산
+빠진 날짜는 마스크로 처리(쌍별 완전 관측만 사용).
+"""
+
+import numpy as np
+import pandas as pd
+from scipy import fft, stats
+
+from .config import LEAD_LAG_MAX_DAYS
+
+MIN_OVERLAP = 3  # 상관계수 계산 최소 겹침 일수
+MIN_SERIES_DAYS = 5  # 선행 분석 대상 최소 관측 일수
+
+
+def daily_grid(df: pd.DataFrame, date_column: str, by: str | list[str], value_column: str, agg: str) -> pd.DataFrame:
+    """긴 형식 → (일별 DatetimeIndex x 키) 넓은 행렬. 관측 없는 날짜/키는 NaN"""
+    if df.empty:
+        return pd.DataFrame()
+    wide = df.pivot_table(index=date_column, columns=by, values=value_column, aggfunc=agg)
+    if wide.empty:
+        return wide
+    return wide.reindex(pd.date_range(wide.index.min(), wide.index.max(), freq="D"))
+
+
+def _align(x: pd.DataFrame, y: pd.DataFrame) -> tuple[np.ndarray, np.ndarray, pd.Index]:
+    """공통 키만 남기고 두 행렬을 같은 일별 구간으로 맞춰 (키 x 날짜) 배열로 반환"""
+    keys = x.columns.intersection(y.columns, sort=False)
+    index = pd.date_range(min(x.index.min(), y.index.min()), max(x.index.max(), y.index.max()), freq="D")
+    xs = x[keys].reindex(index).to_numpy(dtype=float).T
+    ys = y[keys].reindex(index).to_numpy(dtype=float).T
+    return xs, ys, keys
+
+
+def _standardize(values: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """행별 표준화 후 (0 채운 값, 관측 마스크) - 상관계수는 불변, FFT 합의 수치 오차는 줄어든다"""
+    mask = ~np.isnan(values)
+    count = np.maximum(mask.sum(axis=-1, keepdims=True), 1)
+    mean = np.nansum(values, axis=-1, keepdims=True) / count
+    centered = np.where(mask, values - mean, 0.0)
+    scale = np.sqrt((centered**2).sum(axis=-1, keepdims=True) / count)
+    scale[scale == 0] = 1.0
+    return centered / scale, mask.astype(float)
+
+
+def _xcorr(a: np.ndarray, b: np.ndarray, lags: np.ndarray) -> np.ndarray:
+    """c[..., L] = Σ_i a[..., i] * b[..., i + L] (lags 순서, 행별 배치 FFT)"""
+    n = a.shape[-1]
+    size = fft.next_fast_len(n + max(n, int(np.abs(lags).max()) + 1))
+    full = fft.irfft(np.conj(fft.rfft(a, size)) * fft.rfft(b, size), size)
+    return full[..., lags % size]
+
+
+def pearson_p_values(r: np.ndarray, n: np.ndarray) -> np.ndarray:
+    """Pearson r의 양측 검정 p-value (scipy.stats.pearsonr와 동일한 t 분포 근사)"""
+    dof = np.asarray(n, dtype=float) - 2
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = r * np.sqrt(dof / np.maximum(1 - r**2, 0))
+        p = 2 * stats.t.sf(np.abs(t), dof)
+    return np.where(np.abs(r) >= 1, 0.0, p)
+
+
+def _masked_pearson(x: np.ndarray, y: np.ndarray, min_periods: int) -> tuple[np.ndarray, np.ndarray]:
+    """열별 Pearson r과 관측 수 (x, y는 같은 위치가 함께 NaN이도록 마스킹된 상태)"""
+    n = (~np.isnan(x)).sum(axis=0)
+    # np.nanmean은 전부 NaN인 열에서 RuntimeWarning → 합계 / 관측 수로 직접 계산
+    count = np.maximum(n, 1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        dx = x - np.nansum(x, axis=0) / count
+        dy = y - np.nansum(y, axis=0) / count
+        var_x = np.nansum(dx**2, axis=0)
+        var_y = np.nansum(dy**2, axis=0)
+        r = np.clip(np.nansum(dx * dy, axis=0) / np.sqrt(var_x * var_y), -1.0, 1.0)
+    return np.where((n < min_periods) | (var_x == 0) | (var_y == 0), np.nan, r), n
+
+
+def paired_correlation(x: pd.DataFrame, y: pd.DataFrame, min_periods: int = MIN_OVERLAP) -> pd.DataFrame:
+    """같은 모양(같은 일별 index, 열 순서 대응)인 x, y의 열별 Pearson/Spearman 상관
+
+    반환: index=x.columns, columns=[pearson_r, pearson_p, spearman_r, spearman_p, n]
+    겹침 부족/분산 0인 열은 r, p가 NaN.
+    """
+    xv = x.to_numpy(dtype=float)
+    yv = y.to_numpy(dtype=float)
+    both = ~np.isnan(xv) & ~np.isnan(yv)
+    xm = np.where(both, xv, np.nan)
+    ym = np.where(both, yv, np.nan)
+
+    pearson_r, n = _masked_pearson(xm, ym, min_periods)
+    # Spearman = 순위(평균 순위, NaN 제외)의 Pearson
+    spearman_r, _ = _masked_pearson(
+        pd.DataFrame(xm).rank().to_numpy(), pd.DataFrame(ym).rank().to_numpy(), min_periods
+    )
+    return pd.DataFrame(
+        {
+            "pearson_r": pearson_r,
+            "pearson_p": pearson_p_values(pearson_r, n),
+            "spearman_r": spearman_r,
+            "spearman_p": pearson_p_values(spearman_r, n),
+            "n": n,
+        },
+        index=x.columns,
+    )
+
+
+def trend_sales_correlation(
+    df_trend: pd.DataFrame, df_sales: pd.DataFrame, min_periods: int = MIN_OVERLAP
+) -> pd.DataFrame:
+    """(브랜드, 소스)별 검색 트렌드(일 평균) vs 브랜드 매출(일 합계) 동시 상관
+
+    트렌드/매출을 넓은 행렬로 한 번씩만 피벗하고, 매출 열을 트렌드 열의 브랜드에 맞춰 복제해 한 번에 계산.
+    반환: MultiIndex(brand, source) 정렬 순, 겹침 부족 쌍은 제외. 컬럼은 paired_correlation과 동일
+    """
+    sales = daily_grid(df_sales, "sale_date", "brand", "revenue", "sum")
+    trend = daily_grid(df_trend, "trend_date", ["brand", "source"], "trend_value", "mean")
+    if sales.empty or trend.empty:
+        return pd.DataFrame(columns=["pearson_r", "pearson_p", "spearman_r", "spearman_p", "n"])
+
+    index = trend.index.union(sales.index)
+    trend = trend.reindex(index)
+    sales = sales.reindex(index=index, columns=trend.columns.get_level_values("brand"))
+    sales.columns = trend.columns
+
+    result = paired_correlation(trend, sales, min_periods)
+    return result[result["n"] >= min_periods].sort_index()
+
+
+def lagged_correlation(
+    x: pd.DataFrame, y: pd.DataFrame, max_lag: int = LEAD_LAG_MAX_DAYS, min_periods: int = MIN_OVERLAP
+) -> dict[str, pd.DataFrame]:
+    """키별 x(t - lag)와 y(t)의 Pearson 교차상관 (lag > 0: x가 y보다 lag일 선행)
+
+    x, y는 daily_grid 형식. 반환: {"r", "p", "n"} 각각 (lag x 키) DataFrame, 겹침 부족/분산 0은 NaN
+    """
+    lags = np.arange(-max_lag, max_lag + 1)
+    xs, ys, keys = _align(x, y)
+    x0, mx = _standardize(xs)
+    y0, my = _standardize(ys)
+
+    n = np.rint(_xcorr(mx, my, lags))
+    sx = _xcorr(x0, my, lags)
+    sy = _xcorr(mx, y0, lags)
+    sxx = _xcorr(x0**2, my, lags)
+    syy = _xcorr(mx, y0**2, lags)
+    sxy = _xcorr(x0, y0, lags)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cov = sxy - sx * sy / n
+        var_x = sxx - sx**2 / n
+        var_y = syy - sy**2 / n
+        r = np.clip(cov / np.sqrt(var_x * var_y), -1.0, 1.0)
+    degenerate = (n < min_periods) | (var_x <= 1e-9 * n) | (var_y <= 1e-9 * n)
+    r = np.where(degenerate, np.nan, r)
+    p = np.where(degenerate, np.nan, pearson_p_values(r, n))
+
+    def frame(values):
+        return pd.DataFrame(values.T, index=pd.Index(lags, name="lag"), columns=keys)
+
+    return {"r": frame(r), "p": frame(p), "n": frame(n.astype(int))}
+
+
+def lead_lag_by_brand(
+    df_trend: pd.DataFrame, df_sales: pd.DataFrame, max_lag: int = LEAD_LAG_MAX_DAYS
+) -> dict[str, dict]:
+    """브랜드별 검색 트렌드(소스 평균) → 매출(채널 합) 선행 분석
+
+    반환: {brand: {"best_lag", "best_corr", "best_p", "lags": {lag: r}, "p_values": {lag: p}}}
+    best_lag는 |r|이 가장 큰 lag (lag > 0: 검색이 매출보다 선행).
+    """
+    sales = daily_grid(df_sales, "sale_date", "brand", "revenue", "sum")
+    trend = daily_grid(df_trend, "trend_date", "brand", "trend_value", "mean")
+    if sales.empty or trend.empty:
+        return {}
+
+    corr = lagged_correlation(trend, sales, max_lag)
+    results = {}
+    for brand in sorted(corr["r"].columns):
+        if sales[brand].count() < MIN_SERIES_DAYS or trend[brand].count() < MIN_SERIES_DAYS:
+            continue
+        r = corr["r"][brand].dropna()
+        if r.empty:
+            continue
+        best_lag = int(r.abs().idxmax())
+        p = corr["p"][brand]
+        results[brand] = {
+            "best_lag": best_lag,
+            "best_corr": float(r[best_lag]),
+            "best_p": float(p[best_lag]),
+            "lags": {int(lag): float(v) for lag, v in r.items()},
+            "p_values": {int(lag): float(p[lag]) for lag in r.index},
+        }
+    return results
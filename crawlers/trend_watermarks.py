@@ -0,0 +1,96 @@
+"""
+검색 트렌드 증분 수집 워터마크 - (소스, 키워드)별 마지막 수집일 + 최근 값 보관
+Google Trends / Naver DataLab 값은 요청 기간 안의 최대값 기준(0~100) 상대 지수라, 짧은 기간만 다시 받으면
+척도가 달라진다. 직전 수집 구간과 겹치는 앵커 구간(TREND_ANCHOR_DAYS일)을 함께 요청해
+겹친 날짜의 비율(중앙값)로 새 값을 기존 척도에 맞춘 뒤, 새 날짜와 값이 바뀐 날짜만 적재한다.
+"""
+
+import json
+import logging
+import os
+import statistics
+from datetime import date, timedelta
+from pathlib import Path
+
+from .config import (
+    TREND_ANCHOR_DAYS,
+    TREND_CHANGE_TOLERANCE,
+    TREND_LOOKBACK_DAYS,
+    TREND_WATERMARK_PATH,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class TrendWatermarks:
+    """{"source|keyword": {"last_date": "YYYY-MM-DD", "recent": {"YYYY-MM-DD": value}}} JSON 상태"""
+
+    def __init__(self, path: Path | str = TREND_WATERMARK_PATH, full: bool = False):
+        """
+        Args:
+            full: 저장된 워터마크 무시 (최근 TREND_LOOKBACK_DAYS일 전체 재수집, 받은 값을 새 기준 척도로 저장)
+        """
+        self.path = Path(path)
+        self.state: dict[str, dict] = {}
+        if not full:
+            try:
+                self.state = json.loads(self.path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                pass
+
+    @staticmethod
+    def _key(source: str, keyword: str) -> str:
+        return f"{source}|{keyword}"
+
+    def start_date(self, source: str, keyword: str, today: date) -> date | None:
+        """요청 시작일 (앵커 구간 포함). 오늘까지 이미 수집했으면 None"""
+        entry = self.state.get(self._key(source, keyword))
+        if entry is None:
+            return today - timedelta(days=TREND_LOOKBACK_DAYS)
+        last = date.fromisoformat(entry["last_date"])
+        if last >= today:
+            return None
+        return last - timedelta(days=TREND_ANCHOR_DAYS)
+
+    def merge(self, source: str, keyword: str, points: dict[str, float], step: float = 1.0) -> dict[str, float]:
+        """API 응답 {날짜: 값}을 기존 척도로 맞추고 적재할 점(새 날짜 + 값이 바뀐 날짜)만 반환
+
+        step: points 값의 최소 단위 (API 정수 지수 = 1). 재조회한 날의 값은 척도 보정 후
+        step x 보정 비율만큼 반올림 차이가 나므로, 그 이하 차이는 변경으로 보지 않는다.
+        """
+        if not points:
+            return {}
+        key = self._key(source, keyword)
+        entry = self.state.get(key)
+        if entry is None:
+            changed = dict(points)
+            last_date = max(points)
+            recent = {}
+        else:
+            recent = entry["recent"]
+            ratios = [recent[d] / v for d, v in points.items() if v > 0 and recent.get(d, 0) > 0]
+            if ratios:
+                factor = statistics.median(ratios)
+            else:
+                factor = 1.0
+                logger.warning(f"[트렌드 수집] {keyword} ({source}): 앵커 구간 값 없음 → 척도 보정 생략")
+            scaled = {d: round(v * factor, 2) for d, v in points.items()}
+            last_date = entry["last_date"]
+            # 허용 차이 = max(설정값, API 1단계) + 소수 2자리 반올림 여유
+            tolerance = max(TREND_CHANGE_TOLERANCE, step * factor) + 0.01
+            changed = {
+                d: v for d, v in scaled.items()
+                if d > last_date or (d in recent and abs(v - recent[d]) > tolerance)
+            }
+            last_date = max(last_date, max(points))
+
+        recent = {**recent, **changed}
+        keep = sorted(recent)[-(TREND_ANCHOR_DAYS + 1):]
+        self.state[key] = {"last_date": last_date, "recent": {d: recent[d] for d in keep}}
+        return changed
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(self.state, ensure_ascii=False, indent=2), encoding="utf-8")
+        os.replace(tmp, self.path)
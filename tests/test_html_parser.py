@@ -0,0 +1,51 @@
+"""
+쿠팡 검색 결과 파서 골든 파일 테스트 - 저장된 HTML(tests/fixtures/coupang/*.html)을
+lxml / bs4 두 백엔드로 파싱해 기대 결과(*.json) 및 서로와 같은지 확인
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from crawlers.coupang_crawler import CoupangCrawler
+from crawlers.html_parser import BACKENDS, etree
+
+FIXTURES = Path(__file__).parent / "fixtures" / "coupang"
+PAGES = sorted(p.stem for p in FIXTURES.glob("*.html"))
+LIMITS = [1, 3, 10, 100]
+
+requires_lxml = pytest.mark.skipif(etree is None, reason="lxml 미설치")
+
+
+def _load(page: str) -> tuple[str, list[dict]]:
+    html = (FIXTURES / f"{page}.html").read_text(encoding="utf-8")
+    expected = json.loads((FIXTURES / f"{page}.json").read_text(encoding="utf-8"))
+    return html, expected
+
+
+@pytest.mark.parametrize("backend", ["bs4", pytest.param("lxml", marks=requires_lxml)])
+@pytest.mark.parametrize("limit", LIMITS)
+@pytest.mark.parametrize("page", PAGES)
+def test_backend_matches_golden(page, limit, backend):
+    html, expected = _load(page)
+    assert BACKENDS[backend](html, limit) == expected[:limit]
+
+
+@requires_lxml
+@pytest.mark.parametrize("page", PAGES)
+def test_backends_give_identical_records(page):
+    html, _ = _load(page)
+    records = {
+        backend: CoupangCrawler(parser_backend=backend, use_cache=False)._parse_results(html, "테스트", limit=100)
+        for backend in ("lxml", "bs4")
+    }
+    assert records["lxml"] == records["bs4"]
+    assert records["lxml"]
+
+
+@requires_lxml
+def test_script_and_style_templates_are_not_products():
+    html, _ = _load("search_script_template")
+    names = [item["name"] for item in BACKENDS["lxml"](html, 100)]
+    assert names == ["A", "B"]
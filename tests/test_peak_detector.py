@@ -0,0 +1,42 @@
+"""
+P² 스트리밍 분위수 추정 테스트 - 관측 5개 이하는 정확한 분위수, 긴 스트림은 np.quantile 근사
+"""
+
+import numpy as np
+import pytest
+
+from crawlers.peak_detector import P2Quantile
+
+
+def _feed(p: float, values) -> P2Quantile:
+    sketch = P2Quantile(p)
+    for x in values:
+        sketch.add(float(x))
+    return sketch
+
+
+@pytest.mark.parametrize("n", [1, 2, 3, 4, 5])
+def test_exact_quantile_up_to_five_observations(n):
+    values = [1, 2, 3, 4, 100][:n]
+    assert _feed(0.9, values).value() == pytest.approx(np.quantile(values, 0.9))
+
+
+def test_five_observations_is_not_the_median():
+    assert _feed(0.9, [1, 2, 3, 4, 100]).value() == pytest.approx(61.6)
+
+
+@pytest.mark.parametrize("p", [0.5, 0.75, 0.9])
+def test_long_stream_tracks_numpy_quantile(p):
+    values = np.random.default_rng(7).gamma(2.0, 10.0, size=20_000)
+    expected = np.quantile(values, p)
+    assert _feed(p, values).value() == pytest.approx(expected, rel=0.02)
+
+
+def test_state_round_trip_keeps_estimate():
+    values = np.random.default_rng(3).normal(50, 10, size=500)
+    sketch = _feed(0.9, values[:300])
+    restored = P2Quantile.from_dict(0.9, sketch.to_dict())
+    for x in values[300:]:
+        sketch.add(float(x))
+        restored.add(float(x))
+    assert restored.value() == sketch.value()